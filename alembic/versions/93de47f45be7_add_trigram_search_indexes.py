@@ -0,0 +1,63 @@
+"""add trigram search indexes
+
+Revision ID: 93de47f45be7
+Revises: f7712e5e2ff4
+Create Date: 2026-10-17 09:12:03.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "93de47f45be7"
+down_revision: Union[str, None] = "f7712e5e2ff4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = {
+    "ix_unsubscribed_emails_sender_name_trgm": "sender_name",
+    "ix_unsubscribed_emails_sender_email_trgm": "sender_email",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm GIN indexes let ILIKE '%term%' searches use an index instead of
+    # a sequential scan. Other backends keep the plain ILIKE scan.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Build the indexes without blocking writes on large tables
+    with op.get_context().autocommit_block():
+        for index_name, column in TRIGRAM_INDEXES.items():
+            op.create_index(
+                index_name,
+                "unsubscribed_emails",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for index_name in TRIGRAM_INDEXES:
+            op.drop_index(
+                index_name,
+                table_name="unsubscribed_emails",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    # The pg_trgm extension is left installed; other objects may depend on it.
@@ -0,0 +1,127 @@
+"""partition logs by month on timestamp
+
+Revision ID: a8f3c2d6e4b1
+Revises: e5d1a7c3b9f2
+Create Date: 2026-10-17 18:47:51.302214
+
+"""
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a8f3c2d6e4b1"
+down_revision: Union[str, None] = "e5d1a7c3b9f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created past the current month; the app keeps this topped up
+MONTHS_AHEAD = 3
+COLUMNS = "id, timestamp, source_app, log_level, message, details_json, inserted_by"
+INDEXES = [
+    ("ix_logs_id", ["id"]),
+    ("ix_logs_timestamp", ["timestamp"]),
+    ("ix_logs_source_app_timestamp_id", ["source_app", "timestamp", "id"]),
+    ("ix_logs_log_level_timestamp_id", ["log_level", "timestamp", "id"]),
+]
+
+
+def _month_start(moment: datetime) -> datetime:
+    moment = moment.astimezone(timezone.utc)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _rename_old_table(name: str):
+    op.rename_table("logs", name)
+    op.execute(f"ALTER TABLE {name} RENAME CONSTRAINT logs_pkey TO {name}_pkey")
+    # Index names are schema-wide; free them for the new table
+    for index_name, _ in INDEXES:
+        op.drop_index(index_name, table_name=name, if_exists=True)
+
+
+def _create_indexes():
+    for index_name, columns in INDEXES:
+        op.create_index(index_name, "logs", columns, unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only PostgreSQL supports declarative partitioning; elsewhere logs stays
+    # a plain table and retention deletes old rows instead
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    # Writers block on the renamed table until this commits; log writes that
+    # time out fall back to stdout
+    _rename_old_table("logs_unpartitioned")
+
+    # The primary key of a partitioned table must include the partition key
+    op.execute("""
+        CREATE TABLE logs (
+            id INTEGER NOT NULL DEFAULT nextval('logs_id_seq'::regclass),
+            "timestamp" TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            source_app VARCHAR NOT NULL,
+            log_level VARCHAR NOT NULL,
+            message VARCHAR NOT NULL,
+            details_json JSON,
+            inserted_by VARCHAR,
+            CONSTRAINT logs_pkey PRIMARY KEY (id, "timestamp")
+        ) PARTITION BY RANGE ("timestamp")
+        """)
+    op.execute("ALTER SEQUENCE logs_id_seq OWNED BY logs.id")
+    # Created on the parent, so every partition gets them automatically
+    _create_indexes()
+
+    # One partition per month from the oldest row to a few months ahead. No
+    # DEFAULT partition, since it would block DETACH ... CONCURRENTLY; the
+    # app creates a missing month before writing to it
+    oldest, newest = conn.execute(
+        sa.text('SELECT min("timestamp"), max("timestamp") FROM logs_unpartitioned')
+    ).one()
+    now = datetime.now(timezone.utc)
+    month = _month_start(oldest or now)
+    last = _add_months(_month_start(max(newest or now, now)), MONTHS_AHEAD)
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE logs_p{month.year}_{month.month:02d} PARTITION OF logs "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+
+    op.execute(f"INSERT INTO logs ({COLUMNS}) SELECT {COLUMNS} FROM logs_unpartitioned")
+    op.drop_table("logs_unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _rename_old_table("logs_partitioned")
+    op.execute("""
+        CREATE TABLE logs (
+            id INTEGER NOT NULL DEFAULT nextval('logs_id_seq'::regclass),
+            "timestamp" TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            source_app VARCHAR NOT NULL,
+            log_level VARCHAR NOT NULL,
+            message VARCHAR NOT NULL,
+            details_json JSON,
+            inserted_by VARCHAR,
+            CONSTRAINT logs_pkey PRIMARY KEY (id)
+        )
+        """)
+    op.execute("ALTER SEQUENCE logs_id_seq OWNED BY logs.id")
+    _create_indexes()
+    op.execute(f"INSERT INTO logs ({COLUMNS}) SELECT {COLUMNS} FROM logs_partitioned")
+    # Dropping the parent drops every partition with it
+    op.drop_table("logs_partitioned")
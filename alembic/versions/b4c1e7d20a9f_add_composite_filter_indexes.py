@@ -0,0 +1,84 @@
+"""add composite indexes for list and log filters
+
+Revision ID: b4c1e7d20a9f
+Revises: 93de47f45be7
+Create Date: 2026-10-17 10:41:27.530916
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b4c1e7d20a9f"
+down_revision: Union[str, None] = "93de47f45be7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COMPOSITE_INDEXES = [
+    (
+        "ix_unsubscribed_emails_unsub_method_id",
+        "unsubscribed_emails",
+        ["unsub_method", "id"],
+    ),
+    (
+        "ix_unsubscribed_emails_inserted_at_id",
+        "unsubscribed_emails",
+        ["inserted_at", "id"],
+    ),
+    (
+        "ix_unsubscribed_emails_unsub_method_inserted_at_id",
+        "unsubscribed_emails",
+        ["unsub_method", "inserted_at", "id"],
+    ),
+    ("ix_logs_source_app_timestamp_id", "logs", ["source_app", "timestamp", "id"]),
+    ("ix_logs_log_level_timestamp_id", "logs", ["log_level", "timestamp", "id"]),
+]
+
+
+def _index_options() -> dict:
+    # Build concurrently on PostgreSQL so large tables stay writable
+    if op.get_bind().dialect.name == "postgresql":
+        return {"postgresql_concurrently": True}
+    return {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    options = _index_options()
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns in COMPOSITE_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                **options,
+            )
+
+        # (unsub_method, id) has unsub_method as its prefix, so this is redundant
+        op.drop_index(
+            "ix_unsubscribed_emails_unsub_method",
+            table_name="unsubscribed_emails",
+            if_exists=True,
+            **options,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    options = _index_options()
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_unsubscribed_emails_unsub_method",
+            "unsubscribed_emails",
+            ["unsub_method"],
+            unique=False,
+            if_not_exists=True,
+            **options,
+        )
+        for index_name, table_name, _ in reversed(COMPOSITE_INDEXES):
+            op.drop_index(index_name, table_name=table_name, if_exists=True, **options)
@@ -0,0 +1,38 @@
+"""add rate limit counters table
+
+Revision ID: c9a3f5e81d02
+Revises: b4c1e7d20a9f
+Create Date: 2026-10-17 13:05:44.218930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c9a3f5e81d02"
+down_revision: Union[str, None] = "b4c1e7d20a9f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "rate_limit_counters",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("window", sa.Integer(), nullable=False),
+        sa.Column("window_start", sa.BigInteger(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("key", "window", "window_start"),
+    )
+    # Counters are disposable, so skip the WAL on PostgreSQL
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("ALTER TABLE rate_limit_counters SET UNLOGGED")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("rate_limit_counters")
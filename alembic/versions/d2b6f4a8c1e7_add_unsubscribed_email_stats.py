@@ -0,0 +1,71 @@
+"""add unsubscribed email stats rollup
+
+Revision ID: d2b6f4a8c1e7
+Revises: a8f3c2d6e4b1
+Create Date: 2026-10-17 20:14:36.518402
+
+"""
+
+from collections import Counter
+from datetime import timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d2b6f4a8c1e7"
+down_revision: Union[str, None] = "a8f3c2d6e4b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_SIZE = 10_000
+
+emails = sa.table(
+    "unsubscribed_emails",
+    sa.column("sender_email", sa.String),
+    sa.column("unsub_method", sa.String),
+    sa.column("inserted_at", sa.TIMESTAMP(timezone=True)),
+)
+
+
+def _day_bucket(inserted_at) -> str:
+    if inserted_at.tzinfo is not None:
+        inserted_at = inserted_at.astimezone(timezone.utc)
+    return inserted_at.date().isoformat()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    stats = op.create_table(
+        "unsubscribed_email_stats",
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("bucket", sa.String(), nullable=False),
+        sa.Column("unsub_method", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("kind", "bucket", "unsub_method"),
+    )
+
+    # Backfill with the same bucketing as app.crud.unsubscribed_email_stats.
+    # Rows are read in chunks; only the per-bucket counts are held in memory.
+    counts = Counter()
+    result = op.get_bind().execute(
+        sa.select(emails).execution_options(yield_per=CHUNK_SIZE)
+    )
+    for partition in result.partitions():
+        for sender_email, unsub_method, inserted_at in partition:
+            domain = sender_email.rsplit("@", 1)[-1].strip().lower()
+            counts[("day", _day_bucket(inserted_at), unsub_method)] += 1
+            counts[("domain", domain, unsub_method)] += 1
+
+    rows = [
+        {"kind": kind, "bucket": bucket, "unsub_method": method, "count": count}
+        for (kind, bucket, method), count in sorted(counts.items())
+    ]
+    for start in range(0, len(rows), CHUNK_SIZE):
+        op.bulk_insert(stats, rows[start : start + CHUNK_SIZE])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("unsubscribed_email_stats")
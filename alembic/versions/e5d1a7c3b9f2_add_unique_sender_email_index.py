@@ -0,0 +1,78 @@
+"""dedupe unsubscribed emails and add a unique sender email index
+
+Revision ID: e5d1a7c3b9f2
+Revises: c9a3f5e81d02
+Create Date: 2026-10-17 15:22:09.604371
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e5d1a7c3b9f2"
+down_revision: Union[str, None] = "c9a3f5e81d02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ux_unsubscribed_emails_sender_email_lower"
+CHUNK_SIZE = 1000
+
+# Every row but the oldest for each sender, compared case-insensitively
+DUPLICATE_IDS = sa.text("""
+    SELECT id FROM (
+        SELECT id, row_number() OVER (
+            PARTITION BY lower(sender_email) ORDER BY id
+        ) AS rank
+        FROM unsubscribed_emails
+    ) ranked
+    WHERE rank > 1
+    ORDER BY id
+    """)
+DELETE_IDS = sa.text("DELETE FROM unsubscribed_emails WHERE id IN :ids").bindparams(
+    sa.bindparam("ids", expanding=True)
+)
+
+
+def _index_options() -> dict:
+    # Build concurrently on PostgreSQL so large tables stay writable
+    if op.get_bind().dialect.name == "postgresql":
+        return {"postgresql_concurrently": True}
+    return {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # For large tables, run scripts/dedupe_unsubscribed_emails.py before
+    # deploying so this finds little or nothing left to delete.
+    options = _index_options()
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        duplicate_ids = conn.execute(DUPLICATE_IDS).scalars().all()
+        # Each chunk commits on its own, so row locks are held only briefly
+        for start in range(0, len(duplicate_ids), CHUNK_SIZE):
+            conn.execute(DELETE_IDS, {"ids": duplicate_ids[start : start + CHUNK_SIZE]})
+
+        # A failed concurrent build leaves an invalid index behind; start clean
+        op.drop_index(
+            INDEX_NAME, table_name="unsubscribed_emails", if_exists=True, **options
+        )
+        op.create_index(
+            INDEX_NAME,
+            "unsubscribed_emails",
+            [sa.text("lower(sender_email)")],
+            unique=True,
+            **options,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Deleted duplicates are not restored
+    options = _index_options()
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME, table_name="unsubscribed_emails", if_exists=True, **options
+        )
@@ -0,0 +1,101 @@
+"""add an indexed sender_domain column to unsubscribed emails
+
+Revision ID: f3c8a1d5b7e2
+Revises: d2b6f4a8c1e7
+Create Date: 2026-10-17 21:32:08.740915
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f3c8a1d5b7e2"
+down_revision: Union[str, None] = "d2b6f4a8c1e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_unsubscribed_emails_sender_domain_id"
+CHUNK_SIZE = 5000
+
+emails = sa.table(
+    "unsubscribed_emails",
+    sa.column("id", sa.Integer),
+    sa.column("sender_email", sa.String),
+    sa.column("sender_domain", sa.String),
+)
+MISSING_DOMAINS = (
+    sa.select(emails.c.id, emails.c.sender_email)
+    .where(emails.c.sender_domain.is_(None), emails.c.id > sa.bindparam("after_id"))
+    .order_by(emails.c.id)
+    .limit(CHUNK_SIZE)
+)
+SET_DOMAIN = (
+    emails.update()
+    .where(emails.c.id == sa.bindparam("row_id"))
+    .values(sender_domain=sa.bindparam("domain"))
+)
+
+
+def _email_domain(email: str) -> str:
+    # Same rule as app.models.unsubscribed_email.email_domain
+    return email.rsplit("@", 1)[-1].strip().lower()
+
+
+def _index_options() -> dict:
+    # Build concurrently on PostgreSQL so large tables stay writable
+    if op.get_bind().dialect.name == "postgresql":
+        return {"postgresql_concurrently": True}
+    return {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable, so adding it is a catalog-only change and older app code
+    # that does not set it keeps working during the deploy
+    op.add_column(
+        "unsubscribed_emails", sa.Column("sender_domain", sa.String(), nullable=True)
+    )
+
+    options = _index_options()
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        # Backfill in id order; each chunk commits on its own, so row locks
+        # are held only briefly
+        after_id = 0
+        while True:
+            rows = conn.execute(MISSING_DOMAINS, {"after_id": after_id}).all()
+            if not rows:
+                break
+            conn.execute(
+                SET_DOMAIN,
+                [
+                    {"row_id": row_id, "domain": _email_domain(email)}
+                    for row_id, email in rows
+                ],
+            )
+            after_id = rows[-1].id
+
+        # A failed concurrent build leaves an invalid index behind; start clean
+        op.drop_index(
+            INDEX_NAME, table_name="unsubscribed_emails", if_exists=True, **options
+        )
+        op.create_index(
+            INDEX_NAME,
+            "unsubscribed_emails",
+            ["sender_domain", "id"],
+            unique=False,
+            **options,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    options = _index_options()
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME, table_name="unsubscribed_emails", if_exists=True, **options
+        )
+    op.drop_column("unsubscribed_emails", "sender_domain")
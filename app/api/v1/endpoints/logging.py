@@ -1,12 +1,20 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.core.logging import log_event, get_logs
+from app.core.export import generate_logs_ndjson_stream
+from app.core.logging import (
+    get_logs,
+    iter_log_chunks,
+    iter_log_tail_events,
+    log_tail,
+    write_log,
+)
 
 router = APIRouter()
 
@@ -31,15 +39,19 @@ class LogResponse(BaseModel):
 
 
 class PaginatedLogResponse(BaseModel):
-    total: int
+    total: Optional[int]  # None when the request asked for total=none
     limit: int
     offset: int
     data: List[LogResponse]
+    # Keyset cursors for the next page, set when this page is full
+    next_after_id: Optional[int] = None
+    next_before_timestamp: Optional[datetime] = None
+    next_before_id: Optional[int] = None
 
 
 @router.post("", status_code=201, response_model=dict)
 async def create_log_entry(log_in: LogCreate):
-    log_id = await log_event(
+    log_id = await write_log(
         source_app=log_in.source_app,
         log_level=log_in.log_level,
         message=log_in.message,
@@ -55,11 +67,113 @@ def read_logs(
     offset: int = Query(0, ge=0),
     source_app: Optional[str] = None,
     log_level: Optional[str] = None,
+    after_id: Optional[int] = Query(
+        None, ge=0, description="Return logs after this ID, oldest first"
+    ),
+    before_timestamp: Optional[datetime] = Query(
+        None, description="Return logs older than this, newest first"
+    ),
+    before_id: Optional[int] = Query(
+        None, description="With before_timestamp, resume among logs sharing it"
+    ),
+    total_mode: Literal["exact", "none"] = Query(
+        "exact", alias="total", description="Pass `none` to skip counting"
+    ),
 ):
-    logs, total = get_logs(db, limit, offset, source_app, log_level)
+    """
+    Retrieve a paginated and filtered list of logs, newest first.
+
+    Pages by `offset`, or by keyset: pass a full page's `next_before_timestamp`
+    and `next_before_id` to go further back, or `after_id` (and then each
+    page's `next_after_id`) to read forward from a known log.
+    """
+    if (after_id is not None or before_timestamp is not None) and offset:
+        raise HTTPException(422, "Cursors cannot be combined with offset")
+    if after_id is not None and before_timestamp is not None:
+        raise HTTPException(422, "after_id and before_timestamp cannot be combined")
+    if before_id is not None and before_timestamp is None:
+        raise HTTPException(422, "before_id requires before_timestamp")
+
+    logs, total = get_logs(
+        db,
+        limit,
+        offset,
+        source_app,
+        log_level,
+        after_id=after_id,
+        before_timestamp=before_timestamp,
+        before_id=before_id,
+        with_total=total_mode == "exact",
+    )
+
+    next_cursor = {}
+    if len(logs) == limit:
+        last = logs[-1]
+        if after_id is not None:
+            next_cursor = {"next_after_id": last.id}
+        else:
+            next_cursor = {
+                "next_before_timestamp": last.timestamp,
+                "next_before_id": last.id,
+            }
     return {
         "total": total,
         "limit": limit,
         "offset": offset,
         "data": logs,
+        **next_cursor,
     }
+
+
+@router.get("/export")
+def export_logs(
+    db: Session = Depends(get_db),
+    source_app: Optional[str] = None,
+    log_level: Optional[str] = None,
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    after_id: Optional[int] = Query(None, ge=0),
+):
+    """
+    Export filtered logs as newline-delimited JSON, oldest first.
+
+    Rows are streamed from a server-side cursor in chunks, so memory use stays
+    flat regardless of how many logs match.
+    """
+    chunks = iter_log_chunks(
+        db,
+        source_app=source_app,
+        log_level=log_level,
+        date_from=date_from,
+        date_to=date_to,
+        after_id=after_id,
+    )
+    return generate_logs_ndjson_stream(chunks)
+
+
+@router.get("/stream")
+async def stream_logs(
+    source_app: Optional[str] = None,
+    log_level: Optional[str] = None,
+    last_event_id: Optional[int] = Header(
+        None, ge=0, description="Resume after this event, as sent by EventSource"
+    ),
+):
+    """
+    Tail new logs live as Server-Sent Events.
+
+    Events come from this worker's in-memory buffer of recent logs, so
+    watching puts no load on the database. A reconnecting client that sends
+    `Last-Event-ID` gets the events it missed, if they are still buffered.
+    """
+    return StreamingResponse(
+        iter_log_tail_events(
+            log_tail,
+            last_id=last_event_id,
+            source_app=source_app,
+            log_level=log_level,
+        ),
+        media_type="text/event-stream",
+        # Stop proxies from caching or buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
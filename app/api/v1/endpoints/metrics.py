@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+
+from app.core.database import get_all_pool_stats
+from app.core.logging import log_queue, log_tail
+from app.crud.unsubscribed_email import query_cache
+from app.web.router import list_page_cache
+
+router = APIRouter()
+
+
+@router.get("")
+async def read_metrics():
+    """
+    Returns runtime gauges for capacity planning: connection pool usage and
+    checkout wait times, the state of the log event queue and live tail
+    buffer, and hit rates of the query and web page caches.
+    """
+    return {
+        "db_pools": get_all_pool_stats(),
+        "log_queue": log_queue.stats(),
+        "log_tail": log_tail.stats(),
+        "caches": {
+            "query": query_cache.stats(),
+            "web_list_page": list_page_cache.stats(),
+        },
+    }
@@ -1,45 +1,78 @@
+import json
+from collections import defaultdict
 from datetime import datetime
-from typing import Literal, Optional, Union
-from fastapi import APIRouter, Depends, status, Query, Request, HTTPException
-from sqlalchemy.orm import Session
-
-from app.core import get_db, log_event
+from typing import List, Literal, Optional, Union
+from fastapi import APIRouter, Depends, status, Query, Request, Response, HTTPException
+from pydantic import TypeAdapter, ValidationError
+from app.core import log_event
+from app.core.database import get_request_db
+from app.core.pagination import InvalidCursorError
 from app.core.security import require_api_auth
+from app.core.serialization import dumps, email_rows_to_dicts
+from app.core.timing import timed
 from app.crud import unsubscribed_email as crud
+from app.crud import unsubscribed_email_stats as stats_crud
 from app.schemas import unsubscribed_email as schemas
 
 router = APIRouter()
 
+# Upper bounds on records and body bytes accepted by a single bulk request;
+# the byte limit is checked first, so oversized bodies are never parsed
+BULK_MAX_ROWS = 10_000
+BULK_MAX_BYTES = 10 * 1024 * 1024
+NDJSON_CONTENT_TYPES = (
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/jsonl",
+)
+
+_bulk_rows_adapter = TypeAdapter(List[schemas.UnsubscribedEmailCreate])
+
 
 @router.post(
     "/",
     response_model=schemas.UnsubscribedEmailResponse,
     status_code=status.HTTP_201_CREATED,
+    responses={200: {"description": "The sender was already recorded"}},
 )
 async def create_unsubscribed_email_entry(
     *,
-    db: Session = Depends(get_db),
+    db: crud.AnySession = Depends(get_request_db),
     email_in: schemas.UnsubscribedEmailCreate,
     token: str = Depends(require_api_auth),
+    response: Response,
 ):
     """
     Create a new record for an unsubscribed email.
+
+    Creating is idempotent per sender: if a record already exists for the
+    same `sender_email` (ignoring case), it is returned unchanged with a 200
+    instead of a 201, so clients can safely retry.
     """
     try:
-        created_email = crud.create_unsubscribed_email(db=db, email_in=email_in)
+        stored, created = await crud.async_create_unsubscribed_email(
+            db=db, email_in=email_in
+        )
+
+        if not created:
+            response.status_code = status.HTTP_200_OK
 
         await log_event(
             source_app="api",
             log_level="INFO",
-            message="Unsubscribed email record created.",
+            message=(
+                "Unsubscribed email record created."
+                if created
+                else "Unsubscribed email record already exists."
+            ),
             details_json={
-                "created_id": created_email.id,
-                "sender_email": created_email.sender_email,
+                "created_id" if created else "existing_id": stored.id,
+                "sender_email": stored.sender_email,
             },
             inserted_by="api_token",  # Don't log the token itself
         )
 
-        return created_email
+        return stored
     except Exception as e:
         # The database session will automatically rollback on exception
         # when using FastAPI's dependency injection
@@ -62,14 +95,25 @@ async def create_unsubscribed_email_entry(
 )
 async def list_unsubscribed_email_entries(
     *,
-    db: Session = Depends(get_db),
+    db: crud.AnySession = Depends(get_request_db),
     # Pagination params
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from a previous page's next_cursor"
+    ),
+    total_mode: Literal["exact", "estimate", "none"] = Query(
+        "exact",
+        alias="total",
+        description="How to compute `total`: exact count, planner estimate, or skip",
+    ),
     # Filter params
     # unsub_method: Optional[Union[Literal["direct_link", "isp_level"], Literal['']]] = Query(None),
     unsub_method: Optional[str] = Query(None),
     search: Optional[str] = Query(None, min_length=1, max_length=100),
+    domain: Optional[str] = Query(
+        None, min_length=1, max_length=255, description="Exact sender domain"
+    ),
     date_from: Optional[datetime] = Query(
         None, description="ISO 8601 format: YYYY-MM-DDTHH:MM:SS"
     ),
@@ -82,6 +126,10 @@ async def list_unsubscribed_email_entries(
 ):
     """
     Retrieve a paginated and filtered list of unsubscribed email records.
+
+    Pages by `offset`, or by `cursor` for an index seek that costs the same
+    no matter how deep the page is. Every full page returns a `next_cursor`.
+    Pass `total=estimate` or `total=none` to avoid an exact count on large tables.
     """
     print("Raw query params: {request.url.query}")
     print("filter typic received: {repr(unsub_method)}")
@@ -91,23 +139,240 @@ async def list_unsubscribed_email_entries(
     elif unsub_method is not None and unsub_method not in ["direct_link", "isp_level"]:
         raise HTTPException(422, f"Invalid unsub_method: {unsub_method}")
 
-    items = crud.get_unsubscribed_emails(
-        db=db,
+    if cursor and offset:
+        raise HTTPException(422, "cursor and offset cannot be combined")
+
+    try:
+        page = await crud.async_get_unsubscribed_emails_page(
+            db=db,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total=total_mode,
+            unsub_method=unsub_method,
+            search=search,
+            domain=domain,
+            date_from=date_from,
+            date_to=date_to,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(422, str(e))
+
+    next_cursor = crud.get_next_cursor(page.items, limit=limit)
+
+    # Rows come straight from the database, so skip response_model validation
+    # and encode them directly; response_model still documents the shape
+    with timed("serialize"):
+        content = {
+            "items": email_rows_to_dicts(page.items),
+            "total": page.total,
+            "total_estimated": page.total_estimated,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+        }
+        body = dumps(content)
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/stats", response_model=schemas.UnsubscribedEmailStats)
+async def read_unsubscribed_email_stats(
+    *,
+    db: crud.AnySession = Depends(get_request_db),
+    unsub_method: Optional[Literal["direct_link", "isp_level"]] = Query(None),
+    domains_limit: int = Query(50, ge=1, le=1000),
+    token: str = Depends(require_api_auth),
+):
+    """
+    Retrieve record totals per unsub_method, per day (UTC) and for the
+    largest sender domains.
+
+    Totals come from a rollup that every create updates in the same
+    transaction, so this costs the same however large the table grows.
+    """
+    return await stats_crud.async_get_unsubscribed_email_stats(
+        db, unsub_method=unsub_method, domains_limit=domains_limit
+    )
+
+
+@router.get("/domains/top", response_model=schemas.TopDomains)
+async def read_top_domains(
+    *,
+    db: crud.AnySession = Depends(get_request_db),
+    limit: int = Query(10, ge=1, le=100),
+    unsub_method: Optional[Literal["direct_link", "isp_level"]] = Query(None),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    token: str = Depends(require_api_auth),
+):
+    """
+    Retrieve the sender domains with the most records, largest first.
+
+    Without a date range this reads the stats rollup; with one, it groups
+    the matching records on the indexed sender_domain column.
+    """
+    items = await crud.async_get_top_domains(
+        db,
         limit=limit,
-        offset=offset,
         unsub_method=unsub_method,
-        search=search,
         date_from=date_from,
         date_to=date_to,
     )
-    total = crud.count_unsubscribed_emails(
-        db=db,
-        unsub_method=unsub_method,
-        search=search,
-        date_from=date_from,
-        date_to=date_to,
+    return {"items": items}
+
+
+def _body_too_large() -> HTTPException:
+    return HTTPException(
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        f"A bulk request body may be at most {BULK_MAX_BYTES} bytes",
+    )
+
+
+async def _read_bulk_body(request: Request) -> bytes:
+    """
+    Reads a bulk request body, rejecting it with 413 once it is known to
+    exceed BULK_MAX_BYTES: up front from Content-Length, or while streaming
+    for bodies without one, so at most BULK_MAX_BYTES are ever buffered.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        if not content_length.isdigit():
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid Content-Length")
+        if int(content_length) > BULK_MAX_BYTES:
+            raise _body_too_large()
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > BULK_MAX_BYTES:
+            raise _body_too_large()
+    return bytes(body)
+
+
+def _parse_bulk_body(body: bytes, content_type: str) -> list:
+    """Parses a bulk request body sent either as a JSON array or as NDJSON."""
+    media_type = content_type.split(";")[0].strip().lower()
+    try:
+        if media_type in NDJSON_CONTENT_TYPES:
+            return [json.loads(line) for line in body.splitlines() if line.strip()]
+        rows = json.loads(body)
+    except ValueError:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Malformed JSON body")
+
+    if not isinstance(rows, list):
+        raise HTTPException(422, "Expected a JSON array of records")
+    return rows
+
+
+def _validate_bulk_rows(rows: list) -> tuple[list, dict]:
+    """
+    Validates all rows in one pass. Returns the (index, record) pairs that are
+    valid and a mapping of row index to errors for the ones that are not.
+    """
+    try:
+        return list(enumerate(_bulk_rows_adapter.validate_python(rows))), {}
+    except ValidationError as e:
+        errors_by_index = defaultdict(list)
+        for error in e.errors(include_url=False):
+            errors_by_index[error["loc"][0]].append(
+                {
+                    "loc": list(error["loc"][1:]),
+                    "msg": error["msg"],
+                    "type": error["type"],
+                }
+            )
+
+    valid = [
+        (index, schemas.UnsubscribedEmailCreate.model_validate(row))
+        for index, row in enumerate(rows)
+        if index not in errors_by_index
+    ]
+    return valid, dict(errors_by_index)
+
+
+@router.post("/bulk", response_model=schemas.BulkCreateResponse)
+async def bulk_create_unsubscribed_email_entries(
+    *,
+    db: crud.AnySession = Depends(get_request_db),
+    request: Request,
+    token: str = Depends(require_api_auth),
+):
+    """
+    Create many unsubscribed email records from a JSON array or NDJSON body.
+
+    Invalid rows are reported individually and the valid ones are inserted in
+    a single transaction. Rows for a sender that is already recorded, or that
+    repeats within the request, are reported as "existing" with the stored
+    record's id. One summary log event is written per request.
+    """
+    rows = _parse_bulk_body(
+        await _read_bulk_body(request), request.headers.get("content-type", "")
+    )
+    if len(rows) > BULK_MAX_ROWS:
+        raise HTTPException(
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            f"A bulk request may contain at most {BULK_MAX_ROWS} records",
+        )
+
+    valid, errors_by_index = _validate_bulk_rows(rows)
+
+    # The column is NOT NULL even though the create schema allows omitting it
+    for index, email_in in valid:
+        if email_in.unsub_method is None:
+            errors_by_index[index] = [
+                {"loc": ["unsub_method"], "msg": "Field required", "type": "missing"}
+            ]
+    valid = [
+        (index, email_in) for index, email_in in valid if index not in errors_by_index
+    ]
+
+    try:
+        stored = await crud.async_bulk_create_unsubscribed_emails(
+            db=db, emails_in=[email_in for _, email_in in valid]
+        )
+    except Exception as e:
+        await log_event(
+            source_app="api",
+            log_level="ERROR",
+            message=f"Failed to bulk create unsubscribed email records: {str(e)}",
+            details_json={"received": len(rows), "error": str(e)},
+            inserted_by="api_token",
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create unsubscribed email records",
+        )
+
+    results = [
+        schemas.BulkCreateResult(index=index, status="invalid", errors=errors)
+        for index, errors in errors_by_index.items()
+    ]
+    results.extend(
+        schemas.BulkCreateResult(
+            index=index, status="created" if created else "existing", id=row.id
+        )
+        for (index, _), (row, created) in zip(valid, stored)
+    )
+    results.sort(key=lambda result: result.index)
+    created_count = sum(created for _, created in stored)
+    existing_count = len(stored) - created_count
+
+    await log_event(
+        source_app="api",
+        log_level="INFO",
+        message="Unsubscribed email records bulk created.",
+        details_json={
+            "received": len(rows),
+            "created": created_count,
+            "existing": existing_count,
+            "invalid": len(errors_by_index),
+        },
+        inserted_by="api_token",
     )
 
-    return schemas.UnsubscribedEmailList(
-        items=items, total=total, limit=limit, offset=offset
+    return schemas.BulkCreateResponse(
+        created=created_count,
+        existing=existing_count,
+        invalid=len(errors_by_index),
+        results=results,
     )
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
 from .endpoints import logging as logging_router
-from .endpoints import unsubscribed_emails, export
+from .endpoints import unsubscribed_emails, export, metrics
 
 router = APIRouter()
 
@@ -18,6 +18,7 @@ router.include_router(
 
 # Include other endpoint groups
 router.include_router(logging_router.router, prefix="/logs", tags=["Logging"])
+router.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
 
 
 # Add a simple protected endpoint for testing purposes
@@ -0,0 +1,139 @@
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# --- Table versions ---
+# Every committed ORM write moves its table to a new version, so a cache
+# entry keyed on the version it was built from is never served after a
+# write. Versions are per process: writes made by other workers are only
+# picked up when entries expire, which is what the TTLs below bound.
+
+_version_counter = itertools.count(1)
+_table_versions: Dict[str, int] = {}
+
+
+def bump_table_version(table: str) -> int:
+    """Marks `table` as changed. Returns its new version."""
+    version = next(_version_counter)
+    _table_versions[table] = version
+    return version
+
+
+def get_table_version(table: str) -> int:
+    return _table_versions.get(table, 0)
+
+
+def _changed_tables(session: Session) -> Set[str]:
+    return session.info.setdefault("changed_tables", set())
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_tables(session: Session, flush_context):
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        _changed_tables(session).add(inspect(obj).mapper.local_table.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk_writes(orm_execute_state: ORMExecuteState):
+    # insert(), update() and delete() statements bypass the flush
+    if not orm_execute_state.is_select:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _changed_tables(orm_execute_state.session).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_changed_tables(session: Session):
+    for table in session.info.pop("changed_tables", ()):
+        bump_table_version(table)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_tables(session: Session):
+    session.info.pop("changed_tables", None)
+
+
+class LRUCache:
+    """
+    A thread-safe, bounded mapping that evicts least recently used entries
+    once it holds more than `max_entries`, or, when `max_bytes` is set, more
+    than `max_bytes` as measured by `size_of(value)`. Entries older than
+    `ttl` seconds are treated as missing.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        size_of: Optional[Callable[[Any], int]] = None,
+    ):
+        if max_bytes is not None and size_of is None:
+            raise ValueError("max_bytes requires a size_of function")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        # key -> (value, stored_at, size)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None:
+                if time.monotonic() - entry[1] > self.ttl:
+                    self._remove(key)
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any):
+        size = self.size_of(value) if self.size_of is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # Would evict everything else and still not fit
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic(), size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import HttpUrl, ConfigDict
 from pydantic_settings import BaseSettings
@@ -6,6 +6,14 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    DATABASE_ASYNC: bool = False  # Use an asyncpg/aiosqlite engine for requests
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Replace connections older than 30 minutes
+    DB_POOL_PRE_PING: bool = True
+    LOG_DB_POOL_SIZE: int = 2  # Separate pool used only by the log writer
+    LOG_DB_MAX_OVERFLOW: int = 0
     API_TOKEN: str
     DISCORD_WEBHOOK_URL: Optional[HttpUrl] = None
     BASIC_AUTH_USERNAME: str = "admin"
@@ -15,6 +23,29 @@ class Settings(BaseSettings):
     RATE_LIMIT_REQUESTS: int = 20
     RATE_LIMIT_AUTH_REQUESTS: int = 100
     RATE_LIMIT_TIMESCALE_SECONDS: int = 60  # 1 minute
+    # "database" shares counts across workers through rate_limit_counters
+    RATE_LIMIT_BACKEND: Literal["memory", "database"] = "memory"
+    RATE_LIMIT_SYNC_INTERVAL_SECONDS: float = 1.0
+    WEB_CACHE_MAX_ENTRIES: int = 256  # Rendered web list pages kept in memory
+    WEB_CACHE_TTL_SECONDS: float = 30.0  # Bounds staleness from other workers' writes
+    QUERY_CACHE_MAX_ENTRIES: int = 1024  # API list pages and counts kept in memory
+    QUERY_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # Approximate
+    QUERY_CACHE_TTL_SECONDS: float = 10.0
+    # Per-request SQL/serialization/render timings, logged and sent as Server-Timing
+    REQUEST_TIMING_ENABLED: bool = True
+    LOG_QUEUE_MAX_SIZE: int = 10000
+    LOG_QUEUE_OVERFLOW: Literal["drop_oldest", "drop_newest"] = "drop_oldest"
+    LOG_BATCH_SIZE: int = 200
+    LOG_FLUSH_INTERVAL_SECONDS: float = 1.0
+    LOG_PARTITION_MONTHS_AHEAD: int = (
+        3  # Monthly logs partitions kept ready (PostgreSQL)
+    )
+    LOG_RETENTION_MONTHS: Optional[int] = (
+        None  # Whole months of logs to keep; None keeps all
+    )
+    LOG_MAINTENANCE_INTERVAL_SECONDS: float = 3600.0
+    LOG_TAIL_BUFFER_SIZE: int = 1000  # Recent events kept for /api/v1/logs/stream
+    LOG_TAIL_KEEPALIVE_SECONDS: float = 15.0
 
     model_config = ConfigDict(
         env_file=".env",
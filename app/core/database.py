@@ -1,16 +1,138 @@
 import os
+import threading
+import time
+from typing import Any, Dict
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from dotenv import load_dotenv
 
+from app.core.config import settings
+
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+DATABASE_ASYNC = settings.DATABASE_ASYNC
+
+# Async DBAPI driver to use for each backend when DATABASE_ASYNC is enabled
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def get_async_database_url(url: str) -> URL:
+    """Rewrites a sync database URL to use the backend's async driver."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+class _CheckoutTimingMixin:
+    """Records how long callers wait to check a connection out of the pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
 
-engine = create_engine(DATABASE_URL)
+def _pool_options(pool_size: int, max_overflow: int) -> Dict[str, Any]:
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+engine = create_engine(
+    DATABASE_URL,
+    poolclass=InstrumentedQueuePool,
+    **_pool_options(settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW),
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# A separate, small pool for the log writer, so log inserts never compete
+# with request sessions for connections.
+log_engine = create_engine(
+    DATABASE_URL,
+    poolclass=InstrumentedQueuePool,
+    **_pool_options(settings.LOG_DB_POOL_SIZE, settings.LOG_DB_MAX_OVERFLOW),
+)
+LogSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=log_engine)
+
+# The async engine is only built when enabled, so its driver stays optional
+async_engine = (
+    create_async_engine(
+        get_async_database_url(DATABASE_URL),
+        poolclass=InstrumentedAsyncQueuePool,
+        **_pool_options(settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW),
+    )
+    if DATABASE_ASYNC
+    else None
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def get_pool_stats(engine: Engine) -> Dict[str, Any]:
+    """Returns the current gauges and checkout wait times for an engine's pool."""
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    if isinstance(pool, _CheckoutTimingMixin):
+        checkouts = pool.checkouts
+        stats.update(
+            checkouts=checkouts,
+            wait_ms_avg=(
+                round(pool.wait_seconds_total / checkouts * 1000, 3)
+                if checkouts
+                else 0.0
+            ),
+            wait_ms_max=round(pool.wait_seconds_max * 1000, 3),
+        )
+    return stats
+
+
+def get_all_pool_stats() -> Dict[str, Dict[str, Any]]:
+    pools = {"request": get_pool_stats(engine), "log": get_pool_stats(log_engine)}
+    if async_engine is not None:
+        pools["request_async"] = get_pool_stats(async_engine.sync_engine)
+    return pools
+
 
 def get_db():
     db = SessionLocal()
@@ -18,3 +140,13 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Session dependency for the request path: an AsyncSession when
+# DATABASE_ASYNC is enabled, otherwise the regular sync Session.
+get_request_db = get_async_db if DATABASE_ASYNC else get_db
@@ -1,40 +1,180 @@
 import csv
 import io
-from typing import Iterable, List, Dict, Any
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
 
-from fastapi import Response
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
 
-from app.models import UnsubscribedEmail
+from app.core.serialization import (
+    EMAIL_FIELDS,
+    LOG_FIELDS,
+    dumps,
+    email_rows_to_dicts,
+    format_datetime,
+    rows_to_dicts,
+)
+from app.core.timing import timed
+from app.crud import unsubscribed_email as crud
 
+EXPORT_FIELDNAMES = list(EMAIL_FIELDS)
 
-def generate_csv_stream(data_list: List[Dict[str, Any]]) -> Response:
+# Chunks are lists of READ_COLUMNS rows, e.g. from
+# crud.async_iter_unsubscribed_email_chunks
+Chunks = AsyncIterable[List[Sequence[Any]]]
+
+
+def _csv_row(row: Sequence[Any]) -> tuple:
     """
-    Creates a streaming response for a CSV file from a list of data.
+    Formats a row for CSV; inserted_at goes out in ISO 8601 exactly as the
+    JSON formats and the list endpoint write it (UTC as "Z").
     """
+    return (row[0], row[1], row[2], row[3], format_datetime(row[4]))
+
+
+async def iter_csv(chunks: Chunks) -> AsyncIterator[str]:
+    """Encodes records as CSV, yielding the header and then one string per chunk."""
     buffer = io.StringIO()
-    # Add 'id' to the fieldnames list to match the data
-    fieldnames = ["id", "sender_name", "sender_email", "unsub_method", "inserted_at"]
-    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDNAMES)
+    yield buffer.getvalue()
+
+    async for chunk in chunks:
+        with timed("serialize"):
+            buffer.seek(0)
+            buffer.truncate(0)
+            writer.writerows(_csv_row(row) for row in chunk)
+            encoded = buffer.getvalue()
+        yield encoded
+
+
+async def iter_ndjson(chunks: Chunks) -> AsyncIterator[bytes]:
+    """Encodes records as newline-delimited JSON, one object per line."""
+    async for chunk in chunks:
+        if chunk:
+            with timed("serialize"):
+                encoded = b"".join(
+                    dumps(record) + b"\n" for record in email_rows_to_dicts(chunk)
+                )
+            yield encoded
+
+
+async def iter_json_array(chunks: Chunks) -> AsyncIterator[bytes]:
+    """Encodes records as a single JSON array without materialising the list."""
+    yield b"["
+    separator = b""
+    async for chunk in chunks:
+        if chunk:
+            # Encode the chunk as one array and drop its brackets
+            with timed("serialize"):
+                encoded = dumps(email_rows_to_dicts(chunk))[1:-1]
+            yield separator + encoded
+            separator = b","
+    yield b"]"
+
+
+def iter_logs_ndjson(chunks: Iterable[List[Sequence[Any]]]) -> Iterator[bytes]:
+    """
+    Encodes LOG_COLUMNS rows as newline-delimited JSON. A plain iterator, so
+    StreamingResponse pulls each chunk (and its database fetch) in a thread.
+    """
+    for chunk in chunks:
+        if chunk:
+            with timed("serialize"):
+                encoded = b"".join(
+                    dumps(record) + b"\n" for record in rows_to_dicts(chunk, LOG_FIELDS)
+                )
+            yield encoded
+
 
-    writer.writeheader()
-    writer.writerows(data_list)
+def _attachment_headers(
+    extension: str, name: str = "unsubscribed_emails_export"
+) -> Dict[str, str]:
+    filename = f"{name}.{extension}"
+    return {"Content-Disposition": f'attachment; filename="{filename}"'}
 
-    # Get the complete CSV as a single string
-    output_string = buffer.getvalue()
 
-    filename = "unsubscribed_emails_export.csv"
-    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+def generate_csv_stream(chunks: Chunks) -> StreamingResponse:
+    """
+    Creates a streaming response for a CSV file. Chunks are encoded as they
+    arrive, so the first bytes go out before the query finishes.
+    """
+    return StreamingResponse(
+        iter_csv(chunks), media_type="text/csv", headers=_attachment_headers("csv")
+    )
+
+
+def generate_json_stream(chunks: Chunks) -> StreamingResponse:
+    """
+    Creates a streaming response for a JSON array export.
+    """
+    return StreamingResponse(
+        iter_json_array(chunks),
+        media_type="application/json",
+        headers=_attachment_headers("json"),
+    )
+
 
-    # Return a normal Response object with the full content
-    return Response(content=output_string, media_type="text/csv", headers=headers)
+def generate_ndjson_stream(chunks: Chunks) -> StreamingResponse:
+    """
+    Creates a streaming response for a newline-delimited JSON export.
+    """
+    return StreamingResponse(
+        iter_ndjson(chunks),
+        media_type="application/x-ndjson",
+        headers=_attachment_headers("ndjson"),
+    )
 
 
-def generate_json_response(data_list: List[Dict[str, Any]]) -> JSONResponse:
+def generate_logs_ndjson_stream(
+    chunks: Iterable[List[Sequence[Any]]],
+) -> StreamingResponse:
     """
-    Creates a JSON response for an export.
+    Creates a streaming response for a newline-delimited JSON logs export.
     """
-    filename = "unsubscribed_emails_export.json"
-    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    return StreamingResponse(
+        iter_logs_ndjson(chunks),
+        media_type="application/x-ndjson",
+        headers=_attachment_headers("ndjson", name="logs_export"),
+    )
+
+
+EXPORT_STREAMS = {
+    "csv": generate_csv_stream,
+    "json": generate_json_stream,
+    "ndjson": generate_ndjson_stream,
+}
 
-    return JSONResponse(content=data_list, headers=headers)
+
+def export_unsubscribed_emails(
+    db: crud.AnySession,
+    *,
+    format: str = "csv",
+    unsub_method: Optional[str] = None,
+    search: Optional[str] = None,
+    domain: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> StreamingResponse:
+    """
+    Streams the filtered records in `format`. Shared by the API and web
+    export routes, so both read from the same server-side cursor in chunks.
+    """
+    chunks = crud.async_iter_unsubscribed_email_chunks(
+        db=db,
+        unsub_method=unsub_method,
+        search=search,
+        domain=domain,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return EXPORT_STREAMS[format](chunks)
@@ -0,0 +1,235 @@
+import asyncio
+import re
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.logging import log_event
+from app.models.log import Log
+
+# On PostgreSQL, migration a8f3c2d6e4b1 range-partitions logs by month on
+# "timestamp". Each month is a table named like logs_p2026_10.
+PARTITION_NAME = re.compile(r"^logs_p(\d{4})_(\d{2})$")
+
+# Rows deleted per statement where logs is not partitioned
+DELETE_CHUNK_SIZE = 5000
+
+# Months this process has already seen writable, so `ensure_partitions`
+# touches the database only the first time a month comes up
+_writable_months: Set[datetime] = set()
+
+
+def month_start(moment: datetime) -> datetime:
+    """The first instant of `moment`'s month, in UTC."""
+    moment = moment.astimezone(timezone.utc)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"logs_p{month.year}_{month.month:02d}"
+
+
+def create_partition_sql(month: datetime) -> str:
+    """DDL for the partition holding `month`, a no-op if it already exists."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF logs "
+        f"FOR VALUES FROM ('{month.isoformat()}') "
+        f"TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def is_partitioned(conn: Connection) -> bool:
+    if conn.dialect.name != "postgresql":
+        return False
+    return bool(
+        conn.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass('logs'))"
+            )
+        )
+    )
+
+
+def _months(names) -> List[datetime]:
+    months = []
+    for name in names:
+        match = PARTITION_NAME.match(name)
+        if match:
+            year, month = int(match.group(1)), int(match.group(2))
+            months.append(datetime(year, month, 1, tzinfo=timezone.utc))
+    return sorted(months)
+
+
+def _partition_months(conn: Connection, detach_pending: bool = False) -> List[datetime]:
+    """Months with a partition attached to logs, or only those mid-detach."""
+    sql = (
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass('logs')"
+    )
+    if detach_pending:
+        sql += " AND i.inhdetachpending"
+    return _months(conn.scalars(text(sql)))
+
+
+def _detached_months(conn: Connection) -> List[datetime]:
+    """Months whose partition was detached from logs but not dropped."""
+    return _months(
+        conn.scalars(
+            text(
+                "SELECT relname FROM pg_class WHERE relkind = 'r' "
+                "AND NOT relispartition AND relname LIKE 'logs_p%'"
+            )
+        )
+    )
+
+
+def create_future_partitions(
+    conn: Connection, now: datetime, months_ahead: int
+) -> List[str]:
+    """Creates this month's partition and the next `months_ahead`; returns new names."""
+    existing = set(_partition_months(conn))
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(month_start(now), offset)
+        if month not in existing:
+            conn.execute(text(create_partition_sql(month)))
+            created.append(partition_name(month))
+    return created
+
+
+def drop_expired_partitions(
+    conn: Connection, now: datetime, retention_months: int
+) -> List[str]:
+    """
+    Drops partitions whose whole month is older than `retention_months`
+    months before the current one. Dropping a table frees its space at once,
+    without the dead rows and vacuum work a DELETE leaves behind.
+
+    Each partition is first detached CONCURRENTLY, which holds only a SHARE
+    UPDATE EXCLUSIVE lock on logs, so log writes and reads carry on; the
+    detached table is then dropped without locking logs at all. `conn` must
+    be in autocommit mode, as DETACH ... CONCURRENTLY (PostgreSQL 14+)
+    cannot run in a transaction block.
+    """
+    cutoff = add_months(month_start(now), -retention_months)
+    pending = set(_partition_months(conn, detach_pending=True))
+    dropped = []
+    for month in _partition_months(conn):
+        if add_months(month, 1) <= cutoff:
+            name = partition_name(month)
+            # A detach interrupted part way through is finished, not restarted
+            mode = "FINALIZE" if month in pending else "CONCURRENTLY"
+            conn.execute(text(f"ALTER TABLE logs DETACH PARTITION {name} {mode}"))
+            conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            dropped.append(name)
+
+    # Partitions an earlier run detached but stopped before dropping
+    for month in _detached_months(conn):
+        if add_months(month, 1) <= cutoff:
+            conn.execute(text(f"DROP TABLE IF EXISTS {partition_name(month)}"))
+            dropped.append(partition_name(month))
+    return dropped
+
+
+def ensure_partitions(engine: Engine, timestamps: Iterable[datetime]) -> List[str]:
+    """
+    Creates any missing partition for `timestamps` before they are inserted,
+    so log writes keep working if maintenance falls behind
+    LOG_PARTITION_MONTHS_AHEAD. Returns the names of new partitions.
+
+    logs deliberately has no DEFAULT partition: PostgreSQL refuses DETACH
+    ... CONCURRENTLY while one exists, and retention relies on it.
+    """
+    months = {month_start(timestamp) for timestamp in timestamps}
+    missing = months - _writable_months
+    if not missing:
+        return []
+
+    with engine.connect() as conn:
+        if is_partitioned(conn):
+            missing -= set(_partition_months(conn))
+        else:
+            missing = set()
+
+    created = []
+    for month in sorted(missing):
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(create_partition_sql(month)))
+            created.append(partition_name(month))
+        except DBAPIError:
+            # Another writer created it first
+            with engine.connect() as conn:
+                if month not in _partition_months(conn):
+                    raise
+    _writable_months.update(months)
+    return created
+
+
+def delete_expired_logs(engine: Engine, before: datetime) -> int:
+    """
+    Retention where logs is not partitioned (SQLite, or PostgreSQL before the
+    migration): deletes rows older than `before` in short transactions.
+    """
+    deleted = 0
+    while True:
+        with engine.begin() as conn:
+            ids = select(Log.id).where(Log.timestamp < before).limit(DELETE_CHUNK_SIZE)
+            result = conn.execute(delete(Log).where(Log.id.in_(ids)))
+        deleted += result.rowcount
+        if result.rowcount < DELETE_CHUNK_SIZE:
+            return deleted
+
+
+def maintain_logs(
+    engine: Engine,
+    *,
+    now: Optional[datetime] = None,
+    months_ahead: int = settings.LOG_PARTITION_MONTHS_AHEAD,
+    retention_months: Optional[int] = settings.LOG_RETENTION_MONTHS,
+) -> Dict[str, object]:
+    """
+    Creates upcoming partitions and applies retention. Log writes rarely wait
+    for a partition to be created, because partitions exist months ahead.
+    """
+    now = now or datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        partitioned = is_partitioned(conn)
+        created = (
+            create_future_partitions(conn, now, months_ahead) if partitioned else []
+        )
+
+    dropped, deleted = [], 0
+    if retention_months is not None:
+        if partitioned:
+            with engine.connect() as conn:
+                conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+                dropped = drop_expired_partitions(conn, now, retention_months)
+        else:
+            cutoff = add_months(month_start(now), -retention_months)
+            deleted = delete_expired_logs(engine, cutoff)
+    return {"created": created, "dropped": dropped, "deleted": deleted}
+
+
+async def log_maintenance_task(engine: Engine, interval_seconds: float):
+    """Background task that runs `maintain_logs` at startup and then periodically."""
+    while True:
+        try:
+            result = await run_in_threadpool(maintain_logs, engine)
+            if result["created"] or result["dropped"] or result["deleted"]:
+                await log_event("logs", "INFO", "Log maintenance completed.", result)
+        except Exception as e:
+            await log_event("logs", "ERROR", f"Log maintenance failed: {e}")
+        await asyncio.sleep(interval_seconds)
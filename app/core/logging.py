@@ -1,36 +1,150 @@
+import asyncio
 import logging
+from collections import deque
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List, Tuple
+from itertools import islice
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    Deque,
+    Iterator,
+    List,
+    Tuple,
+)
 
 import httpx
+from sqlalchemy import Row, Select, func, select, tuple_
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
-from app.core.database import SessionLocal
+from app.core.database import LogSessionLocal
+from app.core.serialization import dumps
 from app.models.log import Log
 
 logger = logging.getLogger(__name__)
 
 
+# Columns the logs export reads, in app.core.serialization.LOG_FIELDS order
+LOG_COLUMNS = (
+    Log.id,
+    Log.timestamp,
+    Log.source_app,
+    Log.log_level,
+    Log.message,
+    Log.details_json,
+    Log.inserted_by,
+)
+
+
+def _logs_conditions(
+    source_app: Optional[str],
+    log_level: Optional[str],
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> list:
+    conditions = []
+    if source_app:
+        conditions.append(Log.source_app == source_app)
+    if log_level:
+        conditions.append(Log.log_level == log_level)
+    # A timestamp range also lets PostgreSQL skip whole monthly partitions
+    if date_from:
+        conditions.append(Log.timestamp >= date_from)
+    if date_to:
+        conditions.append(Log.timestamp <= date_to)
+    return conditions
+
+
+def _logs_statement(
+    source_app: Optional[str],
+    log_level: Optional[str],
+    *,
+    after_id: Optional[int] = None,
+    before_timestamp: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+) -> Select:
+    """
+    Builds the filtered logs query, newest first by (timestamp, id) and
+    seeking past `before_timestamp` (and `before_id`, for logs sharing that
+    timestamp). With `after_id`, it instead returns the logs after that ID,
+    oldest first.
+    """
+    conditions = _logs_conditions(source_app, log_level)
+    if after_id is not None:
+        return select(Log).where(*conditions, Log.id > after_id).order_by(Log.id)
+
+    if before_timestamp is not None and before_id is not None:
+        conditions.append(tuple_(Log.timestamp, Log.id) < (before_timestamp, before_id))
+    elif before_timestamp is not None:
+        conditions.append(Log.timestamp < before_timestamp)
+    return select(Log).where(*conditions).order_by(Log.timestamp.desc(), Log.id.desc())
+
+
 def get_logs(
     db: Session,
     limit: int,
     offset: int,
     source_app: Optional[str],
     log_level: Optional[str],
-) -> Tuple[List[Log], int]:
-    """Retrieves a paginated and filtered list of logs from the database."""
-    query = db.query(Log)
-    if source_app:
-        query = query.filter(Log.source_app == source_app)
-    if log_level:
-        query = query.filter(Log.log_level == log_level)
+    *,
+    after_id: Optional[int] = None,
+    before_timestamp: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    with_total: bool = True,
+) -> Tuple[List[Log], Optional[int]]:
+    """
+    Retrieves a paginated and filtered list of logs from the database.
 
-    total = query.count()
-    logs = query.order_by(Log.timestamp.desc()).limit(limit).offset(offset).all()
+    Pages by `offset`, or by the `after_id` / `before_timestamp` keyset
+    cursors, which cost the same however deep the page. `total` counts every
+    log matching the filters, or is None when `with_total` is false.
+    """
+    total = None
+    if with_total:
+        conditions = _logs_conditions(source_app, log_level)
+        total = db.scalar(select(func.count()).select_from(Log).where(*conditions))
+    stmt = _logs_statement(
+        source_app,
+        log_level,
+        after_id=after_id,
+        before_timestamp=before_timestamp,
+        before_id=before_id,
+    )
+    logs = list(db.scalars(stmt.limit(limit).offset(offset)).all())
     return logs, total
 
 
+def iter_log_chunks(
+    db: Session,
+    *,
+    chunk_size: int = 1000,
+    source_app: Optional[str] = None,
+    log_level: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+) -> Iterator[List[Row]]:
+    """
+    Yields the filtered logs oldest first as lists of LOG_COLUMNS rows,
+    `chunk_size` rows at a time from a server-side cursor, so memory use
+    does not grow with the number of matching logs.
+    """
+    conditions = _logs_conditions(source_app, log_level, date_from, date_to)
+    if after_id is not None:
+        conditions.append(Log.id > after_id)
+    stmt = (
+        select(*LOG_COLUMNS)
+        .where(*conditions)
+        .order_by(Log.timestamp, Log.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    for partition in db.execute(stmt).partitions():
+        yield list(partition)
+
+
 async def _send_discord_alert(original_message: str, error: Exception):
     """(This function remains the same as before)"""
     # ... (code from previous step)
@@ -39,43 +153,40 @@ async def _send_discord_alert(original_message: str, error: Exception):
     # ...
 
 
-async def log_event(
-    source_app: str,
-    log_level: str,
-    message: str,
-    details_json: Optional[Dict[str, Any]] = None,
-    inserted_by: Optional[str] = None,
-) -> Optional[int]:
+def _insert_logs(entries: List[Dict[str, Any]]) -> List[int]:
     """
-    Main logging function. Tries to log to DB, falls back to structured log.
-    Returns the log ID if successful, otherwise None. This function should never raise.
+    Writes log rows in a single transaction. The ORM batches the rows into
+    multi-row INSERT statements. Returns the new log IDs in input order.
     """
-    db = None
+    # Imported here, as log_partitions imports log_event from this module
+    from app.core.log_partitions import ensure_partitions
+
+    db = LogSessionLocal()
     try:
-        db = SessionLocal()
-        log_entry = Log(
-            source_app=source_app,
-            log_level=log_level,
-            message=message,
-            details_json=details_json,
-            inserted_by=inserted_by,
-        )
-        db.add(log_entry)
+        now = datetime.now(timezone.utc)
+        timestamps = [entry.get("timestamp") or now for entry in entries]
+        ensure_partitions(db.get_bind(), timestamps)
+        logs = [Log(**entry) for entry in entries]
+        db.add_all(logs)
         db.commit()
-        db.refresh(log_entry)
-        return log_entry.id
-    except Exception as db_error:
-        # --- Fallback Logic ---
+        return [log.id for log in logs]
+    finally:
+        db.close()
+
+
+async def _handle_write_failure(entries: List[Dict[str, Any]], db_error: Exception):
+    """Falls back to structured logging and a Discord alert. Never raises."""
+    for entry in entries:
         try:
             logger.error(
                 "Database logging failed. The original log is being captured in standard output.",
                 extra={
                     "db_error": str(db_error),
                     "original_log": {
-                        "source_app": source_app,
-                        "log_level": log_level,
-                        "message": message,
-                        "details": details_json,
+                        "source_app": entry["source_app"],
+                        "log_level": entry["log_level"],
+                        "message": entry["message"],
+                        "details": entry["details_json"],
                     },
                 },
             )
@@ -85,15 +196,301 @@ async def log_event(
                 f"CRITICAL: Primary DB and structured logging have both failed. Error: {log_err}"
             )
 
+    try:
+        first = entries[0]
+        original_log_message = (
+            f"{first['log_level']} | {first['source_app']} | {first['message']}"
+        )
+        if len(entries) > 1:
+            original_log_message += f" (and {len(entries) - 1} more)"
+        await _send_discord_alert(original_log_message, db_error)
+    except Exception as alert_err:
+        print(
+            f"CRITICAL: Discord alert failed after DB logging failure. Error: {alert_err}"
+        )
+
+
+async def _write_batch(entries: List[Dict[str, Any]]) -> List[Optional[int]]:
+    """
+    Inserts a batch of log rows off the event loop. Returns their IDs, or
+    None for each entry if the write failed. This function should never raise.
+    """
+    try:
+        return await run_in_threadpool(_insert_logs, entries)
+    except Exception as db_error:
+        await _handle_write_failure(entries, db_error)
+        return [None] * len(entries)
+
+
+class LogQueue:
+    """
+    A bounded in-memory queue of pending log rows. A background writer drains
+    it with multi-row inserts whenever `batch_size` rows are waiting or
+    `flush_interval` seconds have passed, and flushes what is left on stop.
+
+    When the queue is full, `overflow` decides whether the oldest pending
+    event ("drop_oldest") or the incoming one ("drop_newest") is discarded.
+    Every discarded event is counted in `dropped`.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        overflow: str = "drop_oldest",
+    ):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.dropped = 0
+        self.written = 0
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, entry: Dict[str, Any]) -> bool:
+        """Queues a log row. Returns False if the row was dropped."""
+        if len(self._pending) >= self.max_size:
+            self.dropped += 1
+            if self.overflow == "drop_newest":
+                return False
+            self._pending.popleft()
+
+        self._pending.append(entry)
+        if self._wakeup is not None and len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    async def flush(self):
+        """Writes every pending row, one batch at a time."""
+        while self._pending:
+            count = min(self.batch_size, len(self._pending))
+            batch = [self._pending.popleft() for _ in range(count)]
+            ids = await _write_batch(batch)
+            self.written += sum(1 for log_id in ids if log_id is not None)
+
+    def start(self):
+        """Starts the background writer on the running event loop."""
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stops the background writer after flushing every pending row."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        self._wakeup = None
+
+    @property
+    def running(self) -> bool:
+        """Whether a background writer on the running event loop drains the queue."""
+        if self._task is None or self._task.done():
+            return False
         try:
-            original_log_message = f"{log_level} | {source_app} | {message}"
-            await _send_discord_alert(original_log_message, db_error)
-        except Exception as alert_err:
-            print(
-                f"CRITICAL: Discord alert failed after DB logging failure. Error: {alert_err}"
-            )
+            return self._task.get_loop() is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
 
-        return None
-    finally:
-        if db:
-            db.close()
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": len(self._pending),
+            "dropped": self.dropped,
+            "written": self.written,
+        }
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+        await self.flush()
+
+
+log_queue = LogQueue(
+    max_size=settings.LOG_QUEUE_MAX_SIZE,
+    batch_size=settings.LOG_BATCH_SIZE,
+    flush_interval=settings.LOG_FLUSH_INTERVAL_SECONDS,
+    overflow=settings.LOG_QUEUE_OVERFLOW,
+)
+
+
+class LogTail:
+    """
+    A fixed-size ring buffer of the most recent log events, for live tailing.
+    Each event gets an increasing ID; watchers keep only the last ID they
+    have seen, so any number of them share one buffer without touching the
+    database. Once `max_size` events are buffered, the oldest is evicted.
+
+    IDs are local to this process and restart from 1 with it.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.last_id = 0
+        self._events: Deque[Tuple[int, Dict[str, Any]]] = deque(maxlen=max_size)
+        self._waiters: List[asyncio.Future] = []
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def append(self, entry: Dict[str, Any]) -> int:
+        """Buffers a log event, wakes every watcher and returns the event's ID."""
+        self.last_id += 1
+        self._events.append((self.last_id, entry))
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        return self.last_id
+
+    def since(self, last_id: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Returns the buffered (id, entry) pairs after `last_id`, oldest first.
+        Events already evicted are skipped. An ID this process never issued
+        (e.g. from before a restart) returns the whole buffer.
+        """
+        if last_id == self.last_id:
+            return []
+        first_id = self.last_id - len(self._events) + 1
+        start = max(0, last_id + 1 - first_id) if last_id < self.last_id else 0
+        return list(islice(self._events, start, None))
+
+    async def wait(self, last_id: int, timeout: float) -> bool:
+        """
+        Waits up to `timeout` seconds for an event after `last_id`. Returns
+        whether one arrived.
+        """
+        if last_id != self.last_id:
+            return True
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "buffered": len(self._events),
+            "last_id": self.last_id,
+            "watchers": len(self._waiters),
+        }
+
+
+log_tail = LogTail(max_size=settings.LOG_TAIL_BUFFER_SIZE)
+
+
+async def iter_log_tail_events(
+    tail: LogTail,
+    last_id: Optional[int] = None,
+    source_app: Optional[str] = None,
+    log_level: Optional[str] = None,
+    keepalive_seconds: float = settings.LOG_TAIL_KEEPALIVE_SECONDS,
+) -> AsyncIterator[bytes]:
+    """
+    Encodes events from `tail` as Server-Sent Events, starting after
+    `last_id` (or with the next event, if None) and waiting for new ones
+    indefinitely. A comment goes out every `keepalive_seconds` without a
+    matching event, so proxies keep the connection open.
+    """
+    loop = asyncio.get_running_loop()
+    cursor = tail.last_id if last_id is None else last_id
+    last_sent = loop.time()
+    while True:
+        for event_id, entry in tail.since(cursor):
+            cursor = event_id
+            if source_app and entry["source_app"] != source_app:
+                continue
+            if log_level and entry["log_level"] != log_level:
+                continue
+            last_sent = loop.time()
+            yield b"id: %d\nevent: log\ndata: %s\n\n" % (event_id, dumps(entry))
+        # An ID this process never issued (e.g. from before a restart) must
+        # not stay ahead of the tail, or `wait` would return at once forever
+        cursor = min(cursor, tail.last_id)
+
+        remaining = keepalive_seconds - (loop.time() - last_sent)
+        if remaining <= 0:
+            last_sent = loop.time()
+            yield b": keepalive\n\n"
+        else:
+            await tail.wait(cursor, remaining)
+
+
+def _build_entry(
+    source_app: str,
+    log_level: str,
+    message: str,
+    details_json: Optional[Dict[str, Any]],
+    inserted_by: Optional[str],
+) -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc),
+        "source_app": source_app,
+        "log_level": log_level,
+        "message": message,
+        "details_json": details_json,
+        "inserted_by": inserted_by,
+    }
+
+
+async def log_event(
+    source_app: str,
+    log_level: str,
+    message: str,
+    details_json: Optional[Dict[str, Any]] = None,
+    inserted_by: Optional[str] = None,
+) -> None:
+    """
+    Main logging function. Queues the event for the background writer and
+    returns immediately, without waiting on the database. Where no writer is
+    running (scripts, or an app without its lifespan), the event is written
+    directly instead, so it is never left in the queue. This function should
+    never raise.
+    """
+    try:
+        entry = _build_entry(source_app, log_level, message, details_json, inserted_by)
+        log_tail.append(entry)
+        if log_queue.running:
+            log_queue.put(entry)
+            return
+    except Exception as queue_err:
+        print(f"CRITICAL: Could not queue log event. Error: {queue_err}")
+        return
+    await _write_batch([entry])
+
+
+async def write_log(
+    source_app: str,
+    log_level: str,
+    message: str,
+    details_json: Optional[Dict[str, Any]] = None,
+    inserted_by: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Writes a single log event immediately, bypassing the queue. Tries to log
+    to DB, falls back to structured log. Returns the log ID if successful,
+    otherwise None. This function should never raise.
+    """
+    entry = _build_entry(source_app, log_level, message, details_json, inserted_by)
+    log_tail.append(entry)
+    return (await _write_batch([entry]))[0]
@@ -1,47 +1,76 @@
 import logging
 import time
 import uuid
-from typing import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.core.request_context import request_id_cv
+from app.core.config import settings
+from app.core.request_context import request_id_cv, request_timings_cv
+from app.core.timing import RequestTimings
 
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+class LoggingMiddleware:
+    """
+    Tags each request with an X-Request-ID and logs its start and finish.
+    Written as plain ASGI so responses stream through untouched.
+
+    With REQUEST_TIMING_ENABLED, the time spent in SQL, serialization and
+    template rendering is collected per request. The breakdown so far goes
+    out in a Server-Timing header, and the full breakdown (including a
+    streamed body) is logged with "Request finished".
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         request_id = str(uuid.uuid4())
         request_id_cv.set(request_id)
+        timings = RequestTimings() if settings.REQUEST_TIMING_ENABLED else None
+        request_timings_cv.set(timings)
+        method, path = scope["method"], scope["path"]
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+        status_code = None
 
-        logger.info(
-            "Request started",
-            extra={"method": request.method, "path": request.url.path},
-        )
+        logger.info("Request started", extra={"method": method, "path": path})
+
+        async def send_with_request_id(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                if timings is not None:
+                    headers.append(
+                        "Server-Timing",
+                        timings.server_timing(time.perf_counter() - start_time),
+                    )
+            await send(message)
 
         try:
-            response = await call_next(request)
-            process_time = time.time() - start_time
-
-            response.headers["X-Request-ID"] = request_id
-            logger.info(
-                "Request finished",
-                extra={
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "process_time_ms": round(process_time * 1000, 2),
-                },
-            )
-            return response
+            await self.app(scope, receive, send_with_request_id)
         except Exception as e:
             logger.exception(
-                "Unhandled exception",
-                extra={"method": request.method, "path": request.url.path},
+                "Unhandled exception", extra={"method": method, "path": path}
             )
             raise e
+
+        process_time = time.perf_counter() - start_time
+        logger.info(
+            "Request finished",
+            extra={
+                "method": method,
+                "path": path,
+                "status_code": status_code,
+                "process_time_ms": round(process_time * 1000, 2),
+                **(timings.log_fields() if timings is not None else {}),
+            },
+        )
@@ -0,0 +1,40 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or does not match the query."""
+
+    pass
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """
+    Encodes the seek-key values of the last row on a page into an opaque,
+    URL-safe cursor string. Datetimes are stored as ISO 8601 strings.
+    """
+    payload = {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in values.items()
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decodes a cursor produced by `encode_cursor` back into its key values.
+    Raises InvalidCursorError if the cursor cannot be decoded.
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+    if not isinstance(payload, dict):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return payload
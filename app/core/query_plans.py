@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import Select
+from sqlalchemy.engine import Connection
+
+from app.core.logging import _logs_statement
+from app.crud.unsubscribed_email import _count_statement, _list_statement
+
+
+class HotQuery(NamedTuple):
+    table: str
+    build: Callable[[], Select]
+    # Backends the query is expected to be index-backed on; None means all
+    dialects: Optional[Tuple[str, ...]] = None
+
+
+_RANGE_START = datetime(2024, 1, 1)
+_RANGE_END = datetime(2024, 2, 1)
+
+# The filter/sort shapes the list and logs endpoints actually issue
+HOT_QUERIES: Dict[str, HotQuery] = {
+    "list_by_method": HotQuery(
+        "unsubscribed_emails",
+        lambda: _list_statement(limit=20, unsub_method="isp_level"),
+    ),
+    "list_by_date_range": HotQuery(
+        "unsubscribed_emails",
+        lambda: _list_statement(limit=20, date_from=_RANGE_START, date_to=_RANGE_END),
+    ),
+    "list_by_method_and_date_range": HotQuery(
+        "unsubscribed_emails",
+        lambda: _list_statement(
+            limit=20,
+            unsub_method="isp_level",
+            date_from=_RANGE_START,
+            date_to=_RANGE_END,
+        ),
+    ),
+    "list_by_domain": HotQuery(
+        "unsubscribed_emails",
+        lambda: _list_statement(limit=20, domain="example.com"),
+    ),
+    "count_by_domain": HotQuery(
+        "unsubscribed_emails", lambda: _count_statement(domain="example.com")
+    ),
+    "list_search": HotQuery(
+        "unsubscribed_emails",
+        lambda: _list_statement(limit=20, search="newsletter"),
+        dialects=("postgresql",),
+    ),
+    "logs_by_source_app": HotQuery(
+        "logs", lambda: _logs_statement("rate_limiter", None).limit(100)
+    ),
+    "logs_by_log_level": HotQuery(
+        "logs", lambda: _logs_statement(None, "ERROR").limit(100)
+    ),
+}
+
+
+def explain(conn: Connection, stmt: Select) -> List[str]:
+    """Returns the query plan for `stmt` as lines of text."""
+    sql = str(
+        stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    )
+    if conn.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+        return [row[-1] for row in rows]
+    return [row[0] for row in conn.exec_driver_sql(f"EXPLAIN {sql}").all()]
+
+
+def has_sequential_scan(plan: List[str], table: str, dialect_name: str) -> bool:
+    """True if the plan reads every row of `table` instead of using an index."""
+    if dialect_name == "sqlite":
+        # "SCAN t USING INDEX i" walks the whole index, which is no better
+        return any(line.strip().startswith(f"SCAN {table}") for line in plan)
+    return any(f"Seq Scan on {table}" in line for line in plan)
+
+
+def find_sequential_scans(conn: Connection) -> Dict[str, List[str]]:
+    """
+    Explains every hot query and returns the plans of those that fall back
+    to a sequential scan. On PostgreSQL sequential scans are disabled for the
+    check, so a Seq Scan in the plan means no usable index exists.
+    """
+    dialect_name = conn.dialect.name
+    if dialect_name == "postgresql":
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+
+    failures = {}
+    for name, query in HOT_QUERIES.items():
+        if query.dialects and dialect_name not in query.dialects:
+            continue
+        plan = explain(conn, query.build())
+        if has_sequential_scan(plan, query.table, dialect_name):
+            failures[name] = plan
+    return failures
@@ -1,23 +1,153 @@
 import asyncio
+import hashlib
 import time
 from math import ceil
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 from starlette import status
 
 from app.core.config import settings
 from app.core.logging import log_event
+from app.core.rate_limit_backends import CounterKey, RateLimitBackend
+
+
+class _WindowCounter:
+    """
+    Per-identifier state for the sliding window counter. With a shared
+    backend, `remote_*` hold the other workers' counts from the last sync.
+    """
+
+    __slots__ = (
+        "key",
+        "window",
+        "window_start",
+        "previous",
+        "current",
+        "remote_previous",
+        "remote_current",
+    )
+
+    def __init__(self, window: int, window_start: float, key: Optional[str] = None):
+        self.key = key
+        self.window = window
+        self.window_start = window_start
+        self.previous = 0
+        self.current = 0
+        self.remote_previous = 0
+        self.remote_current = 0
+
+    def roll(self, now: float):
+        """Advances the window so that `now` falls inside the current one."""
+        elapsed_windows = int((now - self.window_start) // self.window)
+        if elapsed_windows <= 0:
+            return
+        # Counts older than one full window no longer carry any weight
+        if elapsed_windows == 1:
+            self.previous, self.remote_previous = self.current, self.remote_current
+        else:
+            self.previous, self.remote_previous = 0, 0
+        self.current, self.remote_current = 0, 0
+        self.window_start += elapsed_windows * self.window
+
+    def estimate(self, now: float) -> float:
+        """Requests seen in the last `window` seconds, weighting the previous window."""
+        elapsed = (now - self.window_start) / self.window
+        previous = self.previous + self.remote_previous
+        return previous * (1 - elapsed) + self.current + self.remote_current
+
+    def retry_after(self, now: float, limit: int) -> int:
+        """Seconds until the estimate drops below `limit` again."""
+        elapsed = now - self.window_start
+        previous = self.previous + self.remote_previous
+        current = self.current + self.remote_current
+        if current < limit:
+            # The previous window's weight decays enough before this one ends
+            wait = self.window * (previous + current - limit) / previous - elapsed
+        else:
+            # Wait for this window to roll over and its weight to decay
+            wait = (self.window - elapsed) + (self.window * (current - limit) / current)
+        return max(1, int(ceil(wait)))
+
+    def apply_totals(
+        self, totals: Dict[CounterKey, int], pending: Dict[CounterKey, int]
+    ):
+        """
+        Sets the remote counts from cluster-wide `totals`, which include every
+        local request except those still `pending` a sync.
+        """
+
+        def remote(window_start: float, local: int) -> int:
+            counter_key = (self.key, self.window, window_start)
+            synced = local - pending.get(counter_key, 0)
+            return max(0, totals.get(counter_key, 0) - synced)
+
+        self.remote_current = remote(self.window_start, self.current)
+        self.remote_previous = remote(self.window_start - self.window, self.previous)
+
+    def is_expired(self, now: float) -> bool:
+        return now - self.window_start >= 2 * self.window
 
 
 class RateLimiter:
-    """An async-safe, in-memory, sliding window rate limiter."""
+    """
+    A sliding window counter rate limiter.
 
-    def __init__(self):
-        self._requests: Dict[str, List[float]] = {}
-        self._lock = asyncio.Lock()
+    Each identifier keeps two counters (the current and previous window), so
+    memory and per-request cost are constant regardless of the limit. The
+    check never awaits, so it runs atomically on the event loop and needs no
+    lock. Identifiers are spread across shards, letting `cleanup` expire
+    state one shard at a time without stalling requests.
+
+    Without a backend the limit is per process. With one, windows are
+    aligned to the clock and `sync` periodically pushes local counts to the
+    backend and pulls the other workers' counts, so the limit holds across
+    workers and hosts without a round-trip per request. Each sync pulls only
+    the identifiers this worker has seen. Between syncs a cluster can
+    overshoot by what other workers admitted in that interval, and a worker
+    learns the cluster-wide count of a new identifier at its next sync.
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        backend: Optional[RateLimitBackend] = None,
+        window: int = settings.RATE_LIMIT_TIMESCALE_SECONDS,
+    ):
+        self.backend = backend
+        self._shards: List[Dict[str, _WindowCounter]] = [{} for _ in range(shards)]
+        # Local requests not yet pushed to the backend, and its last totals
+        self._pending: Dict[CounterKey, int] = {}
+        self._totals: Dict[CounterKey, int] = {}
+        # Starts from the configured window, not 0, so a worker that has not
+        # seen an identifier yet still pulls the counts other workers hold
+        self._max_window = window
+
+    def _shard(self, identifier: str) -> Dict[str, _WindowCounter]:
+        return self._shards[hash(identifier) % len(self._shards)]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def reset(self):
+        """Forgets every identifier."""
+        for shard in self._shards:
+            shard.clear()
+        self._pending.clear()
+        self._totals.clear()
+
+    def _new_counter(self, identifier: str, window: int, now: float) -> _WindowCounter:
+        if self.backend is None:
+            return _WindowCounter(window, now)
+
+        # Every worker must agree on window boundaries to share counts
+        self._max_window = max(self._max_window, window)
+        key = hashlib.sha256(identifier.encode()).hexdigest()
+        counter = _WindowCounter(window, int(now // window) * window, key)
+        counter.apply_totals(self._totals, self._pending)
+        return counter
 
     async def is_rate_limited(
         self, identifier: str, limit: int, window: int
@@ -30,34 +160,50 @@ class RateLimiter:
             - An integer representing seconds to wait if rate-limited.
         """
         now = time.time()
-        async with self._lock:
-            timestamps = self._requests.get(identifier, [])
+        shard = self._shard(identifier)
+        counter = shard.get(identifier)
+        if counter is None or counter.window != window:
+            counter = shard[identifier] = self._new_counter(identifier, window, now)
+        else:
+            counter.roll(now)
 
-            # Slide the window: filter out timestamps older than the window
-            relevant_timestamps = [t for t in timestamps if now - t <= window]
+        if counter.estimate(now) >= limit:
+            return counter.retry_after(now, limit)
 
-            if len(relevant_timestamps) >= limit:
-                oldest_request_time = relevant_timestamps[0]
-                retry_after = int(ceil(window - (now - oldest_request_time)))
-                return retry_after
+        counter.current += 1
+        if self.backend is not None:
+            counter_key = (counter.key, window, counter.window_start)
+            self._pending[counter_key] = self._pending.get(counter_key, 0) + 1
+        return None
 
-            relevant_timestamps.append(now)
-            self._requests[identifier] = relevant_timestamps
-            return None
+    async def sync(self):
+        """Pushes local counts to the backend and pulls cluster-wide counts."""
+        deltas, self._pending = self._pending, {}
+        since = int(time.time()) - 2 * self._max_window
+        keys = {counter.key for shard in self._shards for counter in shard.values()}
+        try:
+            totals = await self.backend.sync(deltas, since, keys)
+        except Exception:
+            # Keep the counts for the next attempt
+            for counter_key, count in deltas.items():
+                self._pending[counter_key] = self._pending.get(counter_key, 0) + count
+            raise
+
+        self._totals = totals
+        for shard in self._shards:
+            for counter in shard.values():
+                counter.apply_totals(totals, self._pending)
 
     async def cleanup(self):
-        """Removes old identifiers and timestamps to prevent memory leaks."""
-        now = time.time()
-        window = settings.RATE_LIMIT_TIMESCALE_SECONDS
-        async with self._lock:
-            # Using list(keys()) to avoid issues with modifying dict during iteration
-            for identifier in list(self._requests.keys()):
-                timestamps = self._requests[identifier]
-                self._requests[identifier] = [
-                    t for t in timestamps if now - t <= window
-                ]
-                if not self._requests[identifier]:
-                    del self._requests[identifier]
+        """Removes expired identifiers to prevent memory leaks."""
+        for shard in self._shards:
+            now = time.time()
+            for identifier in [i for i, c in shard.items() if c.is_expired(now)]:
+                del shard[identifier]
+            # Let requests run between shards
+            await asyncio.sleep(0)
+        if self.backend is not None:
+            await self.backend.expire(int(time.time()) - 2 * self._max_window)
         await log_event("rate_limiter", "INFO", "Cleanup task completed.")
 
 
@@ -68,28 +214,42 @@ async def cleanup_task(limiter: RateLimiter, interval_seconds: int = 300):
         await limiter.cleanup()
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+async def sync_task(limiter: RateLimiter, interval_seconds: float):
+    """Background task to periodically sync the limiter with its shared backend."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await limiter.sync()
+        except Exception as e:
+            # Limits fall back to this worker's own counts until the next sync
+            await log_event("rate_limiter", "ERROR", f"Rate limit sync failed: {e}")
+
+
+class RateLimitMiddleware:
     EXCLUDED_PATHS = ["/docs", "/openapi.json"]
 
-    def __init__(self, app, limiter: RateLimiter):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, limiter: RateLimiter):
+        self.app = app
         self.limiter = limiter
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        if not settings.RATE_LIMIT_ENABLED or any(
-            request.url.path.startswith(p) for p in self.EXCLUDED_PATHS
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or not settings.RATE_LIMIT_ENABLED
+            or any(scope["path"].startswith(p) for p in self.EXCLUDED_PATHS)
         ):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Identify by token if present (authenticated), otherwise by IP (anonymous)
-        auth_header = request.headers.get("Authorization")
+        auth_header = Headers(scope=scope).get("Authorization")
         is_authenticated = auth_header and auth_header.lower().startswith("bearer ")
 
         if is_authenticated:
             identifier = auth_header.split(" ")[1]
             limit = settings.RATE_LIMIT_AUTH_REQUESTS
         else:
-            identifier = request.client.host
+            identifier = scope["client"][0]
             limit = settings.RATE_LIMIT_REQUESTS
 
         window = settings.RATE_LIMIT_TIMESCALE_SECONDS
@@ -101,14 +261,16 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 "rate_limiter",
                 "WARNING",
                 "Rate limit exceeded",
-                details_json={"identifier": identifier, "path": request.url.path},
+                details_json={"identifier": identifier, "path": scope["path"]},
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "detail": f"Too many requests. Try again in {retry_after} seconds."
                 },
                 headers={"Retry-After": str(retry_after)},
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
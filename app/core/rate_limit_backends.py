@@ -0,0 +1,131 @@
+from abc import ABC, abstractmethod
+from typing import Collection, Dict, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from starlette.concurrency import run_in_threadpool
+
+from app.models.rate_limit_counter import RateLimitCounter
+
+# (hashed identifier, window length, window start) -> request count
+CounterKey = Tuple[str, int, int]
+
+# Identifiers per statement when pulling or expiring shared counts
+KEY_CHUNK_SIZE = 500
+
+
+class RateLimitBackend(ABC):
+    """
+    Shared storage for rate limit counts, so every worker enforces one
+    cluster-wide limit. The limiter calls it from a background task only;
+    requests never wait on it.
+    """
+
+    @abstractmethod
+    async def sync(
+        self, deltas: Dict[CounterKey, int], since: int, keys: Collection[str]
+    ) -> Dict[CounterKey, int]:
+        """
+        Atomically adds `deltas` to the shared counts, then returns the
+        cluster-wide count of every window of `keys` starting at or after
+        `since`. Only the caller's own keys are read, so the cost follows the
+        identifiers one worker sees, not every client of the cluster.
+        """
+
+    @abstractmethod
+    async def expire(self, before: int) -> int:
+        """Deletes counts for windows starting before `before`. Returns how many."""
+
+
+class DatabaseRateLimitBackend(RateLimitBackend):
+    """Keeps counts in the rate_limit_counters table (PostgreSQL or SQLite)."""
+
+    DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+    def __init__(self, engine: Engine):
+        dialect_name = engine.dialect.name
+        if dialect_name not in self.DIALECT_INSERTS:
+            raise ValueError(
+                f"Rate limit counters are not supported on '{dialect_name}'"
+            )
+        self.engine = engine
+        self._insert = self.DIALECT_INSERTS[dialect_name]
+
+    def _upsert_statement(self):
+        stmt = self._insert(RateLimitCounter)
+        return stmt.on_conflict_do_update(
+            index_elements=["key", "window", "window_start"],
+            set_={"count": RateLimitCounter.count + stmt.excluded["count"]},
+        )
+
+    def _sync(
+        self, deltas: Dict[CounterKey, int], since: int, keys: Collection[str]
+    ) -> Dict[CounterKey, int]:
+        totals = {}
+        keys = sorted(keys)
+        with self.engine.begin() as conn:
+            if deltas:
+                # A stable order keeps concurrent upserts from deadlocking
+                rows = [
+                    {"key": key, "window": window, "window_start": start, "count": n}
+                    for (key, window, start), n in sorted(deltas.items())
+                ]
+                conn.execute(self._upsert_statement(), rows)
+            # Each chunk is a primary key lookup per identifier
+            for first in range(0, len(keys), KEY_CHUNK_SIZE):
+                result = conn.execute(
+                    select(
+                        RateLimitCounter.key,
+                        RateLimitCounter.window,
+                        RateLimitCounter.window_start,
+                        RateLimitCounter.count,
+                    ).where(
+                        RateLimitCounter.key.in_(keys[first : first + KEY_CHUNK_SIZE]),
+                        RateLimitCounter.window_start >= since,
+                    )
+                )
+                totals.update(
+                    ((key, window, start), count)
+                    for key, window, start, count in result
+                )
+        return totals
+
+    def _expire(self, before: int) -> int:
+        with self.engine.connect() as conn:
+            keys = conn.scalars(
+                select(RateLimitCounter.key)
+                .where(RateLimitCounter.window_start < before)
+                .distinct()
+            ).all()
+        # Short transactions, so syncing workers never wait long on the delete
+        deleted = 0
+        for first in range(0, len(keys), KEY_CHUNK_SIZE):
+            with self.engine.begin() as conn:
+                result = conn.execute(
+                    delete(RateLimitCounter).where(
+                        RateLimitCounter.key.in_(keys[first : first + KEY_CHUNK_SIZE]),
+                        RateLimitCounter.window_start < before,
+                    )
+                )
+            deleted += result.rowcount
+        return deleted
+
+    async def sync(
+        self, deltas: Dict[CounterKey, int], since: int, keys: Collection[str]
+    ) -> Dict[CounterKey, int]:
+        return await run_in_threadpool(self._sync, deltas, since, keys)
+
+    async def expire(self, before: int) -> int:
+        return await run_in_threadpool(self._expire, before)
+
+
+def get_rate_limit_backend(name: str) -> Optional[RateLimitBackend]:
+    """Builds the backend selected by RATE_LIMIT_BACKEND; None keeps limits per process."""
+    if name == "memory":
+        return None
+    if name == "database":
+        from app.core.database import engine
+
+        return DatabaseRateLimitBackend(engine)
+    raise ValueError(f"Unknown rate limit backend '{name}'")
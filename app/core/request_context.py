@@ -1,5 +1,13 @@
 from contextvars import ContextVar
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from app.core.timing import RequestTimings
 
 # Context variable to hold the request ID
 request_id_cv: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Timing breakdown of the request with the current request ID, if enabled
+request_timings_cv: ContextVar[Optional["RequestTimings"]] = ContextVar(
+    "request_timings", default=None
+)
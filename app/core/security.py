@@ -1,17 +1,16 @@
 import base64
 import secrets
-from typing import Callable
 
 from fastapi import Depends
-from fastapi.templating import Jinja2Templates
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 from starlette import status
 
 from app.api.deps import verify_token
 from app.core.config import settings
+from app.web.deps import templates
 
 
 # --- API Authentication ---
@@ -42,25 +41,27 @@ def verify_basic_auth(auth_header: str) -> bool:
         return False
 
 
-class BasicAuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
-        # We need a separate templates instance for the middleware
-        self.templates = Jinja2Templates(directory="app/templates")
+class BasicAuthMiddleware:
+    """Requires Basic Authentication for every path under /web/."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        if not request.url.path.startswith("/web/"):
-            return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        auth_header = request.headers.get("Authorization")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not scope["path"].startswith("/web/"):
+            await self.app(scope, receive, send)
+            return
+
+        auth_header = Headers(scope=scope).get("Authorization")
         if not auth_header or not verify_basic_auth(auth_header):
             # Return an HTML response instead of JSON
-            response = self.templates.TemplateResponse(
-                request=request,
+            response = templates.TemplateResponse(
+                request=Request(scope, receive),
                 name="login_required.html",
                 status_code=status.HTTP_401_UNAUTHORIZED,
             )
             response.headers["WWW-Authenticate"] = 'Basic realm="Web UI"'
-            return response
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
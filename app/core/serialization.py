@@ -0,0 +1,44 @@
+from typing import Any, Dict, Iterable, List, Sequence
+
+import orjson
+
+# Column order of the rows the CRUD read path returns (crud.READ_COLUMNS)
+EMAIL_FIELDS = ("id", "sender_name", "sender_email", "unsub_method", "inserted_at")
+
+# Column order of the rows the logs export reads (app.core.logging.LOG_COLUMNS)
+LOG_FIELDS = (
+    "id",
+    "timestamp",
+    "source_app",
+    "log_level",
+    "message",
+    "details_json",
+    "inserted_by",
+)
+
+
+def rows_to_dicts(
+    rows: Iterable[Sequence[Any]], fields: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """
+    Maps column tuples to field dicts. Rows are read straight from the
+    database, so they are trusted and skip pydantic validation.
+    """
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def email_rows_to_dicts(rows: Iterable[Sequence[Any]]) -> List[Dict[str, Any]]:
+    return rows_to_dicts(rows, EMAIL_FIELDS)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encodes `value` as JSON. UTC datetimes end in "Z", matching pydantic's
+    output for the same models.
+    """
+    return orjson.dumps(value, option=orjson.OPT_UTC_Z)
+
+
+def format_datetime(value: Any) -> str:
+    """Formats a datetime exactly as `dumps` does, for non-JSON outputs like CSV."""
+    return dumps(value)[1:-1].decode()
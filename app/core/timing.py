@@ -0,0 +1,82 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.request_context import request_timings_cv
+
+
+class RequestTimings:
+    """
+    Time spent per phase ("db", "serialize", "render", ...) during one
+    request, and how many times each phase ran. The logging middleware
+    creates one per request and reports it in the Server-Timing header and
+    the "Request finished" log.
+    """
+
+    __slots__ = ("durations", "counts")
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, phase: str, seconds: float):
+        self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def server_timing(self, total_seconds: float) -> str:
+        """Formats the phases, then the total, as a Server-Timing header value."""
+        metrics = [
+            f"{phase};dur={seconds * 1000:.2f}"
+            for phase, seconds in self.durations.items()
+        ]
+        metrics.append(f"total;dur={total_seconds * 1000:.2f}")
+        return ", ".join(metrics)
+
+    def log_fields(self) -> Dict[str, float]:
+        """Structured log fields, e.g. {"db_ms": 4.2, "db_count": 3}."""
+        fields = {}
+        for phase, seconds in self.durations.items():
+            fields[f"{phase}_ms"] = round(seconds * 1000, 2)
+            fields[f"{phase}_count"] = self.counts[phase]
+        return fields
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Adds the time spent in the block to the current request's `phase`."""
+    timings = request_timings_cv.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - start)
+
+
+# Every statement on every engine, sync or async, is timed as "db". Outside a
+# timed request the hooks only read the context variable.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if request_timings_cv.get() is not None:
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timings = request_timings_cv.get()
+    start_times = conn.info.get("query_start_times")
+    if timings is not None and start_times:
+        timings.add("db", time.perf_counter() - start_times.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_times"):
+        connection.info["query_start_times"].pop()
@@ -1,72 +1,558 @@
 from datetime import datetime
-from typing import Iterable, Optional
+from typing import (
+    AsyncIterator,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import Row, Select, delete, func, or_, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
 
-from app.models.unsubscribed_email import UnsubscribedEmail
+from app.core.cache import LRUCache, get_table_version
+from app.core.config import settings
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.crud import unsubscribed_email_stats as stats
+from app.models.unsubscribed_email import UnsubscribedEmail, email_domain
 from app.schemas.unsubscribed_email import UnsubscribedEmailCreate
 
+# Either session type can be passed to the async_* functions below
+AnySession = Union[Session, AsyncSession]
+
+# Below this many rows an exact count is cheap enough to always run
+ESTIMATE_MIN_ROWS = 100_000
+
+
+# Read functions return plain rows of these columns rather than ORM objects:
+# no identity map, instance state or attribute instrumentation per row. Rows
+# are tuples in the order app.core.serialization.EMAIL_FIELDS expects, and
+# also allow attribute access (row.sender_email) for templates.
+READ_COLUMNS = (
+    UnsubscribedEmail.id,
+    UnsubscribedEmail.sender_name,
+    UnsubscribedEmail.sender_email,
+    UnsubscribedEmail.unsub_method,
+    UnsubscribedEmail.inserted_at,
+)
+EmailRow = Row[Tuple[int, str, str, str, datetime]]
+
+
+class EmailPage(NamedTuple):
+    items: List[EmailRow]
+    total: Optional[int]
+    total_estimated: bool = False
+
+
+# Rough in-memory cost of a cached row beyond its string columns
+_ROW_OVERHEAD_BYTES = 400
+
+
+def _approximate_size(value) -> int:
+    """Estimates the memory held by a cached page or count."""
+    if not isinstance(value, EmailPage):
+        return 64
+    return 128 + sum(
+        _ROW_OVERHEAD_BYTES
+        + len(item.sender_name or "")
+        + len(item.sender_email or "")
+        + len(item.unsub_method or "")
+        for item in value.items
+    )
+
+
+# Recent list pages and counts, for clients that poll with the same filters.
+# Keys include the table version, so any write through this module
+# invalidates every entry.
+query_cache = LRUCache(
+    max_entries=settings.QUERY_CACHE_MAX_ENTRIES,
+    ttl=settings.QUERY_CACHE_TTL_SECONDS,
+    max_bytes=settings.QUERY_CACHE_MAX_BYTES,
+    size_of=_approximate_size,
+)
+
+
+def _cache_key(kind: str, **params) -> tuple:
+    """
+    Builds a cache key from normalized query parameters and the current
+    table version. Read the key before querying, so a write that lands
+    mid-query leaves the result under an already stale version.
+    """
+    if params.get("search"):
+        # ILIKE is case-insensitive, so case never changes the result
+        params["search"] = params["search"].lower()
+    if params.get("domain"):
+        params["domain"] = email_domain(params["domain"])
+    normalized = tuple(sorted((name, value or None) for name, value in params.items()))
+    return (kind, get_table_version(UnsubscribedEmail.__tablename__), normalized)
+
+
+def normalize_sender_email(email: str) -> str:
+    """The key that identifies a sender: the address, case-insensitively."""
+    return email.strip().lower()
+
+
+# Creates insert with ON CONFLICT DO NOTHING on the lower(sender_email) unique
+# index, so a repeated create (e.g. a client retry) returns the existing row
+# instead of adding a duplicate
+DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+SENDER_KEY = func.lower(UnsubscribedEmail.sender_email)
+
+
+def _insert_statement(db: AnySession):
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name not in DIALECT_INSERTS:
+        raise ValueError(f"Idempotent creates are not supported on '{dialect_name}'")
+    return (
+        DIALECT_INSERTS[dialect_name](UnsubscribedEmail)
+        .on_conflict_do_nothing(index_elements=[SENDER_KEY])
+        .returning(*READ_COLUMNS)
+    )
+
+
+def _existing_statement(sender_keys: Sequence[str]) -> Select:
+    return select(*READ_COLUMNS).where(SENDER_KEY.in_(sender_keys))
+
+
+def _insert_values(email_in: UnsubscribedEmailCreate) -> dict:
+    return {
+        "sender_name": email_in.sender_name,
+        "sender_email": email_in.sender_email,
+        "unsub_method": email_in.unsub_method,
+    }
+
 
 def create_unsubscribed_email(
     db: Session, *, email_in: UnsubscribedEmailCreate
-) -> UnsubscribedEmail:
+) -> Tuple[EmailRow, bool]:
     """
-    Creates a new unsubscribed email record in the database.
+    Creates a new unsubscribed email record in the database, unless one
+    already exists for the same sender. Returns the stored row and whether
+    it was created by this call. New records are added to the stats rollup
+    in the same transaction.
     """
-    db_obj = UnsubscribedEmail(
-        sender_name=email_in.sender_name,
-        sender_email=email_in.sender_email,
-        unsub_method=email_in.unsub_method,
-    )
-    db.add(db_obj)
+    row = db.execute(_insert_statement(db), _insert_values(email_in)).first()
+    created = row is not None
+    if created:
+        stats.apply_increments(db, stats.count_rows([row]))
+    else:
+        sender_key = normalize_sender_email(email_in.sender_email)
+        row = db.execute(_existing_statement([sender_key])).one()
     db.commit()
-    db.refresh(db_obj)
-    return db_obj
+    return row, created
 
 
-def get_unsubscribed_emails(
+def _bulk_insert_chunks(
+    emails_in: Sequence[UnsubscribedEmailCreate], chunk_size: int
+) -> Iterator[List[dict]]:
+    for start in range(0, len(emails_in), chunk_size):
+        yield [
+            _insert_values(email_in)
+            for email_in in emails_in[start : start + chunk_size]
+        ]
+
+
+def _missing_sender_keys(rows: List[dict], inserted: Sequence[EmailRow]) -> List[str]:
+    """Senders in `rows` that conflicted with an existing record."""
+    inserted_keys = {normalize_sender_email(row.sender_email) for row in inserted}
+    return list(
+        {normalize_sender_email(row["sender_email"]) for row in rows} - inserted_keys
+    )
+
+
+def _match_chunk(
+    rows: List[dict], inserted: Sequence[EmailRow], existing: Sequence[EmailRow]
+) -> List[Tuple[EmailRow, bool]]:
+    """
+    Pairs each input row with its stored row and whether it was created.
+    When a sender repeats within the request, only its first row counts as
+    created.
+    """
+    stored = {
+        normalize_sender_email(row.sender_email): (row, False) for row in existing
+    }
+    stored.update(
+        (normalize_sender_email(row.sender_email), (row, True)) for row in inserted
+    )
+    matched = []
+    seen = set()
+    for row in rows:
+        sender_key = normalize_sender_email(row["sender_email"])
+        stored_row, created = stored[sender_key]
+        matched.append((stored_row, created and sender_key not in seen))
+        seen.add(sender_key)
+    return matched
+
+
+def bulk_create_unsubscribed_emails(
     db: Session,
     *,
-    limit: int,
-    offset: int,
+    emails_in: Sequence[UnsubscribedEmailCreate],
+    chunk_size: int = 1000,
+) -> List[Tuple[EmailRow, bool]]:
+    """
+    Inserts many unsubscribed email records in one transaction, using a single
+    multi-row INSERT ... ON CONFLICT DO NOTHING per chunk of `chunk_size`
+    records. Returns a (row, created) pair per record, in the same order as
+    `emails_in`; records for an existing sender return that sender's row.
+    The transaction is rolled back if any chunk fails.
+    """
+    stmt = _insert_statement(db)
+    results = []
+    try:
+        for rows in _bulk_insert_chunks(emails_in, chunk_size):
+            inserted = db.execute(stmt, rows).all()
+            stats.apply_increments(db, stats.count_rows(inserted))
+            existing = []
+            missing = _missing_sender_keys(rows, inserted)
+            if missing:
+                existing = db.execute(_existing_statement(missing)).all()
+            results.extend(_match_chunk(rows, inserted, existing))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return results
+
+
+def _duplicate_ids_statement() -> Select:
+    """Every row but the oldest for each sender."""
+    ranked = select(
+        UnsubscribedEmail.id,
+        func.row_number()
+        .over(partition_by=SENDER_KEY, order_by=UnsubscribedEmail.id)
+        .label("rank"),
+    ).subquery()
+    return select(ranked.c.id).where(ranked.c.rank > 1).order_by(ranked.c.id)
+
+
+def delete_duplicate_unsubscribed_emails(
+    db: Session, *, chunk_size: int = 1000, dry_run: bool = False
+) -> int:
+    """
+    Deletes all but the oldest record for each sender, committing after every
+    chunk of `chunk_size` ids so no transaction holds row locks for long.
+    The stats rollup is decremented in the same transactions.
+    Finding duplicates is a single read that does not block writers.
+    Returns the number of duplicate records found.
+    """
+    duplicate_ids = db.scalars(_duplicate_ids_statement()).all()
+    if dry_run:
+        return len(duplicate_ids)
+    for start in range(0, len(duplicate_ids), chunk_size):
+        chunk = duplicate_ids[start : start + chunk_size]
+        deleted = db.execute(
+            delete(UnsubscribedEmail)
+            .where(UnsubscribedEmail.id.in_(chunk))
+            .returning(*READ_COLUMNS)
+        ).all()
+        stats.apply_increments(db, stats.count_rows(deleted, sign=-1))
+        db.commit()
+    return len(duplicate_ids)
+
+
+def _seek_condition(cursor: str):
+    """
+    Builds the WHERE clause that resumes a listing after the cursor's row.
+
+    Lists seek on id alone, date-filtered ones included: ids follow insert
+    order, and an id compares the same on every backend, whereas SQLite
+    stores inserted_at as text whose format depends on how it was written.
+    Cursors from older pages may also carry inserted_at; it is ignored.
+    """
+    values = decode_cursor(cursor)
+    try:
+        last_id = int(values["id"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    return UnsubscribedEmail.id < last_id
+
+
+def get_next_cursor(items: Sequence[EmailRow], *, limit: int) -> Optional[str]:
+    """
+    Returns the cursor for the page following `items`, or None if `items`
+    was the last page.
+    """
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor({"id": items[-1].id})
+
+
+def _like_pattern(term: str) -> str:
+    """Wraps a search term for a substring ILIKE, escaping LIKE wildcards."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _filter_conditions(
+    *,
     unsub_method: Optional[str] = None,
     search: Optional[str] = None,
+    domain: Optional[str] = None,
     date_from: Optional[datetime] = None,
     date_to: Optional[datetime] = None,
-) -> list[UnsubscribedEmail]:
-    """
-    Retrieves a filtered list of unsubscribed emails with pagination.
-    """
-    query = db.query(UnsubscribedEmail)
-
-    # --- DEBUGGING ---
-    print(f"\nCRUD ARGS: unsub_method={unsub_method}, search={search}\n")
-    # ---
+) -> list:
+    """Builds the WHERE conditions shared by the list, count and export queries."""
+    conditions = []
 
     if unsub_method:
-        query = query.filter(UnsubscribedEmail.unsub_method == unsub_method)
+        conditions.append(UnsubscribedEmail.unsub_method == unsub_method)
+
+    if domain:
+        # Served by the sender_domain index
+        conditions.append(UnsubscribedEmail.sender_domain == email_domain(domain))
 
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
+        # On PostgreSQL the pg_trgm GIN indexes on both columns serve this
+        # ILIKE; other backends fall back to a scan.
+        search_term = _like_pattern(search)
+        conditions.append(
             or_(
-                UnsubscribedEmail.sender_name.ilike(search_term),
-                UnsubscribedEmail.sender_email.ilike(search_term),
+                UnsubscribedEmail.sender_name.ilike(search_term, escape="\\"),
+                UnsubscribedEmail.sender_email.ilike(search_term, escape="\\"),
             )
         )
 
     if date_from:
-        query = query.filter(UnsubscribedEmail.inserted_at >= date_from)
+        conditions.append(UnsubscribedEmail.inserted_at >= date_from)
 
     if date_to:
-        query = query.filter(UnsubscribedEmail.inserted_at <= date_to)
+        conditions.append(UnsubscribedEmail.inserted_at <= date_to)
 
-    return (
-        query.order_by(UnsubscribedEmail.id.desc(), UnsubscribedEmail.id.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    return conditions
+
+
+def _list_statement(
+    *,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    unsub_method: Optional[str] = None,
+    search: Optional[str] = None,
+    domain: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    columns_only: bool = False,
+) -> Select:
+    """
+    Builds the ordered list query, selecting ORM objects or, with
+    `columns_only`, plain READ_COLUMNS rows. Raises InvalidCursorError for a
+    bad cursor.
+    """
+    conditions = _filter_conditions(
+        unsub_method=unsub_method,
+        search=search,
+        domain=domain,
+        date_from=date_from,
+        date_to=date_to,
+    )
+
+    if cursor:
+        conditions.append(_seek_condition(cursor))
+
+    entities = READ_COLUMNS if columns_only else (UnsubscribedEmail,)
+    stmt = select(*entities).where(*conditions).order_by(UnsubscribedEmail.id.desc())
+    if offset:
+        stmt = stmt.offset(offset)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def _count_statement(
+    *,
+    unsub_method: Optional[str] = None,
+    search: Optional[str] = None,
+    domain: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> Select:
+    conditions = _filter_conditions(
+        unsub_method=unsub_method,
+        search=search,
+        domain=domain,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return select(func.count()).select_from(UnsubscribedEmail).where(*conditions)
+
+
+def get_unsubscribed_emails(
+    db: Session,
+    *,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    unsub_method: Optional[str] = None,
+    search: Optional[str] = None,
+    domain: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> List[EmailRow]:
+    """
+    Retrieves a filtered list of unsubscribed emails with pagination, as
+    READ_COLUMNS rows.
+
+    Pages either by `offset` or, when `cursor` is given, by seeking past the
+    row the cursor points at. Raises InvalidCursorError for a bad cursor.
+    """
+    stmt = _list_statement(
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        unsub_method=unsub_method,
+        search=search,
+        domain=domain,
+        date_from=date_from,
+        date_to=date_to,
+        columns_only=True,
+    )
+    return list(db.execute(stmt).all())
+
+
+def _estimated_total(db: Session) -> Optional[int]:
+    """
+    Returns the planner's row estimate for the whole table on PostgreSQL, or
+    None when no estimate is available or the table is small enough that an
+    exact count is cheap.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+
+    estimate = db.scalar(
+        text(
+            "SELECT reltuples::bigint FROM pg_class "
+            "WHERE oid = 'unsubscribed_emails'::regclass"
+        )
+    )
+    if estimate is None or estimate < ESTIMATE_MIN_ROWS:
+        return None
+    return int(estimate)
+
+
+def get_unsubscribed_emails_page(
+    db: Session,
+    *,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total: str = "exact",
+    unsub_method: Optional[str] = None,
+    search: Optional[str] = None,
+    domain: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> EmailPage:
+    """
+    Retrieves a page of unsubscribed emails together with the filtered total.
+
+    `total` is "exact", "estimate" (the planner estimate for large unfiltered
+    tables, exact otherwise) or "none" (no count at all). An exact total for
+    an offset page comes from COUNT(*) OVER() in the same statement as the
+    page; cursor pages need a separate count because the seek condition
+    narrows the window. Results are served from `query_cache` when possible.
+    """
+    kwargs = {
+        "limit": limit,
+        "offset": offset,
+        "cursor": cursor,
+        "total": total,
+        "unsub_method": unsub_method,
+        "search": search,
+        "domain": domain,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+    cache_key = _cache_key("page", **kwargs)
+    page = query_cache.get(cache_key)
+    if page is None:
+        page = _query_unsubscribed_emails_page(db, **kwargs)
+        query_cache.set(cache_key, page)
+    return page
+
+
+def _query_unsubscribed_emails_page(
+    db: Session,
+    *,
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    total: str,
+    unsub_method: Optional[str],
+    search: Optional[str],
+    domain: Optional[str],
+    date_from: Optional[datetime],
+    date_to: Optional[datetime],
+) -> EmailPage:
+    filters = {
+        "unsub_method": unsub_method,
+        "search": search,
+        "domain": domain,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+
+    if total == "estimate" and not any(filters.values()):
+        estimate = _estimated_total(db)
+        if estimate is not None:
+            items = get_unsubscribed_emails(
+                db, limit=limit, offset=offset, cursor=cursor, **filters
+            )
+            return EmailPage(items, estimate, total_estimated=True)
+
+    if total == "none" or cursor:
+        items = get_unsubscribed_emails(
+            db, limit=limit, offset=offset, cursor=cursor, **filters
+        )
+        count = None if total == "none" else count_unsubscribed_emails(db, **filters)
+        return EmailPage(items, count)
+
+    stmt = _list_statement(
+        limit=limit, offset=offset, columns_only=True, **filters
+    ).add_columns(func.count().over().label("total"))
+    rows = db.execute(stmt).all()
+    if rows:
+        count = rows[0].total
+    elif offset:
+        # Paged past the end, so the window had no rows to report a total on
+        count = count_unsubscribed_emails(db, **filters)
+    else:
+        count = 0
+    # The extra total column is ignored by anything reading READ_COLUMNS
+    return EmailPage(list(rows), count)
+
+
+def iter_unsubscribed_email_chunks(
+    db: Session,
+    *,
+    chunk_size: int = 1000,
+    unsub_method: Optional[str] = None,
+    search: Optional[str] = None,
+    domain: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> Iterator[List[EmailRow]]:
+    """
+    Yields every filtered unsubscribed email in list order, as READ_COLUMNS
+    rows in lists of up to `chunk_size` fetched from a server-side cursor,
+    so memory use does not grow with the size of the result.
+    """
+    stmt = _list_statement(
+        unsub_method=unsub_method,
+        search=search,
+        domain=domain,
+        date_from=date_from,
+        date_to=date_to,
+        columns_only=True,
     )
+    result = db.execute(stmt.execution_options(yield_per=chunk_size))
+    for partition in result.partitions():
+        yield list(partition)
 
 
 def count_unsubscribed_emails(
@@ -74,30 +560,299 @@ def count_unsubscribed_emails(
     *,
     unsub_method: Optional[str] = None,
     search: Optional[str] = None,
+    domain: Optional[str] = None,
     date_from: Optional[datetime] = None,
     date_to: Optional[datetime] = None,
 ) -> int:
     """
     Counts the total number of filtered unsubscribed email records.
+    Results are served from `query_cache` when possible.
     """
-    query = db.query(UnsubscribedEmail)
+    filters = {
+        "unsub_method": unsub_method,
+        "search": search,
+        "domain": domain,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+    cache_key = _cache_key("count", **filters)
+    count = query_cache.get(cache_key)
+    if count is None:
+        count = db.scalar(_count_statement(**filters))
+        query_cache.set(cache_key, count)
+    return count
 
-    if unsub_method:
-        query = query.filter(UnsubscribedEmail.unsub_method == unsub_method)
 
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                UnsubscribedEmail.sender_name.ilike(search_term),
-                UnsubscribedEmail.sender_email.ilike(search_term),
+def get_top_domains(
+    db: Session,
+    *,
+    limit: int = 10,
+    unsub_method: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> List[dict]:
+    """
+    Returns the `limit` sender domains with the most records, largest first.
+    Without a date range the counts come from the stats rollup; a date range
+    groups the matching records on the sender_domain column instead.
+    """
+    if date_from is None and date_to is None:
+        return stats.get_domain_totals(db, unsub_method=unsub_method, limit=limit)
+
+    conditions = _filter_conditions(
+        unsub_method=unsub_method, date_from=date_from, date_to=date_to
+    )
+    total = func.count().label("total")
+    rows = db.execute(
+        select(UnsubscribedEmail.sender_domain, total)
+        .where(UnsubscribedEmail.sender_domain.is_not(None), *conditions)
+        .group_by(UnsubscribedEmail.sender_domain)
+        .order_by(total.desc(), UnsubscribedEmail.sender_domain)
+        .limit(limit)
+    ).all()
+    return [{"domain": row.sender_domain, "count": row.total} for row in rows]
+
+
+# --- Async variants ---
+# With an AsyncSession these await the database directly. With a plain
+# Session they run the sync function above in the threadpool, so the
+# caller never blocks the event loop either way.
+
+
+async def async_create_unsubscribed_email(
+    db: AnySession, *, email_in: UnsubscribedEmailCreate
+) -> Tuple[EmailRow, bool]:
+    """
+    Async variant of `create_unsubscribed_email`.
+    """
+    if not isinstance(db, AsyncSession):
+        return await run_in_threadpool(create_unsubscribed_email, db, email_in=email_in)
+
+    row = (await db.execute(_insert_statement(db), _insert_values(email_in))).first()
+    created = row is not None
+    if created:
+        await stats.async_apply_increments(db, stats.count_rows([row]))
+    else:
+        sender_key = normalize_sender_email(email_in.sender_email)
+        row = (await db.execute(_existing_statement([sender_key]))).one()
+    await db.commit()
+    return row, created
+
+
+async def async_bulk_create_unsubscribed_emails(
+    db: AnySession,
+    *,
+    emails_in: Sequence[UnsubscribedEmailCreate],
+    chunk_size: int = 1000,
+) -> List[Tuple[EmailRow, bool]]:
+    """
+    Async variant of `bulk_create_unsubscribed_emails`.
+    """
+    if not isinstance(db, AsyncSession):
+        return await run_in_threadpool(
+            bulk_create_unsubscribed_emails,
+            db,
+            emails_in=emails_in,
+            chunk_size=chunk_size,
+        )
+
+    stmt = _insert_statement(db)
+    results = []
+    try:
+        for rows in _bulk_insert_chunks(emails_in, chunk_size):
+            inserted = (await db.execute(stmt, rows)).all()
+            await stats.async_apply_increments(db, stats.count_rows(inserted))
+            existing = []
+            missing = _missing_sender_keys(rows, inserted)
+            if missing:
+                existing = (await db.execute(_existing_statement(missing))).all()
+            results.extend(_match_chunk(rows, inserted, existing))
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return results
+
+
+async def async_get_unsubscribed_emails(
+    db: AnySession,
+    *,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    unsub_method: Optional[str] = None,
+    search: Optional[str] = None,
+    domain: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> List[EmailRow]:
+    """
+    Async variant of `get_unsubscribed_emails`.
+    """
+    if not isinstance(db, AsyncSession):
+        return await run_in_threadpool(
+            get_unsubscribed_emails,
+            db,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            unsub_method=unsub_method,
+            search=search,
+            domain=domain,
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+    stmt = _list_statement(
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        unsub_method=unsub_method,
+        search=search,
+        domain=domain,
+        date_from=date_from,
+        date_to=date_to,
+        columns_only=True,
+    )
+    return list((await db.execute(stmt)).all())
+
+
+async def async_get_unsubscribed_emails_page(
+    db: AnySession,
+    *,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    total: str = "exact",
+    unsub_method: Optional[str] = None,
+    search: Optional[str] = None,
+    domain: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> EmailPage:
+    """
+    Async variant of `get_unsubscribed_emails_page`. A cache hit returns
+    without leaving the event loop.
+    """
+    kwargs = {
+        "limit": limit,
+        "offset": offset,
+        "cursor": cursor,
+        "total": total,
+        "unsub_method": unsub_method,
+        "search": search,
+        "domain": domain,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+    cache_key = _cache_key("page", **kwargs)
+    page = query_cache.get(cache_key)
+    if page is None:
+        if isinstance(db, AsyncSession):
+            page = await db.run_sync(_query_unsubscribed_emails_page, **kwargs)
+        else:
+            page = await run_in_threadpool(
+                _query_unsubscribed_emails_page, db, **kwargs
             )
+        query_cache.set(cache_key, page)
+    return page
+
+
+async def async_iter_unsubscribed_email_chunks(
+    db: AnySession,
+    *,
+    chunk_size: int = 1000,
+    unsub_method: Optional[str] = None,
+    search: Optional[str] = None,
+    domain: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> AsyncIterator[List[EmailRow]]:
+    """
+    Async variant of `iter_unsubscribed_email_chunks`.
+    """
+    if not isinstance(db, AsyncSession):
+        chunks = iter_unsubscribed_email_chunks(
+            db,
+            chunk_size=chunk_size,
+            unsub_method=unsub_method,
+            search=search,
+            domain=domain,
+            date_from=date_from,
+            date_to=date_to,
         )
+        async for chunk in iterate_in_threadpool(chunks):
+            yield chunk
+        return
 
-    if date_from:
-        query = query.filter(UnsubscribedEmail.inserted_at >= date_from)
+    stmt = _list_statement(
+        unsub_method=unsub_method,
+        search=search,
+        domain=domain,
+        date_from=date_from,
+        date_to=date_to,
+        columns_only=True,
+    )
+    result = await db.stream(stmt.execution_options(yield_per=chunk_size))
+    async for partition in result.partitions():
+        yield list(partition)
 
-    if date_to:
-        query = query.filter(UnsubscribedEmail.inserted_at <= date_to)
 
-    return query.count()
+async def async_count_unsubscribed_emails(
+    db: AnySession,
+    *,
+    unsub_method: Optional[str] = None,
+    search: Optional[str] = None,
+    domain: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> int:
+    """
+    Async variant of `count_unsubscribed_emails`.
+    """
+    if not isinstance(db, AsyncSession):
+        return await run_in_threadpool(
+            count_unsubscribed_emails,
+            db,
+            unsub_method=unsub_method,
+            search=search,
+            domain=domain,
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+    filters = {
+        "unsub_method": unsub_method,
+        "search": search,
+        "domain": domain,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+    cache_key = _cache_key("count", **filters)
+    count = query_cache.get(cache_key)
+    if count is None:
+        count = await db.scalar(_count_statement(**filters))
+        query_cache.set(cache_key, count)
+    return count
+
+
+async def async_get_top_domains(
+    db: AnySession,
+    *,
+    limit: int = 10,
+    unsub_method: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+) -> List[dict]:
+    """
+    Async variant of `get_top_domains`.
+    """
+    kwargs = {
+        "limit": limit,
+        "unsub_method": unsub_method,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(get_top_domains, **kwargs)
+    return await run_in_threadpool(get_top_domains, db, **kwargs)
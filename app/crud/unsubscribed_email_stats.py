@@ -0,0 +1,191 @@
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.models.unsubscribed_email import UnsubscribedEmail, email_domain
+from app.models.unsubscribed_email_stat import UnsubscribedEmailStat
+
+# Rollup kinds; see UnsubscribedEmailStat
+DAY = "day"
+DOMAIN = "domain"
+
+# Count changes keyed by (kind, bucket, unsub_method)
+Increments = Counter[Tuple[str, str, str]]
+
+DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _day_bucket(inserted_at: datetime) -> str:
+    if inserted_at.tzinfo is not None:
+        inserted_at = inserted_at.astimezone(timezone.utc)
+    return inserted_at.date().isoformat()
+
+
+def count_rows(rows: Iterable[Any], sign: int = 1) -> Increments:
+    """
+    Tallies rows with sender_email, unsub_method and inserted_at attributes
+    (e.g. READ_COLUMNS rows) into rollup increments; `sign=-1` for deletes.
+    """
+    increments = Counter()
+    for row in rows:
+        increments[(DAY, _day_bucket(row.inserted_at), row.unsub_method)] += sign
+        increments[(DOMAIN, email_domain(row.sender_email), row.unsub_method)] += sign
+    return increments
+
+
+def _increment_statement(db, increments: Increments):
+    """
+    Builds one multi-row upsert adding `increments` to the rollup, or None
+    if there is nothing to add. Keys are sorted, so concurrent writers lock
+    bucket rows in the same order and cannot deadlock each other.
+    """
+    values = [
+        {"kind": kind, "bucket": bucket, "unsub_method": method, "count": count}
+        for (kind, bucket, method), count in sorted(increments.items())
+        if count
+    ]
+    if not values:
+        return None
+    stmt = DIALECT_INSERTS[db.get_bind().dialect.name](UnsubscribedEmailStat)
+    stmt = stmt.values(values)
+    return stmt.on_conflict_do_update(
+        index_elements=["kind", "bucket", "unsub_method"],
+        set_={"count": UnsubscribedEmailStat.count + stmt.excluded["count"]},
+    )
+
+
+# Buckets emptied by deletes
+_EMPTY_BUCKETS = delete(UnsubscribedEmailStat).where(UnsubscribedEmailStat.count <= 0)
+
+
+def apply_increments(db: Session, increments: Increments):
+    """
+    Adds `increments` to the rollup in the caller's transaction, so the
+    counts commit (or roll back) together with the rows they describe.
+    """
+    stmt = _increment_statement(db, increments)
+    if stmt is not None:
+        db.execute(stmt)
+        if any(count < 0 for count in increments.values()):
+            db.execute(_EMPTY_BUCKETS)
+
+
+async def async_apply_increments(db: AsyncSession, increments: Increments):
+    """
+    Async variant of `apply_increments`.
+    """
+    stmt = _increment_statement(db, increments)
+    if stmt is not None:
+        await db.execute(stmt)
+        if any(count < 0 for count in increments.values()):
+            await db.execute(_EMPTY_BUCKETS)
+
+
+def rebuild_unsubscribed_email_stats(db: Session, *, chunk_size: int = 10_000) -> int:
+    """
+    Recomputes the whole rollup from unsubscribed_emails in one transaction,
+    for backfills and after writes that bypassed this module. On PostgreSQL
+    the rollup is locked against writes (reads continue) until it commits,
+    so creates that land mid-rebuild are counted exactly once. Returns the
+    number of rollup rows written.
+    """
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text("LOCK TABLE unsubscribed_email_stats IN EXCLUSIVE MODE"))
+        db.execute(delete(UnsubscribedEmailStat))
+
+        stmt = select(
+            UnsubscribedEmail.sender_email,
+            UnsubscribedEmail.unsub_method,
+            UnsubscribedEmail.inserted_at,
+        ).execution_options(yield_per=chunk_size)
+        increments = Counter()
+        for partition in db.execute(stmt).partitions():
+            increments.update(count_rows(partition))
+
+        keys = sorted(increments)
+        for start in range(0, len(keys), chunk_size):
+            chunk = Counter(
+                {key: increments[key] for key in keys[start : start + chunk_size]}
+            )
+            db.execute(_increment_statement(db, chunk))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(keys)
+
+
+def get_domain_totals(
+    db: Session, *, unsub_method: Optional[str] = None, limit: int = 50
+) -> List[Dict[str, Any]]:
+    """Returns the `limit` sender domains with the most records, largest first."""
+    stat = UnsubscribedEmailStat
+    conditions = [stat.unsub_method == unsub_method] if unsub_method else []
+    total = func.sum(stat.count).label("total")
+    rows = db.execute(
+        select(stat.bucket, total)
+        .where(stat.kind == DOMAIN, *conditions)
+        .group_by(stat.bucket)
+        .order_by(total.desc(), stat.bucket)
+        .limit(limit)
+    ).all()
+    return [{"domain": row.bucket, "count": row.total} for row in rows]
+
+
+def get_unsubscribed_email_stats(
+    db: Session, *, unsub_method: Optional[str] = None, domains_limit: int = 50
+) -> Dict[str, Any]:
+    """
+    Returns record totals per unsub_method, per UTC day (oldest first) and
+    for the `domains_limit` largest sender domains. Reads only the rollup,
+    so the cost grows with the number of buckets, not with the table.
+    """
+    stat = UnsubscribedEmailStat
+    conditions = [stat.unsub_method == unsub_method] if unsub_method else []
+    total = func.sum(stat.count).label("total")
+
+    by_method = db.execute(
+        select(stat.unsub_method, total)
+        .where(stat.kind == DAY, *conditions)
+        .group_by(stat.unsub_method)
+        .order_by(stat.unsub_method)
+    ).all()
+    by_day = db.execute(
+        select(stat.bucket, total)
+        .where(stat.kind == DAY, *conditions)
+        .group_by(stat.bucket)
+        .order_by(stat.bucket)
+    ).all()
+
+    return {
+        "total": sum(row.total for row in by_method),
+        "by_method": [
+            {"unsub_method": row.unsub_method, "count": row.total} for row in by_method
+        ],
+        "by_day": [{"day": row.bucket, "count": row.total} for row in by_day],
+        "by_domain": get_domain_totals(
+            db, unsub_method=unsub_method, limit=domains_limit
+        ),
+    }
+
+
+async def async_get_unsubscribed_email_stats(
+    db: Union[Session, AsyncSession],
+    *,
+    unsub_method: Optional[str] = None,
+    domains_limit: int = 50,
+) -> Dict[str, Any]:
+    """
+    Async variant of `get_unsubscribed_email_stats`.
+    """
+    kwargs = {"unsub_method": unsub_method, "domains_limit": domains_limit}
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(get_unsubscribed_email_stats, **kwargs)
+    return await run_in_threadpool(get_unsubscribed_email_stats, db, **kwargs)
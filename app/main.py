@@ -7,6 +7,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 
 from app.core import get_db, log_event
+from app.core.database import log_engine
+from app.core.logging import log_queue
+from app.core.log_partitions import log_maintenance_task
 from app.core.middleware.logging_middleware import LoggingMiddleware
 from app.core.logging_config import setup_logging
 from app.core.exceptions import (
@@ -16,20 +19,30 @@ from app.core.exceptions import (
     auth_exception_handler,
 )
 from app.core.security import BasicAuthMiddleware, require_api_auth
-from app.core.rate_limit import RateLimiter, RateLimitMiddleware, cleanup_task
+from app.core.config import settings
+from app.core.rate_limit import (
+    RateLimiter,
+    RateLimitMiddleware,
+    cleanup_task,
+    sync_task,
+)
+from app.core.rate_limit_backends import get_rate_limit_backend
 from app.api.v1.router import router as api_v1_router
 from app.web.router import router as web_router
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-rate_limiter = RateLimiter()
+rate_limiter = RateLimiter(backend=get_rate_limit_backend(settings.RATE_LIMIT_BACKEND))
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_logging()
 
+    # Start the background writer that drains queued log events
+    log_queue.start()
+
     logger.info(
         "Application startup: testing database connection..."
     )  # <-- This will now work
@@ -46,25 +59,43 @@ async def lifespan(app: FastAPI):
         await log_event(
             "api", "CRITICAL", f"Database connection failed on startup: {e}"
         )
+        await log_queue.stop()
         raise DatabaseConnectionError("Could not connect to the database on startup.")
     finally:
         if db:
             db.close()
 
-    # Start the rate limiter cleanup task
-    cleanup_bg_task = asyncio.create_task(cleanup_task(rate_limiter))
+    # Start the rate limiter cleanup task, and its sync task if it has a
+    # shared backend
+    background_tasks = [asyncio.create_task(cleanup_task(rate_limiter))]
+    # Keep logs partitions created ahead of time and apply log retention
+    background_tasks.append(
+        asyncio.create_task(
+            log_maintenance_task(log_engine, settings.LOG_MAINTENANCE_INTERVAL_SECONDS)
+        )
+    )
+    if rate_limiter.backend is not None:
+        background_tasks.append(
+            asyncio.create_task(
+                sync_task(rate_limiter, settings.RATE_LIMIT_SYNC_INTERVAL_SECONDS)
+            )
+        )
 
     yield
 
     logger.info("Application shutdown.")
     await log_event("api", "INFO", "Application shutting down.")
 
-    # Stop the cleanup task
-    cleanup_bg_task.cancel()
-    try:
-        await cleanup_bg_task
-    except asyncio.CancelledError:
-        print("Rate limiter cleanup task cancelled.")
+    # Stop the rate limiter and log maintenance tasks
+    for task in background_tasks:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            print("Background task cancelled.")
+
+    # Flush any log events still waiting in the queue
+    await log_queue.stop()
 
 
 app = FastAPI(
@@ -1,2 +1,4 @@
 from .unsubscribed_email import UnsubscribedEmail
 from .log import Log
+from .rate_limit_counter import RateLimitCounter
+from .unsubscribed_email_stat import UnsubscribedEmailStat
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, text
+from sqlalchemy import Column, Index, Integer, String, TIMESTAMP, text
 from sqlalchemy import JSON
 from sqlalchemy.sql import func
 from app.core.database import Base
 
 
 class Log(Base):
+    """
+    On PostgreSQL, migration a8f3c2d6e4b1 turns this into a table
+    range-partitioned by month on `timestamp`, with (id, timestamp) as its
+    primary key. See app.core.log_partitions.
+    """
+
     __tablename__ = "logs"
 
     id = Column(Integer, primary_key=True, index=True)
@@ -16,3 +22,9 @@ class Log(Base):
     message = Column(String, nullable=False)
     details_json = Column(JSON, nullable=True)
     inserted_by = Column(String, nullable=True)
+
+    __table_args__ = (
+        # Serve the filtered, newest-first log listing
+        Index("ix_logs_source_app_timestamp_id", "source_app", "timestamp", "id"),
+        Index("ix_logs_log_level_timestamp_id", "log_level", "timestamp", "id"),
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import BigInteger, Column, Integer, String
+from app.core.database import Base
+
+
+class RateLimitCounter(Base):
+    """
+    Cluster-wide request counts per identifier and fixed window, shared by
+    every worker when RATE_LIMIT_BACKEND is "database". On PostgreSQL the
+    table is UNLOGGED: losing counts in a crash only resets rate limits.
+    """
+
+    __tablename__ = "rate_limit_counters"
+
+    # SHA-256 of the identifier, so API tokens are never stored
+    key = Column(String(64), primary_key=True)
+    window = Column(Integer, primary_key=True)
+    window_start = Column(BigInteger, primary_key=True)  # Unix seconds
+    count = Column(Integer, nullable=False, default=0)
@@ -1,14 +1,28 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, CheckConstraint
+from sqlalchemy import DDL, Column, Integer, Index, String, TIMESTAMP, CheckConstraint
+from sqlalchemy import event
 from sqlalchemy.sql import func
 from app.core.database import Base
 
 
+def email_domain(email: str) -> str:
+    """The domain part of an email address, lowercased."""
+    return email.rsplit("@", 1)[-1].strip().lower()
+
+
+def _sender_domain_default(context) -> str:
+    return email_domain(context.get_current_parameters()["sender_email"])
+
+
 class UnsubscribedEmail(Base):
     __tablename__ = "unsubscribed_emails"
 
     id = Column(Integer, primary_key=True, index=True)
     sender_name = Column(String, nullable=False)
     sender_email = Column(String, nullable=False, index=True)
+    # Derived from sender_email on every insert made through SQLAlchemy, so
+    # per-domain queries are index lookups instead of ILIKE scans. Nullable
+    # only so rows written by older code during a deploy are still accepted.
+    sender_domain = Column(String, nullable=True, default=_sender_domain_default)
     unsub_method = Column(String, nullable=False)
     inserted_at = Column(
         TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
@@ -18,4 +32,41 @@ class UnsubscribedEmail(Base):
         CheckConstraint(
             "unsub_method IN ('direct_link', 'isp_level')", name="unsub_method_check"
         ),
+        # One row per sender, however the address is cased. Creates use this
+        # as their ON CONFLICT target, so retries return the existing row.
+        Index(
+            "ux_unsubscribed_emails_sender_email_lower",
+            func.lower(sender_email),
+            unique=True,
+        ),
+        # Composite indexes shaped to the list filters and their sort order
+        Index("ix_unsubscribed_emails_unsub_method_id", "unsub_method", "id"),
+        Index("ix_unsubscribed_emails_sender_domain_id", "sender_domain", "id"),
+        Index("ix_unsubscribed_emails_inserted_at_id", "inserted_at", "id"),
+        Index(
+            "ix_unsubscribed_emails_unsub_method_inserted_at_id",
+            "unsub_method",
+            "inserted_at",
+            "id",
+        ),
+        # Trigram indexes serve the ILIKE '%term%' search (PostgreSQL only)
+        Index(
+            "ix_unsubscribed_emails_sender_name_trgm",
+            "sender_name",
+            postgresql_using="gin",
+            postgresql_ops={"sender_name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_unsubscribed_emails_sender_email_trgm",
+            "sender_email",
+            postgresql_using="gin",
+            postgresql_ops={"sender_email": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
+
+
+event.listen(
+    UnsubscribedEmail.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
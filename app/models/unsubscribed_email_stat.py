@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String
+from app.core.database import Base
+
+
+class UnsubscribedEmailStat(Base):
+    """
+    Rollup of unsubscribed email counts, kept in step with
+    unsubscribed_emails by the CRUD write paths in the same transaction.
+    "day" rows count records per UTC day (bucket "YYYY-MM-DD") and "domain"
+    rows per sender domain, each split by unsub_method. See
+    app.crud.unsubscribed_email_stats.
+    """
+
+    __tablename__ = "unsubscribed_email_stats"
+
+    kind = Column(String(16), primary_key=True)
+    bucket = Column(String, primary_key=True)
+    unsub_method = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import List, Literal, Optional
+from datetime import date, datetime
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
@@ -24,6 +24,50 @@ class UnsubscribedEmailResponse(BaseModel):
 
 class UnsubscribedEmailList(BaseModel):
     items: List[UnsubscribedEmailResponse]
-    total: int
+    total: Optional[int]  # None when the request asked for total=none
+    total_estimated: bool = False
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
+
+
+# Per-row outcome of a bulk create request
+class BulkCreateResult(BaseModel):
+    index: int
+    status: Literal["created", "existing", "invalid"]
+    id: Optional[int] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+
+
+class BulkCreateResponse(BaseModel):
+    created: int
+    existing: int = 0  # Rows whose sender was already recorded
+    invalid: int
+    results: List[BulkCreateResult]
+
+
+# Totals read from the stats rollup
+class MethodCount(BaseModel):
+    unsub_method: str
+    count: int
+
+
+class DayCount(BaseModel):
+    day: date
+    count: int
+
+
+class DomainCount(BaseModel):
+    domain: str
+    count: int
+
+
+class UnsubscribedEmailStats(BaseModel):
+    total: int
+    by_method: List[MethodCount]
+    by_day: List[DayCount]
+    by_domain: List[DomainCount]  # Largest first
+
+
+class TopDomains(BaseModel):
+    items: List[DomainCount]  # Largest first
@@ -1,8 +1,11 @@
+import hashlib
 import math
-from typing import Optional, Literal, Union
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import NamedTuple, Optional, Literal, Union
 from urllib.parse import urlencode
 
-from fastapi import APIRouter, Depends, Request, Query
+from fastapi import APIRouter, Depends, Request, Query, Response, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
@@ -10,8 +13,11 @@ from fastapi.templating import Jinja2Templates
 from app.web.deps import get_templates
 
 from app.crud import unsubscribed_email as crud
-from app.core import get_db
-from sqlalchemy.orm import Session
+from app.core.cache import LRUCache, get_table_version
+from app.core.config import settings
+from app.core.database import get_request_db
+from app.core.timing import timed
+from app.models.unsubscribed_email import UnsubscribedEmail
 
 from . import export as export_routes
 
@@ -44,10 +50,50 @@ async def test_web_protected_endpoint():
 ITEMS_PER_PAGE = 20
 
 
+class CachedPage(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: datetime
+
+
+# Rendered list pages, keyed by query parameters and table version
+list_page_cache = LRUCache(
+    max_entries=settings.WEB_CACHE_MAX_ENTRIES, ttl=settings.WEB_CACHE_TTL_SECONDS
+)
+
+
+def _is_not_modified(request: Request, page: CachedPage) -> bool:
+    """Evaluates If-None-Match, or If-Modified-Since when no ETag was sent."""
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        etags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in etags or page.etag in etags
+
+    if_modified_since = request.headers.get("If-Modified-Since")
+    if if_modified_since is None:
+        return False
+    try:
+        return page.last_modified <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def _cached_page_response(request: Request, page: CachedPage) -> Response:
+    headers = {
+        "ETag": page.etag,
+        "Last-Modified": format_datetime(page.last_modified, usegmt=True),
+        # Let browsers keep the page, but revalidate it on every view
+        "Cache-Control": "private, no-cache",
+    }
+    if _is_not_modified(request, page):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return HTMLResponse(content=page.body, headers=headers)
+
+
 @router.get("/unsubscribed")
 async def list_unsubscribed(
     request: Request,
-    db: Session = Depends(get_db),
+    db: crud.AnySession = Depends(get_request_db),
     templates: Jinja2Templates = Depends(get_templates),
     page: int = Query(1, ge=1),
     search: Optional[str] = Query(None, min_length=1, max_length=100),
@@ -55,22 +101,55 @@ async def list_unsubscribed(
         Union[Literal["direct_link", "isp_level"], Literal[""]]
     ] = Query(None),
 ):
-    """Displays the main page for unsubscribed emails with pagination and filters."""
+    """
+    Displays the main page for unsubscribed emails with pagination and filters.
+    Rendered pages are cached until the next write to the table, and served
+    with an ETag and Last-Modified so browsers can revalidate with a 304.
+    """
+    # Read the version before querying, so a write that lands mid-render
+    # leaves this entry under a version that is already stale
+    cache_key = (
+        page,
+        search,
+        unsub_method,
+        get_table_version(UnsubscribedEmail.__tablename__),
+    )
+    cached = list_page_cache.get(cache_key)
+    if cached is None:
+        body = await _render_list_page(
+            db, templates, request, page, search, unsub_method
+        )
+        cached = CachedPage(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            # HTTP dates have one-second resolution
+            last_modified=datetime.now(timezone.utc).replace(microsecond=0),
+        )
+        list_page_cache.set(cache_key, cached)
+    return _cached_page_response(request, cached)
+
+
+async def _render_list_page(
+    db: crud.AnySession,
+    templates: Jinja2Templates,
+    request: Request,
+    page: int,
+    search: Optional[str],
+    unsub_method: Optional[str],
+) -> bytes:
     offset = (page - 1) * ITEMS_PER_PAGE
 
     final_search = None if search == "" else search
     final_unsub_method = None if unsub_method == "" else unsub_method
 
-    items = crud.get_unsubscribed_emails(
+    page_result = await crud.async_get_unsubscribed_emails_page(
         db=db,
         limit=ITEMS_PER_PAGE,
         offset=offset,
         search=final_search,
         unsub_method=final_unsub_method,
     )
-    total_count = crud.count_unsubscribed_emails(
-        db=db, search=final_search, unsub_method=final_unsub_method
-    )
+    items, total_count = page_result.items, page_result.total
 
     total_pages = math.ceil(total_count / ITEMS_PER_PAGE) if total_count > 0 else 1
 
@@ -93,6 +172,7 @@ async def list_unsubscribed(
         "export_url_csv": f"/web/export?{build_query_params({'search': search, 'unsub_method': unsub_method}, {'format': 'csv'})}",
         "export_url_json": f"/web/export?{build_query_params({'search': search, 'unsub_method': unsub_method}, {'format': 'json'})}",
     }
-    return templates.TemplateResponse(
-        request=request, name="unsubscribed_list.html", context=context
-    )
+    with timed("render"):
+        return templates.TemplateResponse(
+            request=request, name="unsubscribed_list.html", context=context
+        ).body
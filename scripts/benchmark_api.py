@@ -0,0 +1,297 @@
+"""
+Runs load scenarios against app.main:app in-process and reports p50/p95/p99
+latency, requests per second and peak RSS, saved as JSON to compare runs.
+
+Usage:
+    python scripts/benchmark_api.py --database-url sqlite:///bench.db --rows 1000000 --output before.json
+    python scripts/benchmark_api.py --database-url postgresql://... --output after.json --compare before.json
+
+The database is seeded with scripts/seed_benchmark_data.py first (topping up
+to --rows). Requests go through the full middleware stack via an in-process
+ASGI transport, so no network time is included. Peak RSS is the process
+high-water mark after each scenario, so it never decreases within a run.
+
+WARNING: this inserts rows. Point it at a scratch database, never at production.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# This is a standalone script, so we need to adjust the path to import from the app
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+API_URL = "/api/v1/unsubscribed_emails/"
+BULK_SIZE = 500
+
+
+class Scenario(NamedTuple):
+    # Builds (method, url, request kwargs) for the i-th request
+    build: Callable[[int], tuple]
+    requests: int
+
+
+def scenarios(rows: int, run_id: str) -> Dict[str, Scenario]:
+    from seed_benchmark_data import SEARCH_WORDS, SPAN_SECONDS, START
+
+    def create(i):
+        payload = {
+            "sender_name": f"Benchmark {i}",
+            "sender_email": f"create-{run_id}-{i}@benchmark.example",
+            "unsub_method": "direct_link",
+        }
+        return "POST", API_URL, {"json": payload}
+
+    def bulk_create(i):
+        payload = [
+            {
+                "sender_name": f"Benchmark {i}-{j}",
+                "sender_email": f"bulk-{run_id}-{i}-{j}@benchmark.example",
+                "unsub_method": "isp_level",
+            }
+            for j in range(BULK_SIZE)
+        ]
+        return "POST", f"{API_URL}bulk", {"json": payload}
+
+    def list_deep_offset(i):
+        offset = random.randrange(rows // 2, max(rows - 100, rows // 2 + 1))
+        return "GET", API_URL, {"params": {"limit": 100, "offset": offset}}
+
+    def search(i):
+        params = {"search": random.choice(SEARCH_WORDS), "limit": 20}
+        return "GET", API_URL, {"params": params}
+
+    def export(i):
+        # A one-week window, so each export is a realistic slice of the table
+        date_from = START + timedelta(seconds=random.randrange(SPAN_SECONDS))
+        params = {
+            "format": "ndjson",
+            "date_from": date_from.isoformat(),
+            "date_to": (date_from + timedelta(days=7)).isoformat(),
+        }
+        return "GET", f"{API_URL}export", {"params": params}
+
+    def logs(i):
+        params = {
+            "limit": 100,
+            "offset": random.randrange(0, max(rows // 10, 1)),
+            "log_level": "ERROR",
+        }
+        return "GET", "/api/v1/logs", {"params": params}
+
+    return {
+        "create": Scenario(create, 500),
+        "bulk_create": Scenario(bulk_create, 20),
+        "list_deep_offset": Scenario(list_deep_offset, 200),
+        "search": Scenario(search, 200),
+        "export": Scenario(export, 50),
+        "logs": Scenario(logs, 200),
+    }
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> dict:
+    cuts = (
+        statistics.quantiles(latencies, n=100, method="inclusive")
+        if len(latencies) > 1
+        else None
+    )
+
+    def percentile(p):
+        return round(cuts[p - 1] if cuts else latencies[0], 2)
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "p50": percentile(50),
+            "p95": percentile(95),
+            "p99": percentile(99),
+            "mean": round(statistics.fmean(latencies), 2),
+            "max": round(max(latencies), 2),
+        },
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+async def run_scenario(
+    client, scenario: Scenario, requests: int, concurrency: int, warmup: int
+) -> dict:
+    for i in range(warmup):
+        method, url, kwargs = scenario.build(-1 - i)
+        await client.request(method, url, **kwargs)
+
+    latencies = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            method, url, kwargs = scenario.build(i)
+            start = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+async def run(args, names: List[str]) -> dict:
+    import httpx
+
+    from app.crud.unsubscribed_email import query_cache
+    from app.main import app
+
+    run_id = uuid.uuid4().hex[:8]
+    selected = {
+        name: scenario
+        for name, scenario in scenarios(args.rows, run_id).items()
+        if name in names
+    }
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {os.environ['API_TOKEN']}"}
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark", headers=headers
+        ) as client:
+            for name, scenario in selected.items():
+                # Each scenario starts with cold query caches
+                query_cache.clear()
+                requests = max(1, int(scenario.requests * args.scale))
+                results[name] = await run_scenario(
+                    client, scenario, requests, args.concurrency, args.warmup
+                )
+                report_line(name, results[name])
+    return results
+
+
+def report_line(name: str, result: dict):
+    latency = result["latency_ms"]
+    print(
+        f"{name:18} {result['rps']:9,.1f} req/s   "
+        f"p50 {latency['p50']:8.2f}  p95 {latency['p95']:8.2f}  "
+        f"p99 {latency['p99']:8.2f} ms   errors {result['errors']:4}   "
+        f"rss {result['peak_rss_mb']:7.1f} MB"
+    )
+
+
+def compare(previous: dict, current: dict):
+    print(f"\n=== Compared with {previous['run'].get('started_at')} ===")
+    for name, result in current["scenarios"].items():
+        before = previous["scenarios"].get(name)
+        if before is None:
+            continue
+        changes = []
+        for label, old, new in (
+            ("rps", before["rps"], result["rps"]),
+            ("p50", before["latency_ms"]["p50"], result["latency_ms"]["p50"]),
+            ("p95", before["latency_ms"]["p95"], result["latency_ms"]["p95"]),
+            ("p99", before["latency_ms"]["p99"], result["latency_ms"]["p99"]),
+        ):
+            change = (new - old) / old * 100 if old else 0.0
+            changes.append(f"{label} {old:g} -> {new:g} ({change:+.0f}%)")
+        print(f"{name:18} " + "   ".join(changes))
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiplies every scenario's requests"
+    )
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument(
+        "--scenarios",
+        help="Comma-separated subset to run (default: all)",
+    )
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="A previous results file to compare against")
+    args = parser.parse_args()
+
+    # The app reads its settings at import time, so configure it first
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("API_TOKEN", "benchmark-token")
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+    from sqlalchemy import create_engine
+
+    from seed_benchmark_data import seed
+
+    engine = create_engine(args.database_url)
+    if not args.skip_seed:
+        random.seed(0)
+        print(f"Seeding up to {args.rows} rows...")
+        seed(engine, args.rows, args.rows)
+    engine.dispose()
+
+    all_names = list(scenarios(args.rows, "").keys())
+    names = args.scenarios.split(",") if args.scenarios else all_names
+    unknown = set(names) - set(all_names)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    print(f"\n{engine.dialect.name}, {args.rows} rows, concurrency {args.concurrency}")
+    results = asyncio.run(run(args, names))
+
+    current = {
+        "run": {
+            "started_at": started_at,
+            "git_commit": git_commit(),
+            "database": engine.dialect.name,
+            "rows": args.rows,
+            "concurrency": args.concurrency,
+            "scale": args.scale,
+            "python": platform.python_version(),
+        },
+        "scenarios": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), current)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Measures request throughput through the full app.main:app middleware stack,
+comparing the pure ASGI middlewares against the previous BaseHTTPMiddleware
+versions of LoggingMiddleware, RateLimitMiddleware and BasicAuthMiddleware.
+
+Usage:
+    python scripts/benchmark_middleware.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import copy
+import logging
+import time
+import uuid
+from typing import Callable
+
+# This is a standalone script, so we need to adjust the path to import from the app
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import httpx
+from fastapi.templating import Jinja2Templates
+from starlette import status
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from app.core.config import settings
+from app.core.middleware.logging_middleware import LoggingMiddleware
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.request_context import request_id_cv
+from app.core.security import BasicAuthMiddleware, verify_basic_auth
+from app.main import app
+
+logger = logging.getLogger("app.core.middleware.logging_middleware")
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = str(uuid.uuid4())
+        request_id_cv.set(request_id)
+        start_time = time.time()
+        logger.info(
+            "Request started",
+            extra={"method": request.method, "path": request.url.path},
+        )
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        logger.info(
+            "Request finished",
+            extra={
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": response.status_code,
+                "process_time_ms": round((time.time() - start_time) * 1000, 2),
+            },
+        )
+        return response
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, limiter):
+        super().__init__(app)
+        self.limiter = limiter
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        auth_header = request.headers.get("Authorization")
+        if auth_header and auth_header.lower().startswith("bearer "):
+            identifier = auth_header.split(" ")[1]
+            limit = settings.RATE_LIMIT_AUTH_REQUESTS
+        else:
+            identifier = request.client.host
+            limit = settings.RATE_LIMIT_REQUESTS
+        retry_after = await self.limiter.is_rate_limited(
+            identifier, limit, settings.RATE_LIMIT_TIMESCALE_SECONDS
+        )
+        if retry_after is not None:
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"detail": "Too many requests."},
+            )
+        return await call_next(request)
+
+
+class LegacyBasicAuthMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app):
+        super().__init__(app)
+        self.templates = Jinja2Templates(directory="app/templates")
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        if not request.url.path.startswith("/web/"):
+            return await call_next(request)
+        auth_header = request.headers.get("Authorization")
+        if not auth_header or not verify_basic_auth(auth_header):
+            return self.templates.TemplateResponse(
+                request=request,
+                name="login_required.html",
+                status_code=status.HTTP_401_UNAUTHORIZED,
+            )
+        return await call_next(request)
+
+
+LEGACY_CLASSES = {
+    LoggingMiddleware: LegacyLoggingMiddleware,
+    RateLimitMiddleware: LegacyRateLimitMiddleware,
+    BasicAuthMiddleware: LegacyBasicAuthMiddleware,
+}
+
+
+def build_legacy_app():
+    """A copy of app.main:app with the same routes and the old middleware classes."""
+    legacy = copy.copy(app)
+    legacy.user_middleware = [
+        Middleware(LEGACY_CLASSES.get(m.cls, m.cls), *m.args, **m.kwargs)
+        for m in app.user_middleware
+    ]
+    legacy.middleware_stack = None
+    return legacy
+
+
+async def measure(target, path: str, requests: int, concurrency: int) -> float:
+    """Returns requests/second for `requests` GETs of `path`."""
+    transport = httpx.ASGITransport(app=target)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        await c.get(path)  # Build the middleware stack before timing
+        per_worker = requests // concurrency
+
+        async def worker():
+            for _ in range(per_worker):
+                response = await c.get(path)
+                assert response.status_code < 500, response.text
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return per_worker * concurrency / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--path", default="/")
+    args = parser.parse_args()
+
+    # Measure the middleware, not 429s or log output
+    settings.RATE_LIMIT_REQUESTS = 10**9
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = {}
+    for name, target in (
+        ("BaseHTTPMiddleware", build_legacy_app()),
+        ("pure ASGI", app),
+    ):
+        results[name] = await measure(
+            target, args.path, args.requests, args.concurrency
+        )
+
+    print(f"{args.requests} requests to {args.path}, concurrency {args.concurrency}\n")
+    for name, rps in results.items():
+        print(f"{name:20} {rps:10,.0f} req/s   {1e6 / rps:8.1f} us/request")
+    saved = 1e6 / results["BaseHTTPMiddleware"] - 1e6 / results["pure ASGI"]
+    print(f"\nOverhead saved: {saved:.1f} us per request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
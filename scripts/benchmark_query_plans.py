@@ -0,0 +1,111 @@
+"""
+Shows query plans and timings for the hot list/logs queries before and after
+the composite filter indexes, on a seeded dataset.
+
+Usage:
+    python scripts/benchmark_query_plans.py --database-url postgresql://... --rows 1000000
+
+WARNING: this drops and recreates indexes and inserts rows. Point it at a
+scratch database, never at production.
+"""
+
+import argparse
+import statistics
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine
+
+from app.core.database import Base
+from app.core.query_plans import HOT_QUERIES, explain, has_sequential_scan
+from app.models import Log, UnsubscribedEmail
+from seed_benchmark_data import seed
+
+# The indexes added by migration b4c1e7d20a9f
+COMPOSITE_INDEXES = [
+    index
+    for table in (UnsubscribedEmail.__table__, Log.__table__)
+    for index in table.indexes
+    if index.name
+    in {
+        "ix_unsubscribed_emails_unsub_method_id",
+        "ix_unsubscribed_emails_inserted_at_id",
+        "ix_unsubscribed_emails_unsub_method_inserted_at_id",
+        "ix_logs_source_app_timestamp_id",
+        "ix_logs_log_level_timestamp_id",
+    }
+]
+
+
+def analyze(engine):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+
+def run_queries(engine, repeats: int) -> dict:
+    """Explains and times every hot query; returns {name: (plan, median_ms)}."""
+    results = {}
+    with engine.connect() as conn:
+        for name, query in HOT_QUERIES.items():
+            if query.dialects and engine.dialect.name not in query.dialects:
+                continue
+            stmt = query.build()
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                conn.execute(stmt).all()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = (explain(conn, stmt), statistics.median(timings))
+    return results
+
+
+def report(label: str, results: dict, dialect_name: str):
+    print(f"\n=== {label} ===")
+    for name, (plan, median_ms) in results.items():
+        table = HOT_QUERIES[name].table
+        flag = "SEQ SCAN" if has_sequential_scan(plan, table, dialect_name) else "index"
+        print(f"\n{name}: {median_ms:.2f} ms median [{flag}]")
+        for line in plan:
+            print(f"    {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--skip-seed", action="store_true", help="Reuse rows already in the database"
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(engine)
+
+    if not args.skip_seed:
+        print(f"Seeding up to {args.rows} rows per table...")
+        seed(engine, args.rows, args.rows)
+
+    for index in COMPOSITE_INDEXES:
+        index.drop(engine, checkfirst=True)
+    analyze(engine)
+    before = run_queries(engine, args.repeats)
+
+    for index in COMPOSITE_INDEXES:
+        index.create(engine, checkfirst=True)
+    analyze(engine)
+    after = run_queries(engine, args.repeats)
+
+    report("Before composite indexes", before, engine.dialect.name)
+    report("After composite indexes", after, engine.dialect.name)
+
+    print("\n=== Summary (median ms) ===")
+    for name in after:
+        print(f"{name:32} {before[name][1]:10.2f} -> {after[name][1]:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compares the sliding window counter rate limiter against the previous
+timestamp-list implementation under many concurrent identifiers.
+
+Usage:
+    python scripts/benchmark_rate_limiter.py --identifiers 10000 --requests 200000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from math import ceil
+from typing import Dict, List, Optional
+
+# This is a standalone script, so we need to adjust the path to import from the app
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.rate_limit import RateLimiter
+
+
+class LegacyRateLimiter:
+    """The previous implementation: one global lock and a timestamp list per key."""
+
+    def __init__(self):
+        self._requests: Dict[str, List[float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def is_rate_limited(
+        self, identifier: str, limit: int, window: int
+    ) -> Optional[int]:
+        now = time.time()
+        async with self._lock:
+            timestamps = self._requests.get(identifier, [])
+            relevant_timestamps = [t for t in timestamps if now - t <= window]
+            if len(relevant_timestamps) >= limit:
+                return int(ceil(window - (now - relevant_timestamps[0])))
+            relevant_timestamps.append(now)
+            self._requests[identifier] = relevant_timestamps
+            return None
+
+    async def cleanup(self):
+        now = time.time()
+        async with self._lock:
+            for identifier in list(self._requests.keys()):
+                self._requests[identifier] = [
+                    t for t in self._requests[identifier] if now - t <= 60
+                ]
+                if not self._requests[identifier]:
+                    del self._requests[identifier]
+
+
+async def run(limiter, identifiers: List[str], requests: int, concurrency: int, limit):
+    """Issues `requests` checks from `concurrency` workers; returns checks/second."""
+    per_worker = requests // concurrency
+
+    async def worker():
+        for _ in range(per_worker):
+            await limiter.is_rate_limited(random.choice(identifiers), limit, 60)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    cleanup_start = time.perf_counter()
+    await limiter.cleanup()
+    cleanup_ms = (time.perf_counter() - cleanup_start) * 1000
+    return per_worker * concurrency / elapsed, cleanup_ms
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--identifiers", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    # Fewer identifiers means longer timestamp lists for the legacy limiter
+    identifiers = [f"token-{i}" for i in range(args.identifiers)]
+
+    print(
+        f"{args.requests} checks across {args.identifiers} identifiers, "
+        f"{args.concurrency} concurrent workers, limit {args.limit}/60s\n"
+    )
+    for name, limiter in (
+        ("legacy (timestamp lists)", LegacyRateLimiter()),
+        ("sliding window counter", RateLimiter()),
+    ):
+        random.seed(0)
+        throughput, cleanup_ms = await run(
+            limiter, identifiers, args.requests, args.concurrency, args.limit
+        )
+        print(f"{name:28} {throughput:12,.0f} checks/s   cleanup {cleanup_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
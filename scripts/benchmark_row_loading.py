@@ -0,0 +1,94 @@
+"""
+Compares loading full ORM objects against READ_COLUMNS rows for a list page
+and for a whole-table export, reporting time and peak memory allocated.
+
+Usage:
+    python scripts/benchmark_row_loading.py --database-url sqlite:///bench.db --rows 100000
+
+WARNING: this inserts rows. Point it at a scratch database.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+# This is a standalone script, so we need to adjust the path to import from the app
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.crud.unsubscribed_email import READ_COLUMNS, _list_statement
+from seed_benchmark_data import seed
+
+
+def touch(row, columns_only: bool):
+    """Reads every field, as serialization would."""
+    if columns_only:
+        return tuple(row)
+    item = row[0]
+    return tuple(getattr(item, column.key) for column in READ_COLUMNS)
+
+
+def list_pages(session: Session, columns_only: bool, pages: int, page_size: int):
+    stmt = _list_statement(limit=page_size, columns_only=columns_only)
+    for _ in range(pages):
+        for row in session.execute(stmt).all():
+            touch(row, columns_only)
+        session.expunge_all()
+
+
+def export_all(session: Session, columns_only: bool, chunk_size: int = 1000):
+    stmt = _list_statement(columns_only=columns_only).execution_options(
+        yield_per=chunk_size
+    )
+    for partition in session.execute(stmt).partitions():
+        # yield_per holds objects weakly, so each partition can be collected
+        for row in partition:
+            touch(row, columns_only)
+
+
+def measure(engine, scenario, columns_only: bool) -> tuple:
+    with Session(engine) as session:
+        tracemalloc.start()
+        start = time.perf_counter()
+        scenario(session, columns_only)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    print(f"Seeding up to {args.rows} rows...")
+    seed(engine, args.rows, logs=0)
+
+    scenarios = {
+        f"{args.pages} list pages of {args.page_size}": lambda s, c: list_pages(
+            s, c, args.pages, args.page_size
+        ),
+        "full export": export_all,
+    }
+    # tracemalloc slows both sides equally, so compare ratios
+    for name, scenario in scenarios.items():
+        print(f"\n{name}")
+        for label, columns_only in (("ORM objects", False), ("column rows", True)):
+            elapsed, peak = measure(engine, scenario, columns_only)
+            print(
+                f"  {label:12} {elapsed * 1000:10.1f} ms   peak {peak / 1024:10.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compares rows/second for the list/export read path: ORM objects validated
+through UnsubscribedEmailResponse and json.dumps, against READ_COLUMNS tuples
+encoded with the orjson serializer.
+
+Usage:
+    python scripts/benchmark_serialization.py --database-url sqlite:///bench.db --rows 100000
+
+WARNING: this inserts rows. Point it at a scratch database.
+"""
+
+import argparse
+import json
+import time
+
+# This is a standalone script, so we need to adjust the path to import from the app
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.core.serialization import dumps, email_rows_to_dicts
+from app.crud.unsubscribed_email import READ_COLUMNS
+from app.models import UnsubscribedEmail
+from seed_benchmark_data import seed
+from app.schemas.unsubscribed_email import UnsubscribedEmailResponse
+
+
+def orm_and_pydantic(session: Session, limit: int) -> bytes:
+    items = session.scalars(
+        select(UnsubscribedEmail).order_by(UnsubscribedEmail.id.desc()).limit(limit)
+    ).all()
+    payload = [
+        UnsubscribedEmailResponse.model_validate(item).model_dump(mode="json")
+        for item in items
+    ]
+    return json.dumps(payload).encode()
+
+
+def columns_and_orjson(session: Session, limit: int) -> bytes:
+    rows = session.execute(
+        select(*READ_COLUMNS).order_by(UnsubscribedEmail.id.desc()).limit(limit)
+    ).all()
+    return dumps(email_rows_to_dicts(rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    print(f"Seeding up to {args.rows} rows...")
+    seed(engine, args.rows, logs=0)
+
+    print(f"Fetching and encoding {args.rows} rows, best of {args.repeats}\n")
+    results = {}
+    for name, encode in (
+        ("ORM + pydantic + json", orm_and_pydantic),
+        ("columns + orjson", columns_and_orjson),
+    ):
+        timings = []
+        for _ in range(args.repeats):
+            # A fresh session per run, so the identity map starts empty
+            with Session(engine) as session:
+                start = time.perf_counter()
+                encode(session, args.rows)
+                timings.append(time.perf_counter() - start)
+        results[name] = args.rows / min(timings)
+        print(f"{name:24} {results[name]:12,.0f} rows/s")
+
+    speedup = results["columns + orjson"] / results["ORM + pydantic + json"]
+    print(f"\nSpeedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from app.core.database import SessionLocal
+from app.crud.unsubscribed_email_stats import rebuild_unsubscribed_email_stats
 from app.models import UnsubscribedEmail
 
 
@@ -34,6 +35,10 @@ async def main():
 
     db.add_all(records)
     db.commit()
+
+    # The rows above bypass the CRUD layer, which keeps the stats rollup current
+    print("Rebuilding the stats rollup...")
+    rebuild_unsubscribed_email_stats(db)
     db.close()
     print("Done. 55 records created.")
 
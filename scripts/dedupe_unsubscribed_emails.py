@@ -0,0 +1,46 @@
+"""
+Deletes duplicate unsubscribed email records, keeping the oldest record for
+each sender (compared case-insensitively), in small committed chunks.
+
+Usage:
+    python scripts/dedupe_unsubscribed_emails.py --dry-run
+    python scripts/dedupe_unsubscribed_emails.py --chunk-size 1000
+
+Run it before deploying migration e5d1a7c3b9f2 on a large table, so the
+migration's own dedupe pass has little left to do.
+"""
+
+import argparse
+
+# This is a standalone script, so we need to adjust the path to import from the app
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.database import SessionLocal
+from app.crud.unsubscribed_email import delete_duplicate_unsubscribed_emails
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Only count the duplicates"
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        found = delete_duplicate_unsubscribed_emails(
+            db, chunk_size=args.chunk_size, dry_run=args.dry_run
+        )
+    finally:
+        db.close()
+
+    action = "Found" if args.dry_run else "Deleted"
+    print(f"{action} {found} duplicate records.")
+
+
+if __name__ == "__main__":
+    main()
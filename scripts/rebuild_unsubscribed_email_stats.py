@@ -0,0 +1,42 @@
+"""
+Rebuilds the unsubscribed email stats rollup from the records table.
+
+Usage:
+    python scripts/rebuild_unsubscribed_email_stats.py
+    python scripts/rebuild_unsubscribed_email_stats.py --chunk-size 50000
+
+Run it after loading rows without going through the API (e.g. a restore or
+a bulk import in SQL). Creates wait until the rebuild commits.
+"""
+
+import argparse
+import time
+
+# This is a standalone script, so we need to adjust the path to import from the app
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.database import SessionLocal
+from app.crud.unsubscribed_email_stats import rebuild_unsubscribed_email_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    db = SessionLocal()
+    try:
+        buckets = rebuild_unsubscribed_email_stats(db, chunk_size=args.chunk_size)
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Rebuilt {buckets} stats buckets in {elapsed:.1f}s.")
+
+
+if __name__ == "__main__":
+    main()
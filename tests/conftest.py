@@ -1,12 +1,16 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
-from app.main import app
+from app.main import app, rate_limiter
 from app.models import UnsubscribedEmail
-from app.core.database import Base, get_db
+from app.core.database import Base, get_async_database_url, get_db, get_request_db
+from app.crud.unsubscribed_email import query_cache
+from app.web.router import list_page_cache
 
 # Use the test database URL from our settings
 SQLALCHEMY_DATABASE_URL = settings.TEST_DATABASE_URL
@@ -19,6 +23,15 @@ engine = create_engine(SQLALCHEMY_DATABASE_URL)
 # Create a new SessionLocal class for testing that uses the test engine
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the same test database. NullPool keeps connections from
+# being shared between the event loops that pytest and TestClient run on.
+async_engine = create_async_engine(
+    get_async_database_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 @pytest.fixture(scope="function")
 def db_session() -> Session:
@@ -30,6 +43,9 @@ def db_session() -> Session:
     # Before the test runs, drop all tables and recreate them
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    # Cached pages and queries would outlive the data they came from
+    list_page_cache.clear()
+    query_cache.clear()
 
     db = TestingSessionLocal()
     try:
@@ -52,8 +68,12 @@ def test_client(db_session: Session) -> TestClient:
         finally:
             db_session.close()
 
+    # Each test starts with a fresh rate limit budget
+    rate_limiter.reset()
+
     # Apply the override
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_request_db] = override_get_db
 
     # Yield the configured client
     yield TestClient(app)
@@ -62,6 +82,25 @@ def test_client(db_session: Session) -> TestClient:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="function")
+def async_test_client(db_session: Session) -> TestClient:
+    """
+    Like `test_client`, but the request path gets an AsyncSession on the
+    test database, as it does when DATABASE_ASYNC is enabled.
+    """
+
+    async def override_get_request_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_request_db] = override_get_request_db
+
+    yield TestClient(app)
+
+    app.dependency_overrides.clear()
+
+
 @pytest.fixture(scope="function")
 def populated_db_for_web(db_session: Session):
     """Fixture to create 50 records for pagination testing."""
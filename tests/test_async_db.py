@@ -0,0 +1,113 @@
+import csv
+import io
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_async_database_url
+from app.crud import unsubscribed_email as crud
+from app.models import UnsubscribedEmail
+from app.schemas.unsubscribed_email import UnsubscribedEmailCreate
+
+from .conftest import TestingAsyncSessionLocal
+from .test_unsubscribed_emails_filter import diverse_db
+
+API_URL = "/api/v1/unsubscribed_emails/"
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.API_TOKEN}"}
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("postgresql://u:p@localhost/db", "postgresql+asyncpg://u:p@localhost/db"),
+        ("postgresql+psycopg2://u:p@h/db", "postgresql+asyncpg://u:p@h/db"),
+        ("sqlite:///./app.db", "sqlite+aiosqlite:///./app.db"),
+    ],
+)
+def test_get_async_database_url(url, expected):
+    rendered = get_async_database_url(url).render_as_string(hide_password=False)
+    assert rendered == expected
+
+
+def test_get_async_database_url_unsupported_backend():
+    with pytest.raises(ValueError):
+        get_async_database_url("mysql://u:p@localhost/db")
+
+
+@pytest.mark.asyncio
+async def test_async_crud_matches_sync_crud(db_session: Session, diverse_db):
+    filters = {"unsub_method": "direct_link"}
+    expected = [
+        item.id
+        for item in crud.get_unsubscribed_emails(db_session, limit=10, **filters)
+    ]
+
+    async with TestingAsyncSessionLocal() as db:
+        items = await crud.async_get_unsubscribed_emails(db, limit=10, **filters)
+        total = await crud.async_count_unsubscribed_emails(db, **filters)
+        chunks = [
+            chunk
+            async for chunk in crud.async_iter_unsubscribed_email_chunks(
+                db, chunk_size=1, **filters
+            )
+        ]
+
+    assert [item.id for item in items] == expected
+    assert total == 2
+    assert [[item.id for item in chunk] for chunk in chunks] == [[3], [1]]
+
+
+@pytest.mark.asyncio
+async def test_async_crud_with_sync_session(db_session: Session, diverse_db):
+    """The async_* functions also accept a sync Session (DATABASE_ASYNC off)."""
+    items = await crud.async_get_unsubscribed_emails(db_session, limit=10)
+    total = await crud.async_count_unsubscribed_emails(db_session)
+    assert [item.sender_name for item in items][0] == "Cool Gadgets"
+    assert total == 3
+
+
+@pytest.mark.asyncio
+async def test_async_create(db_session: Session):
+    email_in = UnsubscribedEmailCreate(
+        sender_name="Async Sender",
+        sender_email="async@example.com",
+        unsub_method="isp_level",
+    )
+    async with TestingAsyncSessionLocal() as db:
+        row, created = await crud.async_create_unsubscribed_email(db, email_in=email_in)
+        bulk = await crud.async_bulk_create_unsubscribed_emails(
+            db, emails_in=[email_in, email_in]
+        )
+
+    assert row.id is not None and created
+    # The sender already exists, so the bulk create returns its row twice
+    assert bulk == [(row, False), (row, False)]
+    assert db_session.query(UnsubscribedEmail).count() == 1
+
+
+def test_async_session_endpoints(async_test_client: TestClient, diverse_db):
+    response = async_test_client.get(API_URL, headers=AUTH_HEADERS, params={"limit": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 3
+    assert data["items"][0]["sender_name"] == "Cool Gadgets"
+
+    response = async_test_client.post(
+        API_URL,
+        headers=AUTH_HEADERS,
+        json={
+            "sender_name": "Async API",
+            "sender_email": "async-api@example.com",
+            "unsub_method": "direct_link",
+        },
+    )
+    assert response.status_code == 201
+
+    response = async_test_client.get(
+        f"{API_URL}export", headers=AUTH_HEADERS, params={"format": "csv"}
+    )
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert len(rows) == 5  # header + 4 records
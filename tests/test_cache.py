@@ -0,0 +1,101 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache, get_table_version
+from app.core.config import settings
+from app.crud import unsubscribed_email as crud
+from app.models import UnsubscribedEmail
+
+API_URL = "/api/v1/unsubscribed_emails/"
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.API_TOKEN}"}
+
+
+def test_lru_cache_counts_hits_misses_and_evictions():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats() == {
+        "entries": 2,
+        "bytes": 0,
+        "hits": 2,
+        "misses": 1,
+        "evictions": 1,
+    }
+
+
+def test_lru_cache_evicts_by_size():
+    cache = LRUCache(max_entries=100, max_bytes=10, size_of=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "xxxx")
+    cache.set("c", "xxxx")
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 8
+
+    cache.set("huge", "x" * 11)  # Never fits, so it is not stored
+    assert cache.get("huge") is None
+    assert len(cache) == 2
+
+
+def test_lru_cache_expires_entries(mocker):
+    mock_time = mocker.patch("app.core.cache.time.monotonic", return_value=100.0)
+    cache = LRUCache(max_entries=10, ttl=5)
+    cache.set("a", 1)
+
+    mock_time.return_value = 104.0
+    assert cache.get("a") == 1
+    mock_time.return_value = 106.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_commit_bumps_table_version(db_session: Session):
+    table = UnsubscribedEmail.__tablename__
+    before = get_table_version(table)
+
+    db_session.add(
+        UnsubscribedEmail(
+            sender_name="A", sender_email="a@e.com", unsub_method="direct_link"
+        )
+    )
+    db_session.flush()
+    assert get_table_version(table) == before  # Not until the commit
+    db_session.commit()
+    after_insert = get_table_version(table)
+    assert after_insert > before
+
+    db_session.query(UnsubscribedEmail).delete()
+    db_session.rollback()
+    assert get_table_version(table) == after_insert
+
+
+def test_api_list_is_cached_until_a_write(test_client: TestClient, mocker):
+    spy = mocker.spy(crud, "_query_unsubscribed_emails_page")
+    params = {"unsub_method": "isp_level", "search": "News"}
+
+    first = test_client.get(API_URL, headers=AUTH_HEADERS, params=params)
+    # Search is case-insensitive, so it shares the cache entry
+    second = test_client.get(
+        API_URL, headers=AUTH_HEADERS, params={**params, "search": "news"}
+    )
+    assert spy.call_count == 1
+    assert second.json() == first.json() == {**first.json(), "total": 0}
+
+    response = test_client.post(
+        API_URL,
+        headers=AUTH_HEADERS,
+        json={
+            "sender_name": "Newsletter",
+            "sender_email": "n@e.com",
+            "unsub_method": "isp_level",
+        },
+    )
+    assert response.status_code == 201
+
+    third = test_client.get(API_URL, headers=AUTH_HEADERS, params=params)
+    assert spy.call_count == 2
+    assert third.json()["total"] == 1
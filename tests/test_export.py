@@ -57,3 +57,113 @@ def test_export_with_filter(test_client: TestClient, diverse_db):
     assert response_csv.status_code == 200
     rows = list(csv.reader(io.StringIO(response_csv.text)))
     assert len(rows) == 3  # 1 header + 2 records
+
+
+def test_export_with_domain_filter(test_client: TestClient, diverse_db):
+    response = test_client.get(
+        API_URL, headers=AUTH_HEADERS, params={"format": "csv", "domain": "tech.com"}
+    )
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert sorted(row[2] for row in rows[1:]) == [
+        "gadgets@tech.com",
+        "newsletter@tech.com",
+    ]
+
+
+def test_export_ndjson_success(test_client: TestClient, diverse_db):
+    response = test_client.get(
+        API_URL, headers=AUTH_HEADERS, params={"format": "ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = response.text.splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[0])["sender_name"] == "Cool Gadgets"
+
+
+@pytest.mark.asyncio
+async def test_export_streams_in_chunks(diverse_db):
+    from app.core.export import EXPORT_FIELDNAMES, iter_csv, iter_json_array
+
+    rows = [
+        tuple(getattr(item, name) for name in EXPORT_FIELDNAMES) for item in diverse_db
+    ]
+
+    async def chunks():
+        yield rows[:2]
+        yield rows[2:]
+
+    parts = [part async for part in iter_csv(chunks())]
+    assert len(parts) == 3  # header, then one part per chunk
+    assert len(parts[1].splitlines()) == 2
+
+    body = b"".join([part async for part in iter_json_array(chunks())])
+    assert [row["sender_name"] for row in json.loads(body)] == [
+        "Tech Weekly",
+        "Marketing Daily",
+        "Cool Gadgets",
+    ]
+
+
+def test_web_export_matches_api_export(test_client: TestClient, diverse_db):
+    """The web export streams the same file in-process, behind Basic Auth."""
+    from .test_web_auth import get_basic_auth_headers
+
+    params = {"format": "csv", "unsub_method": "isp_level"}
+    web_headers = get_basic_auth_headers(
+        settings.BASIC_AUTH_USERNAME, settings.BASIC_AUTH_PASSWORD
+    )
+    web = test_client.get("/web/export", headers=web_headers, params=params)
+    api = test_client.get(API_URL, headers=AUTH_HEADERS, params=params)
+
+    assert web.status_code == 200
+    assert web.text == api.text
+    assert web.headers["content-disposition"] == api.headers["content-disposition"]
+
+    response = test_client.get("/web/export", params=params)
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize("format", ["csv", "json", "ndjson"])
+def test_export_timestamps_match_list(test_client: TestClient, diverse_db, format):
+    """Exports write inserted_at byte-for-byte as the list endpoint does."""
+    listed = test_client.get(
+        "/api/v1/unsubscribed_emails/", headers=AUTH_HEADERS, params={"limit": 10}
+    ).json()
+    response = test_client.get(API_URL, headers=AUTH_HEADERS, params={"format": format})
+
+    if format == "csv":
+        exported = [row[4] for row in csv.reader(io.StringIO(response.text))][1:]
+    elif format == "json":
+        exported = [row["inserted_at"] for row in response.json()]
+    else:
+        exported = [
+            json.loads(line)["inserted_at"] for line in response.text.splitlines()
+        ]
+    assert exported == [item["inserted_at"] for item in listed["items"]]
+
+
+@pytest.mark.asyncio
+async def test_export_writes_utc_timestamps_with_z():
+    from datetime import datetime, timezone
+
+    from app.core.export import iter_csv, iter_json_array, iter_ndjson
+    from app.core.serialization import dumps, email_rows_to_dicts
+
+    row = (1, "Sender", "s@example.com", "direct_link")
+    row += (datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),)
+    listed = dumps(email_rows_to_dicts([row])[0])
+
+    async def chunks():
+        yield [row]
+
+    csv_body = "".join([part async for part in iter_csv(chunks())])
+    ndjson_body = b"".join([part async for part in iter_ndjson(chunks())])
+    json_body = b"".join([part async for part in iter_json_array(chunks())])
+
+    assert b'"2026-01-02T03:04:05Z"' in listed
+    assert csv_body.splitlines()[1].endswith(",2026-01-02T03:04:05Z")
+    assert ndjson_body == listed + b"\n"
+    assert json_body == b"[" + listed + b"]"
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from unittest.mock import AsyncMock
 
 from app.models import UnsubscribedEmail
-from app.core.logging import log_event
+from app.core.logging import LogQueue, log_event
 
 
 def test_transaction_rollback_on_failure(
@@ -69,8 +69,10 @@ async def test_logging_system_fallback_integration(mocker):
     """
     # Mock the database session to simulate a database failure
     mock_session = mocker.MagicMock()
-    mock_session.add.side_effect = Exception("DB down")
-    mocker.patch("app.core.logging.SessionLocal", return_value=mock_session)
+    mock_session.add_all.side_effect = Exception("DB down")
+    mocker.patch("app.core.logging.LogSessionLocal", return_value=mock_session)
+    log_queue = LogQueue(max_size=10, batch_size=10, flush_interval=1)
+    mocker.patch("app.core.logging.log_queue", log_queue)
 
     # Mock the standard logger to verify fallback logging
     mock_logger = mocker.patch("app.core.logging.logger")
@@ -81,12 +83,12 @@ async def test_logging_system_fallback_integration(mocker):
     )
 
     # Call log_event - it should handle the DB error gracefully
-    result = await log_event(
-        "test_app", "CRITICAL", "This is a test of the fallback system."
-    )
+    await log_event("test_app", "CRITICAL", "This is a test of the fallback system.")
+    await log_queue.flush()
 
-    # Verify the fallback mechanisms were triggered
-    assert result is None  # Should return None when DB fails
+    # Verify the write was attempted with the event
+    (written,) = mock_session.add_all.call_args.args[0]
+    assert written.message == "This is a test of the fallback system."
 
     # Verify logger.error was called for fallback logging
     mock_logger.error.assert_called_once()
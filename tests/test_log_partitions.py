@@ -0,0 +1,129 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from app.core import log_partitions
+from app.core.log_partitions import (
+    add_months,
+    create_partition_sql,
+    drop_expired_partitions,
+    ensure_partitions,
+    maintain_logs,
+    month_start,
+    partition_name,
+)
+from app.models import Log
+from .conftest import engine
+
+NOW = datetime(2026, 1, 15, 12, 30, tzinfo=timezone.utc)
+
+
+def test_month_arithmetic_crosses_years():
+    month = month_start(NOW)
+    assert month == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert add_months(month, -1) == datetime(2025, 12, 1, tzinfo=timezone.utc)
+    assert add_months(month, 13) == datetime(2027, 2, 1, tzinfo=timezone.utc)
+
+
+def test_partition_ddl_covers_one_month():
+    month = datetime(2025, 12, 1, tzinfo=timezone.utc)
+    assert partition_name(month) == "logs_p2025_12"
+    assert create_partition_sql(month) == (
+        "CREATE TABLE IF NOT EXISTS logs_p2025_12 PARTITION OF logs "
+        "FOR VALUES FROM ('2025-12-01T00:00:00+00:00') "
+        "TO ('2026-01-01T00:00:00+00:00')"
+    )
+
+
+def test_retention_detaches_partitions_before_dropping(mocker):
+    def month(number):
+        return datetime(2025, number, 1, tzinfo=timezone.utc)
+
+    attached, pending = [month(8), month(10), month(11), month(12)], [month(10)]
+    mocker.patch.object(
+        log_partitions,
+        "_partition_months",
+        side_effect=lambda conn, detach_pending=False: (
+            pending if detach_pending else attached
+        ),
+    )
+    # September was detached by an earlier run that stopped before dropping it
+    mocker.patch.object(log_partitions, "_detached_months", return_value=[month(9)])
+    conn = mocker.Mock()
+
+    dropped = drop_expired_partitions(conn, NOW, retention_months=2)
+
+    assert dropped == ["logs_p2025_08", "logs_p2025_10", "logs_p2025_09"]
+    assert [str(call.args[0]) for call in conn.execute.call_args_list] == [
+        "ALTER TABLE logs DETACH PARTITION logs_p2025_08 CONCURRENTLY",
+        "DROP TABLE IF EXISTS logs_p2025_08",
+        "ALTER TABLE logs DETACH PARTITION logs_p2025_10 FINALIZE",
+        "DROP TABLE IF EXISTS logs_p2025_10",
+        "DROP TABLE IF EXISTS logs_p2025_09",
+    ]
+
+
+def test_writes_create_a_missing_partition_first(mocker):
+    mocker.patch.object(log_partitions, "_writable_months", set())
+    mocker.patch.object(log_partitions, "is_partitioned", return_value=True)
+    partition_months = mocker.patch.object(
+        log_partitions, "_partition_months", return_value=[month_start(NOW)]
+    )
+    fake_engine = mocker.MagicMock()
+    conn = fake_engine.begin.return_value.__enter__.return_value
+    # Maintenance has not created February yet
+    timestamps = [NOW, datetime(2026, 2, 1, 0, 5, tzinfo=timezone.utc)]
+
+    assert ensure_partitions(fake_engine, timestamps) == ["logs_p2026_02"]
+    assert str(conn.execute.call_args.args[0]).startswith(
+        "CREATE TABLE IF NOT EXISTS logs_p2026_02 PARTITION OF logs"
+    )
+
+    # Months already seen are not looked up again
+    assert ensure_partitions(fake_engine, timestamps) == []
+    assert partition_months.call_count == 1
+
+
+def test_unpartitioned_logs_need_no_partitions(db_session: Session, mocker):
+    mocker.patch.object(log_partitions, "_writable_months", set())
+    assert ensure_partitions(engine, [NOW]) == []
+
+    db_session.add(Log(timestamp=NOW, source_app="api", log_level="INFO", message="m"))
+    db_session.commit()
+    assert db_session.query(Log).count() == 1
+
+
+def test_retention_deletes_old_rows_in_chunks(db_session: Session, mocker):
+    mocker.patch.object(log_partitions, "DELETE_CHUNK_SIZE", 2)
+    for month in (9, 10, 10, 11, 12):
+        db_session.add(
+            Log(
+                timestamp=datetime(2025, month, 5, tzinfo=timezone.utc),
+                source_app="api",
+                log_level="INFO",
+                message=f"month {month}",
+            )
+        )
+    db_session.commit()
+
+    # Keeping two whole months before January keeps November and December
+    result = maintain_logs(engine, now=NOW, retention_months=2)
+
+    assert result == {"created": [], "dropped": [], "deleted": 3}
+    remaining = [log.message for log in db_session.query(Log).order_by(Log.timestamp)]
+    assert remaining == ["month 11", "month 12"]
+
+
+def test_no_retention_keeps_every_row(db_session: Session):
+    db_session.add(
+        Log(
+            timestamp=datetime(2000, 1, 1, tzinfo=timezone.utc),
+            source_app="api",
+            log_level="INFO",
+            message="old",
+        )
+    )
+    db_session.commit()
+
+    assert maintain_logs(engine, now=NOW, retention_months=None)["deleted"] == 0
+    assert db_session.query(Log).count() == 1
@@ -7,15 +7,24 @@ import sys, os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from app.core.logging import log_event
+from app.core import logging as app_logging
+from app.core.logging import LogQueue, log_event, write_log
 from app.models import Log
 
 
+@pytest.fixture(autouse=True)
+def log_queue(mocker):
+    """Gives each test an empty log queue instead of the shared one."""
+    queue = LogQueue(max_size=100, batch_size=10, flush_interval=1)
+    mocker.patch("app.core.logging.log_queue", queue)
+    return queue
+
+
 @pytest.mark.asyncio
-async def test_log_to_database_success(db_session, mocker):
+async def test_log_to_database_success(db_session, mocker, log_queue):
     """Test that a log is successfully written to the database."""
-    # Mock SessionLocal to return the test session
-    mocker.patch("app.core.logging.SessionLocal", return_value=db_session)
+    # Mock LogSessionLocal to return the test session
+    mocker.patch("app.core.logging.LogSessionLocal", return_value=db_session)
 
     await log_event(
         source_app="test_suite",
@@ -23,6 +32,7 @@ async def test_log_to_database_success(db_session, mocker):
         message="Successful DB log.",
         details_json={"test_id": 1},
     )
+    await log_queue.flush()
 
     log = db_session.query(Log).first()
     assert log is not None
@@ -35,14 +45,15 @@ async def test_log_to_database_success(db_session, mocker):
 async def test_log_fallback_to_structured_log(mocker, caplog):
     """Test that structured logs are created when the database fails."""
     mocker.patch(
-        "app.core.logging.SessionLocal", side_effect=Exception("DB connection failed")
+        "app.core.logging.LogSessionLocal",
+        side_effect=Exception("DB connection failed"),
     )
     mock_discord = mocker.patch(
         "app.core.logging._send_discord_alert", new_callable=AsyncMock
     )
 
     with caplog.at_level(logging.ERROR):
-        log_id = await log_event(
+        log_id = await write_log(
             source_app="fallback_test",
             log_level="ERROR",
             message="This should be captured.",
@@ -66,10 +77,12 @@ async def test_log_fallback_to_structured_log(mocker, caplog):
 
 
 @pytest.mark.asyncio
-async def test_log_event_never_raises(mocker):
+async def test_log_event_never_raises(mocker, log_queue):
     """Test that the main log_event function never raises an exception."""
     # 1. Simulate database failure by mocking SessionLocal
-    mocker.patch("app.core.logging.SessionLocal", side_effect=Exception("DB is down"))
+    mocker.patch(
+        "app.core.logging.LogSessionLocal", side_effect=Exception("DB is down")
+    )
 
     # 2. Simulate structured logger failure
     mocker.patch(
@@ -83,5 +96,82 @@ async def test_log_event_never_raises(mocker):
 
     try:
         await log_event("test_suite", "CRITICAL", "Everything is failing")
+        await log_queue.flush()
+        await write_log("test_suite", "CRITICAL", "Everything is failing")
     except Exception as e:
         pytest.fail(f"log_event raised an exception unexpectedly: {e}")
+
+
+@pytest.mark.asyncio
+async def test_log_event_does_not_touch_database(mocker, log_queue):
+    """log_event only queues; the write happens when the queue is drained."""
+    mock_session_local = mocker.patch("app.core.logging.LogSessionLocal")
+    log_queue.start()
+
+    await log_event("test_suite", "INFO", "Queued only.")
+
+    assert len(log_queue) == 1
+    mock_session_local.assert_not_called()
+    await log_queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_log_event_writes_directly_without_writer(db_session, mocker, log_queue):
+    """Without a running writer (e.g. in a script), nothing is left queued."""
+    mocker.patch("app.core.logging.LogSessionLocal", return_value=db_session)
+
+    await log_event("script", "INFO", "Written directly.")
+
+    assert len(log_queue) == 0
+    log = db_session.query(Log).filter(Log.source_app == "script").one()
+    assert log.message == "Written directly."
+
+
+@pytest.mark.asyncio
+async def test_log_queue_writes_in_batches(db_session, mocker):
+    mocker.patch("app.core.logging.LogSessionLocal", return_value=db_session)
+    insert_spy = mocker.spy(app_logging, "_insert_logs")
+    queue = LogQueue(max_size=100, batch_size=4, flush_interval=1)
+
+    for i in range(10):
+        queue.put(
+            {
+                "source_app": "batch_test",
+                "log_level": "INFO",
+                "message": f"event {i}",
+                "details_json": None,
+                "inserted_by": None,
+            }
+        )
+    await queue.flush()
+
+    assert [len(call.args[0]) for call in insert_spy.call_args_list] == [4, 4, 2]
+    assert db_session.query(Log).filter(Log.source_app == "batch_test").count() == 10
+    assert queue.stats() == {"pending": 0, "dropped": 0, "written": 10}
+
+
+@pytest.mark.parametrize(
+    "overflow, expected", [("drop_oldest", [2, 3, 4]), ("drop_newest", [0, 1, 2])]
+)
+def test_log_queue_overflow_policy(overflow, expected):
+    queue = LogQueue(max_size=3, batch_size=10, flush_interval=1, overflow=overflow)
+    for i in range(5):
+        queue.put({"message": i})
+
+    assert [entry["message"] for entry in queue._pending] == expected
+    assert queue.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_log_queue_flushes_on_stop(mocker):
+    mock_write = mocker.patch(
+        "app.core.logging._write_batch", new_callable=AsyncMock, return_value=[1]
+    )
+    queue = LogQueue(max_size=10, batch_size=5, flush_interval=60)
+    queue.start()
+    queue.put({"message": "pending at shutdown"})
+
+    await queue.stop()
+
+    mock_write.assert_awaited_once_with([{"message": "pending at shutdown"}])
+    assert len(queue) == 0
@@ -27,7 +27,7 @@ def test_post_log_success():
     assert isinstance(data["log_id"], int)
 
 
-@patch("app.core.logging.SessionLocal")
+@patch("app.core.logging.LogSessionLocal")
 @patch("app.core.logging._send_discord_alert", new_callable=AsyncMock)
 def test_post_log_fallback(mock_discord, mock_session_local):
     # Simulate DB failure
@@ -0,0 +1,208 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.api.v1.endpoints.logging import stream_logs
+from app.core.logging import (
+    LogTail,
+    iter_log_chunks,
+    iter_log_tail_events,
+    log_event,
+    log_tail,
+)
+from app.models import Log
+
+API_URL = "/api/v1/logs"
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.API_TOKEN}"}
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def seeded_logs(db_session: Session):
+    """Six logs; the third and fourth share a timestamp."""
+    minutes = [0, 1, 2, 2, 3, 4]
+    logs = [
+        Log(
+            timestamp=START + timedelta(minutes=minute),
+            source_app="web" if i == 5 else "api",
+            log_level="INFO",
+            message=f"log {i}",
+        )
+        for i, minute in enumerate(minutes)
+    ]
+    db_session.add_all(logs)
+    db_session.commit()
+    return logs
+
+
+def test_keyset_pages_back_in_time(test_client: TestClient, seeded_logs):
+    params = {"limit": 2, "source_app": "api", "total": "none"}
+    messages = []
+    while True:
+        data = test_client.get(API_URL, headers=AUTH_HEADERS, params=params).json()
+        assert data["total"] is None
+        messages += [log["message"] for log in data["data"]]
+        if data["next_before_timestamp"] is None:
+            break
+        params["before_timestamp"] = data["next_before_timestamp"]
+        params["before_id"] = data["next_before_id"]
+
+    assert messages == ["log 4", "log 3", "log 2", "log 1", "log 0"]
+
+
+def test_after_id_reads_forward(test_client: TestClient, seeded_logs):
+    params = {"limit": 4, "after_id": seeded_logs[0].id}
+    data = test_client.get(API_URL, headers=AUTH_HEADERS, params=params).json()
+
+    assert [log["message"] for log in data["data"]] == [
+        "log 1",
+        "log 2",
+        "log 3",
+        "log 4",
+    ]
+    assert data["total"] == 6
+    assert data["next_after_id"] == seeded_logs[4].id
+
+    params["after_id"] = data["next_after_id"]
+    data = test_client.get(API_URL, headers=AUTH_HEADERS, params=params).json()
+    assert [log["message"] for log in data["data"]] == ["log 5"]
+    assert data["next_after_id"] is None
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"after_id": 1, "offset": 5},
+        {"after_id": 1, "before_timestamp": START.isoformat()},
+        {"before_id": 3},
+    ],
+)
+def test_conflicting_cursors_are_rejected(test_client: TestClient, params):
+    response = test_client.get(API_URL, headers=AUTH_HEADERS, params=params)
+    assert response.status_code == 422
+
+
+def test_export_streams_ndjson(test_client: TestClient, seeded_logs):
+    params = {
+        "source_app": "api",
+        "date_from": (START + timedelta(minutes=1)).isoformat(),
+        "date_to": (START + timedelta(minutes=3)).isoformat(),
+    }
+    response = test_client.get(f"{API_URL}/export", headers=AUTH_HEADERS, params=params)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["message"] for line in lines] == ["log 1", "log 2", "log 3", "log 4"]
+    # SQLite drops the time zone; PostgreSQL's UTC values end in "Z"
+    assert lines[0]["timestamp"].startswith("2026-01-01T00:01:00")
+
+
+def test_export_reads_in_chunks(db_session: Session, seeded_logs):
+    chunks = list(iter_log_chunks(db_session, chunk_size=4))
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+
+
+def _tail_entry(message: str, source_app: str = "api", log_level: str = "INFO"):
+    return {
+        "timestamp": START,
+        "source_app": source_app,
+        "log_level": log_level,
+        "message": message,
+        "details_json": None,
+        "inserted_by": None,
+    }
+
+
+def test_tail_buffer_evicts_oldest_events():
+    tail = LogTail(max_size=3)
+    for i in range(5):
+        tail.append(_tail_entry(f"log {i}"))
+
+    assert [event_id for event_id, _ in tail.since(0)] == [3, 4, 5]
+    assert [entry["message"] for _, entry in tail.since(3)] == ["log 3", "log 4"]
+    assert tail.since(5) == []
+    # An ID from before a restart replays the whole buffer
+    assert len(tail.since(99)) == 3
+
+
+@pytest.mark.asyncio
+async def test_tail_events_resume_after_last_event_id_with_filters():
+    tail = LogTail(max_size=10)
+    tail.append(_tail_entry("seen"))
+    tail.append(_tail_entry("missed web", source_app="web"))
+    tail.append(_tail_entry("missed api"))
+
+    events = iter_log_tail_events(tail, last_id=1, source_app="api")
+    frame = await anext(events)
+    assert frame.startswith(b"id: 3\nevent: log\ndata: ")
+    assert json.loads(frame.split(b"data: ")[1])["message"] == "missed api"
+
+    # Waiting watchers wake as soon as a new event is appended
+    pending = asyncio.ensure_future(anext(events))
+    await asyncio.sleep(0)
+    tail.append(_tail_entry("live", log_level="ERROR"))
+    frame = await asyncio.wait_for(pending, 1)
+    assert frame.startswith(b"id: 4\n")
+    await events.aclose()
+    assert tail.stats()["watchers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_tail_events_wait_after_an_unknown_last_event_id():
+    # After a restart, the tail is empty and behind the client's ID
+    tail = LogTail(max_size=10)
+    events = iter_log_tail_events(tail, last_id=99, keepalive_seconds=0.2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.ensure_future(ticker())
+    assert await asyncio.wait_for(anext(events), 1) == b": keepalive\n\n"
+    ticking.cancel()
+    assert ticks > 5
+
+    tail.append(_tail_entry("after restart"))
+    frame = await asyncio.wait_for(anext(events), 1)
+    assert frame.startswith(b"id: 1\n")
+    await events.aclose()
+
+
+@pytest.mark.asyncio
+async def test_tail_events_send_keepalives():
+    tail = LogTail(max_size=10)
+    events = iter_log_tail_events(tail, keepalive_seconds=0.01)
+    assert await asyncio.wait_for(anext(events), 1) == b": keepalive\n\n"
+    await events.aclose()
+
+
+@pytest.mark.asyncio
+async def test_log_event_feeds_the_tail():
+    last_id = log_tail.last_id
+    await log_event("tail-test", "WARNING", "Tailed event.")
+
+    [(event_id, entry)] = log_tail.since(last_id)
+    assert event_id == last_id + 1
+    assert entry["message"] == "Tailed event."
+
+
+@pytest.mark.asyncio
+async def test_stream_endpoint_returns_event_stream():
+    response = await stream_logs(source_app="api", log_level=None, last_event_id=0)
+    assert response.media_type == "text/event-stream"
+    assert response.headers["cache-control"] == "no-cache"
+    await response.body_iterator.aclose()
+
+
+def test_stream_requires_auth(test_client: TestClient):
+    response = test_client.get(f"{API_URL}/stream")
+    assert response.status_code == 401
@@ -1,7 +1,11 @@
+import logging
+
 from fastapi.testclient import TestClient
 from app.main import app
+from app.core.config import settings
 from app.core.exceptions import DatabaseConnectionError
 from app.core.database import get_db
+from app.models import UnsubscribedEmail
 
 client = TestClient(app)
 
@@ -45,3 +49,53 @@ def test_health_check_db_failure(mocker):
 def test_cors_headers():
     response = client.get("/", headers={"Origin": "http://example.com"})
     assert response.headers["access-control-allow-origin"] == "*"
+
+
+def test_request_id_header():
+    first = client.get("/")
+    second = client.get("/")
+    assert first.headers["X-Request-ID"]
+    assert first.headers["X-Request-ID"] != second.headers["X-Request-ID"]
+
+
+def test_middleware_is_pure_asgi():
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    for middleware in app.user_middleware:
+        assert not issubclass(middleware.cls, BaseHTTPMiddleware)
+
+
+def test_server_timing_header(test_client, db_session):
+    db_session.add(
+        UnsubscribedEmail(
+            sender_name="Timed", sender_email="t@e.com", unsub_method="isp_level"
+        )
+    )
+    db_session.commit()
+
+    response = test_client.get(
+        "/api/v1/unsubscribed_emails/",
+        headers={"Authorization": f"Bearer {settings.API_TOKEN}"},
+    )
+    assert response.status_code == 200
+    metrics = {
+        metric.split(";")[0]: float(metric.split("dur=")[1])
+        for metric in response.headers["Server-Timing"].split(", ")
+    }
+    assert set(metrics) == {"db", "serialize", "total"}
+    assert metrics["db"] + metrics["serialize"] <= metrics["total"]
+
+
+def test_request_finished_log_has_timings(test_client, caplog):
+    from .test_web_auth import get_basic_auth_headers
+
+    headers = get_basic_auth_headers(
+        settings.BASIC_AUTH_USERNAME, settings.BASIC_AUTH_PASSWORD
+    )
+    with caplog.at_level(logging.INFO):
+        response = test_client.get("/web/unsubscribed", headers=headers)
+    assert response.status_code == 200
+
+    record = next(r for r in caplog.records if r.getMessage() == "Request finished")
+    assert record.db_count >= 1 and record.db_ms >= 0
+    assert record.render_count == 1
@@ -0,0 +1,52 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.core.database import InstrumentedQueuePool, engine, get_pool_stats
+from app.main import app
+
+client = TestClient(app)
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.API_TOKEN}"}
+
+
+def test_engine_uses_pool_settings():
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert engine.pool.size() == settings.DB_POOL_SIZE
+    assert engine.pool._max_overflow == settings.DB_MAX_OVERFLOW
+    assert engine.pool._pre_ping == settings.DB_POOL_PRE_PING
+
+
+def test_pool_stats_track_checkouts():
+    test_engine = create_engine(
+        settings.TEST_DATABASE_URL,
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    with test_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        stats = get_pool_stats(test_engine)
+        assert stats["checked_out"] == 1
+
+    stats = get_pool_stats(test_engine)
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 1
+    assert stats["wait_ms_max"] >= 0
+    test_engine.dispose()
+
+
+def test_metrics_endpoint():
+    response = client.get("/api/v1/metrics", headers=AUTH_HEADERS)
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["db_pools"]) >= {"request", "log"}
+    assert "checked_out" in data["db_pools"]["request"]
+    assert set(data["log_queue"]) == {"pending", "dropped", "written"}
+    assert set(data["log_tail"]) == {"buffered", "last_id", "watchers"}
+    assert set(data["caches"]) == {"query", "web_list_page"}
+    assert {"hits", "misses", "evictions"} <= set(data["caches"]["query"])
+
+
+def test_metrics_requires_auth():
+    response = client.get("/api/v1/metrics")
+    assert response.status_code == 401
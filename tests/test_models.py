@@ -62,3 +62,37 @@ def test_create_log(db_session):
     assert new_log.source_app == "test_suite"
     assert new_log.details_json["user"] == "test"
     assert new_log.timestamp is not None
+
+
+def test_trigram_search_indexes_are_postgresql_only(db_session):
+    """The GIN trigram indexes are emitted for PostgreSQL and skipped elsewhere."""
+    from sqlalchemy import inspect
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+
+    trgm_names = {
+        "ix_unsubscribed_emails_sender_name_trgm",
+        "ix_unsubscribed_emails_sender_email_trgm",
+    }
+    indexes = {
+        index.name: index
+        for index in UnsubscribedEmail.__table__.indexes
+        if index.name in trgm_names
+    }
+    assert set(indexes) == trgm_names
+
+    ddl = str(
+        CreateIndex(indexes["ix_unsubscribed_emails_sender_email_trgm"]).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "USING gin (sender_email gin_trgm_ops)" in ddl
+
+    bind = db_session.get_bind()
+    created = {
+        index["name"] for index in inspect(bind).get_indexes("unsubscribed_emails")
+    }
+    if bind.dialect.name == "postgresql":
+        assert trgm_names <= created
+    else:
+        assert not trgm_names & created
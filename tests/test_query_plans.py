@@ -0,0 +1,49 @@
+from sqlalchemy.orm import Session
+
+from app.core.query_plans import (
+    HOT_QUERIES,
+    explain,
+    find_sequential_scans,
+    has_sequential_scan,
+)
+from app.models import Log, UnsubscribedEmail
+
+
+def test_hot_queries_use_indexes(db_session: Session):
+    """Fails if a list or logs query falls back to a sequential scan."""
+    db_session.add_all(
+        UnsubscribedEmail(
+            sender_name=f"Sender {i}",
+            sender_email=f"s{i}@example.com",
+            unsub_method="isp_level" if i % 2 else "direct_link",
+        )
+        for i in range(200)
+    )
+    db_session.add_all(
+        Log(source_app=f"app{i % 5}", log_level="INFO", message=f"log {i}")
+        for i in range(200)
+    )
+    db_session.commit()
+
+    conn = db_session.connection()
+    failures = find_sequential_scans(conn)
+    assert failures == {}
+
+
+def test_sequential_scan_is_detected(db_session: Session):
+    """Sanity check: an unindexed filter is reported as a sequential scan."""
+    from sqlalchemy import select
+
+    conn = db_session.connection()
+    dialect_name = conn.dialect.name
+    if dialect_name == "postgresql":
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+
+    stmt = select(Log).where(Log.message == "unindexed")
+    plan = explain(conn, stmt)
+    assert has_sequential_scan(plan, "logs", dialect_name)
+
+
+def test_hot_queries_cover_list_and_logs():
+    tables = {query.table for query in HOT_QUERIES.values()}
+    assert tables == {"unsubscribed_emails", "logs"}
@@ -10,6 +10,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from app.main import app, rate_limiter
 from app.core.config import settings
+from app.core.rate_limit import RateLimiter
+from app.core.rate_limit_backends import DatabaseRateLimitBackend, RateLimitBackend
+from app.models import RateLimitCounter
+from .conftest import engine
 
 client = TestClient(app)
 
@@ -17,7 +21,7 @@ client = TestClient(app)
 @pytest.fixture(autouse=True)
 def cleanup_rate_limiter():
     """Fixture to clean the rate limiter state before each test."""
-    rate_limiter._requests.clear()
+    rate_limiter.reset()
     yield
 
 
@@ -76,19 +80,149 @@ def test_sliding_window(mocker):
 
 
 def test_cleanup_function(mocker):
-    # Setup limiter with old and new data
-    now = time.time()
-    old_time = now - settings.RATE_LIMIT_TIMESCALE_SECONDS - 100
-    rate_limiter._requests = {
-        "user1": [old_time, old_time],  # Should be removed
-        "user2": [now - 10, now - 5],  # Should be kept
-        "user3": [old_time],  # Should be removed entirely
-    }
-
-    # Run cleanup
+    start_time = time.time()
+    mock_time = mocker.patch("time.time")
+    window = settings.RATE_LIMIT_TIMESCALE_SECONDS
+
+    mock_time.return_value = start_time - 3 * window
+    asyncio.run(rate_limiter.is_rate_limited("user1", 10, window))  # Expired
+    mock_time.return_value = start_time - 10
+    asyncio.run(rate_limiter.is_rate_limited("user2", 10, window))  # Still active
+    asyncio.run(rate_limiter.is_rate_limited("user2", 10, window))
+
+    mock_time.return_value = start_time
     asyncio.run(rate_limiter.cleanup())
 
-    assert "user1" not in rate_limiter._requests
-    assert "user3" not in rate_limiter._requests
-    assert "user2" in rate_limiter._requests
-    assert len(rate_limiter._requests["user2"]) == 2
+    assert len(rate_limiter) == 1
+    assert rate_limiter._shard("user2")["user2"].current == 2
+
+
+def test_state_is_constant_per_identifier():
+    for _ in range(50):
+        asyncio.run(rate_limiter.is_rate_limited("user1", 100, 60))
+
+    counter = rate_limiter._shard("user1")["user1"]
+    assert (counter.previous, counter.current) == (0, 50)
+
+
+def test_previous_window_is_weighted(mocker):
+    start_time = 1_000_000.0
+    mock_time = mocker.patch("time.time")
+    mock_time.return_value = start_time
+
+    for _ in range(10):
+        assert asyncio.run(rate_limiter.is_rate_limited("user1", 10, 60)) is None
+    assert asyncio.run(rate_limiter.is_rate_limited("user1", 10, 60)) == 60
+
+    # A quarter into the next window, 75% of the previous 10 requests still count
+    mock_time.return_value = start_time + 75
+    for _ in range(3):
+        assert asyncio.run(rate_limiter.is_rate_limited("user1", 10, 60)) is None
+    # 7.5 + 3 >= 10 until the previous window's weight falls below 7, 3s later
+    assert asyncio.run(rate_limiter.is_rate_limited("user1", 10, 60)) == 3
+
+
+@pytest.fixture
+def shared_limiters(db_session, mocker):
+    """Two limiters sharing one database backend, like two uvicorn workers."""
+    mocker.patch("time.time", return_value=1_000_020.0)
+    backend = DatabaseRateLimitBackend(engine)
+    return RateLimiter(backend=backend), RateLimiter(backend=backend)
+
+
+def test_incomplete_backend_fails_at_construction():
+    class SyncOnlyBackend(RateLimitBackend):
+        async def sync(self, deltas, since):
+            return {}
+
+    with pytest.raises(TypeError):
+        SyncOnlyBackend()
+
+
+def test_shared_backend_enforces_one_limit_across_workers(shared_limiters):
+    worker_a, worker_b = shared_limiters
+
+    for _ in range(6):
+        assert asyncio.run(worker_a.is_rate_limited("user1", 10, 60)) is None
+    for _ in range(4):
+        assert asyncio.run(worker_b.is_rate_limited("user1", 10, 60)) is None
+
+    asyncio.run(worker_a.sync())
+    asyncio.run(worker_b.sync())
+
+    # Both workers now see all 10 requests
+    assert asyncio.run(worker_b.is_rate_limited("user1", 10, 60)) is not None
+    asyncio.run(worker_a.sync())
+    assert asyncio.run(worker_a.is_rate_limited("user1", 10, 60)) is not None
+
+
+def test_fresh_worker_pulls_existing_counts(shared_limiters, mocker):
+    worker_a, worker_b = shared_limiters
+    for _ in range(10):
+        asyncio.run(worker_a.is_rate_limited("user1", 10, 60))
+    asyncio.run(worker_a.sync())
+
+    # worker_b sees user1 for the first time mid-window; its next sync pulls
+    # the counts worker_a already holds
+    mocker.patch("time.time", return_value=1_000_050.0)
+    assert asyncio.run(worker_b.is_rate_limited("user1", 10, 60)) is None
+    asyncio.run(worker_b.sync())
+
+    assert asyncio.run(worker_b.is_rate_limited("user1", 10, 60)) is not None
+
+
+def test_sync_pulls_only_identifiers_the_worker_has_seen(shared_limiters):
+    worker_a, worker_b = shared_limiters
+    asyncio.run(worker_a.is_rate_limited("user1", 10, 60))
+    asyncio.run(worker_b.is_rate_limited("user2", 10, 60))
+    asyncio.run(worker_a.sync())
+    asyncio.run(worker_b.sync())
+
+    (key,) = {key for key, _, _ in worker_b._totals}
+    assert key == worker_b._shard("user2")["user2"].key
+
+
+def test_shared_backend_stores_hashed_identifiers(shared_limiters, db_session):
+    worker_a, _ = shared_limiters
+    asyncio.run(worker_a.is_rate_limited("secret-token", 10, 60))
+    asyncio.run(worker_a.sync())
+
+    row = db_session.query(RateLimitCounter).one()
+    assert row.key != "secret-token" and len(row.key) == 64
+    assert (row.window, row.window_start, row.count) == (60, 1_000_020, 1)
+
+
+def test_failed_sync_keeps_pending_counts(shared_limiters, mocker):
+    worker_a, _ = shared_limiters
+    asyncio.run(worker_a.is_rate_limited("user1", 10, 60))
+    mocker.patch.object(
+        worker_a.backend, "_sync", side_effect=RuntimeError("db unavailable")
+    )
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(worker_a.sync())
+
+    assert sum(worker_a._pending.values()) == 1
+
+
+def test_cleanup_expires_shared_counts(shared_limiters, db_session, mocker):
+    worker_a, _ = shared_limiters
+    asyncio.run(worker_a.is_rate_limited("user1", 10, 60))
+    asyncio.run(worker_a.sync())
+
+    mocker.patch("time.time", return_value=1_000_020.0 + 180)
+    asyncio.run(worker_a.cleanup())
+
+    assert db_session.query(RateLimitCounter).count() == 0
+
+
+def test_cleanup_expires_shared_counts_in_chunks(shared_limiters, db_session, mocker):
+    mocker.patch("app.core.rate_limit_backends.KEY_CHUNK_SIZE", 2)
+    worker_a, _ = shared_limiters
+    for identifier in ["user1", "user2", "user3"]:
+        asyncio.run(worker_a.is_rate_limited(identifier, 10, 60))
+    asyncio.run(worker_a.sync())
+
+    mocker.patch("time.time", return_value=1_000_020.0 + 180)
+    assert asyncio.run(worker_a.backend.expire(1_000_020 + 60)) == 3
+    assert db_session.query(RateLimitCounter).count() == 0
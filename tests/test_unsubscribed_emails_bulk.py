@@ -0,0 +1,122 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.v1.endpoints import unsubscribed_emails as bulk_endpoint
+from app.core.config import settings
+from app.models import UnsubscribedEmail
+
+API_URL = "/api/v1/unsubscribed_emails/bulk"
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.API_TOKEN}"}
+
+ROWS = [
+    {
+        "sender_name": f"Bulk Sender {i}",
+        "sender_email": f"bulk{i}@example.com",
+        "unsub_method": "direct_link",
+    }
+    for i in range(5)
+]
+
+
+def test_bulk_create_json_array(test_client: TestClient, db_session: Session):
+    response = test_client.post(API_URL, headers=AUTH_HEADERS, json=ROWS)
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["created"] == 5
+    assert data["invalid"] == 0
+    assert [r["index"] for r in data["results"]] == [0, 1, 2, 3, 4]
+    assert all(r["status"] == "created" and r["id"] for r in data["results"])
+    assert db_session.query(UnsubscribedEmail).count() == 5
+
+
+def test_bulk_create_ndjson(test_client: TestClient, db_session: Session):
+    body = "\n".join(json.dumps(row) for row in ROWS) + "\n"
+    headers = {**AUTH_HEADERS, "Content-Type": "application/x-ndjson"}
+    response = test_client.post(API_URL, headers=headers, content=body)
+    assert response.status_code == 200
+    assert response.json()["created"] == 5
+    assert db_session.query(UnsubscribedEmail).count() == 5
+
+
+def test_bulk_create_reports_invalid_rows(test_client: TestClient, db_session: Session):
+    rows = [
+        ROWS[0],
+        {**ROWS[1], "sender_email": "not-an-email"},
+        {"sender_name": "No Method", "sender_email": "nomethod@example.com"},
+        ROWS[3],
+    ]
+    response = test_client.post(API_URL, headers=AUTH_HEADERS, json=rows)
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["created"] == 2
+    assert data["invalid"] == 2
+    statuses = [r["status"] for r in data["results"]]
+    assert statuses == ["created", "invalid", "invalid", "created"]
+    assert data["results"][1]["errors"][0]["loc"] == ["sender_email"]
+    assert data["results"][2]["errors"][0]["loc"] == ["unsub_method"]
+    assert db_session.query(UnsubscribedEmail).count() == 2
+
+
+def test_bulk_create_malformed_body(test_client: TestClient):
+    headers = {**AUTH_HEADERS, "Content-Type": "application/json"}
+    response = test_client.post(API_URL, headers=headers, content="[{")
+    assert response.status_code == 400
+
+    response = test_client.post(API_URL, headers=AUTH_HEADERS, json=ROWS[0])
+    assert response.status_code == 422
+
+
+def test_bulk_create_rejects_oversized_body_before_parsing(
+    test_client: TestClient, mocker
+):
+    mocker.patch("app.api.v1.endpoints.unsubscribed_emails.BULK_MAX_BYTES", 100)
+    parse = mocker.spy(bulk_endpoint, "_parse_bulk_body")
+
+    response = test_client.post(API_URL, headers=AUTH_HEADERS, json=ROWS)
+    assert response.status_code == 413
+    parse.assert_not_called()
+
+    # Chunked bodies carry no Content-Length and are capped while streaming
+    def chunks():
+        for row in ROWS:
+            yield json.dumps(row).encode()
+
+    headers = {**AUTH_HEADERS, "Content-Type": "application/x-ndjson"}
+    response = test_client.post(API_URL, headers=headers, content=chunks())
+    assert response.status_code == 413
+    parse.assert_not_called()
+
+
+def test_bulk_create_logs_one_summary_event(test_client: TestClient, mocker):
+    mock_logger = mocker.patch("app.api.v1.endpoints.unsubscribed_emails.log_event")
+    test_client.post(API_URL, headers=AUTH_HEADERS, json=ROWS)
+
+    mock_logger.assert_awaited_once()
+    details = mock_logger.call_args[1]["details_json"]
+    assert details == {"received": 5, "created": 5, "existing": 0, "invalid": 0}
+
+
+def test_bulk_create_reports_existing_senders(
+    test_client: TestClient, db_session: Session
+):
+    first = test_client.post(API_URL, headers=AUTH_HEADERS, json=ROWS[:2]).json()
+
+    rows = [
+        ROWS[2],
+        {**ROWS[0], "sender_email": ROWS[0]["sender_email"].upper()},
+        ROWS[2],
+    ]
+    response = test_client.post(API_URL, headers=AUTH_HEADERS, json=rows)
+    assert response.status_code == 200
+    data = response.json()
+
+    assert (data["created"], data["existing"]) == (1, 2)
+    assert [r["status"] for r in data["results"]] == ["created", "existing", "existing"]
+    assert data["results"][1]["id"] == first["results"][0]["id"]
+    assert data["results"][2]["id"] == data["results"][0]["id"]
+    assert db_session.query(UnsubscribedEmail).count() == 3
@@ -9,6 +9,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 from app.main import app
 from app.core.config import settings
 from app.core.logging import log_event
+from app.crud.unsubscribed_email import delete_duplicate_unsubscribed_emails
+from app.models import UnsubscribedEmail
+from sqlalchemy import text
 
 client = TestClient(app)
 API_URL = "/api/v1/unsubscribed_emails/"
@@ -62,12 +65,12 @@ def test_create_missing_sender_name():
 
 
 @pytest.mark.asyncio
-async def test_creation_is_logged(mocker):
+async def test_creation_is_logged(test_client: TestClient, mocker):
     # Mock the log_event function
     mock_logger = mocker.patch("app.api.v1.endpoints.unsubscribed_emails.log_event")
 
     # Make a successful request
-    client.post(API_URL, headers=AUTH_HEADERS, json=VALID_PAYLOAD)
+    test_client.post(API_URL, headers=AUTH_HEADERS, json=VALID_PAYLOAD)
 
     # Assert that the logger was called
     mock_logger.assert_awaited_once()
@@ -75,3 +78,40 @@ async def test_creation_is_logged(mocker):
     assert call_args["log_level"] == "INFO"
     assert call_args["message"] == "Unsubscribed email record created."
     assert "created_id" in call_args["details_json"]
+
+
+def test_create_is_idempotent_per_sender(test_client: TestClient, db_session):
+    first = test_client.post(API_URL, headers=AUTH_HEADERS, json=VALID_PAYLOAD)
+    assert first.status_code == 201
+
+    # A retry, even with different casing, returns the stored record
+    retry = {**VALID_PAYLOAD, "sender_email": "Newsletter@Example.com"}
+    second = test_client.post(API_URL, headers=AUTH_HEADERS, json=retry)
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert db_session.query(UnsubscribedEmail).count() == 1
+
+
+def test_delete_duplicate_unsubscribed_emails(db_session):
+    # Rows written before the unique index existed
+    db_session.execute(
+        text("DROP INDEX IF EXISTS ux_unsubscribed_emails_sender_email_lower")
+    )
+    for name, email in [
+        ("a", "dup@example.com"),
+        ("b", "other@example.com"),
+        ("c", "DUP@example.com"),
+        ("d", "dup@example.com"),
+    ]:
+        db_session.add(
+            UnsubscribedEmail(
+                sender_name=name, sender_email=email, unsub_method="isp_level"
+            )
+        )
+    db_session.commit()
+
+    assert delete_duplicate_unsubscribed_emails(db_session, dry_run=True) == 2
+    assert delete_duplicate_unsubscribed_emails(db_session, chunk_size=1) == 2
+
+    remaining = db_session.query(UnsubscribedEmail).order_by(UnsubscribedEmail.id)
+    assert [row.sender_name for row in remaining] == ["a", "b"]
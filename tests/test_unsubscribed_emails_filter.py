@@ -56,6 +56,27 @@ def test_filter_by_unsub_method(test_client: TestClient, diverse_db):
     assert data["items"][0]["sender_name"] == "Marketing Daily"
 
 
+def test_filter_by_domain(test_client: TestClient, diverse_db):
+    response = test_client.get(
+        API_URL, headers=AUTH_HEADERS, params={"domain": "Tech.com"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert [item["sender_name"] for item in data["items"]] == [
+        "Cool Gadgets",
+        "Tech Weekly",
+    ]
+
+
+def test_sender_domain_is_set_on_insert(db_session: Session, diverse_db):
+    assert [record.sender_domain for record in diverse_db] == [
+        "tech.com",
+        "marketing.com",
+        "tech.com",
+    ]
+
+
 def test_search(test_client: TestClient, diverse_db):
     # Search by part of the name, case-insensitive
     response = test_client.get(
@@ -92,3 +113,77 @@ def test_combine_filters(test_client: TestClient, diverse_db):
     assert data["total"] == 2
     # Ensure all returned items match the method
     assert all(item["unsub_method"] == "direct_link" for item in data["items"])
+
+
+def test_cursor_pagination_with_date_filter(test_client: TestClient, diverse_db):
+    date_str = (datetime.now() - timedelta(days=30)).isoformat()
+    params = {"date_from": date_str, "limit": 2}
+    first = test_client.get(API_URL, headers=AUTH_HEADERS, params=params).json()
+    assert [i["sender_name"] for i in first["items"]] == [
+        "Cool Gadgets",
+        "Marketing Daily",
+    ]
+
+    params["cursor"] = first["next_cursor"]
+    second = test_client.get(API_URL, headers=AUTH_HEADERS, params=params).json()
+    assert [i["sender_name"] for i in second["items"]] == ["Tech Weekly"]
+    assert second["next_cursor"] is None
+
+
+def test_cursor_walks_date_filtered_records_written_by_the_api(
+    test_client: TestClient, db_session: Session
+):
+    # Rows take their inserted_at from the server default, so they can share
+    # a second (and, on SQLite, a stored format without microseconds)
+    test_client.post(
+        f"{API_URL}bulk",
+        headers=AUTH_HEADERS,
+        json=[
+            {
+                "sender_name": f"Sender {i}",
+                "sender_email": f"sender{i}@example.com",
+                "unsub_method": "direct_link",
+            }
+            for i in range(7)
+        ],
+    )
+    date_str = (datetime.now() - timedelta(days=1)).isoformat()
+    params = {"date_from": date_str, "limit": 3}
+
+    seen = []
+    for _ in range(10):
+        data = test_client.get(API_URL, headers=AUTH_HEADERS, params=params).json()
+        seen.extend(item["id"] for item in data["items"])
+        if not data["next_cursor"]:
+            break
+        params["cursor"] = data["next_cursor"]
+    else:
+        pytest.fail("Cursor pagination did not reach the last page")
+
+    assert len(seen) == len(set(seen)) == 7
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_search_treats_wildcards_literally(test_client: TestClient, diverse_db):
+    response = test_client.get(API_URL, headers=AUTH_HEADERS, params={"search": "%"})
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
+
+    response = test_client.get(API_URL, headers=AUTH_HEADERS, params={"search": "_"})
+    assert response.json()["total"] == 0
+
+
+def test_read_paths_return_rows_not_orm_objects(db_session: Session, diverse_db):
+    """List, page and export reads skip the ORM identity map entirely."""
+    from app.crud import unsubscribed_email as crud
+
+    db_session.expunge_all()
+    items = crud.get_unsubscribed_emails(db_session, limit=10)
+    page = crud.get_unsubscribed_emails_page(db_session, limit=10, search="cool")
+    chunks = list(crud.iter_unsubscribed_email_chunks(db_session, chunk_size=2))
+
+    rows = items + page.items + [row for chunk in chunks for row in chunk]
+    assert len(rows) == 7
+    assert not any(isinstance(row, UnsubscribedEmail) for row in rows)
+    assert len(db_session.identity_map) == 0
+    assert page.items[0].sender_name == "Cool Gadgets"
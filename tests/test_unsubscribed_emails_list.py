@@ -101,3 +101,114 @@ def test_list_limit_validation():
     # Test under min limit
     response = client.get(API_URL, headers=AUTH_HEADERS, params={"limit": 0})
     assert response.status_code == 422
+
+
+def test_list_cursor_pagination_walks_all_records(populate_db):
+    seen = []
+    params = {"limit": 10}
+    while True:
+        response = client.get(API_URL, headers=AUTH_HEADERS, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(item["sender_name"] for item in data["items"])
+        if not data["next_cursor"]:
+            break
+        params = {"limit": 10, "cursor": data["next_cursor"]}
+
+    assert len(seen) == 25
+    assert seen[0] == "Test Sender 24"
+    assert seen[-1] == "Test Sender 0"
+
+
+def test_list_cursor_matches_offset_page(populate_db):
+    first = client.get(API_URL, headers=AUTH_HEADERS, params={"limit": 5}).json()
+    by_cursor = client.get(
+        API_URL,
+        headers=AUTH_HEADERS,
+        params={"limit": 5, "cursor": first["next_cursor"]},
+    ).json()
+    by_offset = client.get(
+        API_URL, headers=AUTH_HEADERS, params={"limit": 5, "offset": 5}
+    ).json()
+    assert by_cursor["items"] == by_offset["items"]
+
+
+def test_list_cursor_validation(populate_db):
+    response = client.get(
+        API_URL, headers=AUTH_HEADERS, params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 422
+
+    first = client.get(API_URL, headers=AUTH_HEADERS).json()
+    response = client.get(
+        API_URL,
+        headers=AUTH_HEADERS,
+        params={"cursor": first["next_cursor"], "offset": 10},
+    )
+    assert response.status_code == 422
+
+
+def test_list_total_modes(populate_db):
+    response = client.get(API_URL, headers=AUTH_HEADERS, params={"total": "none"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] is None
+    assert len(data["items"]) == 10
+
+    # Small tables (and non-PostgreSQL backends) fall back to an exact count
+    response = client.get(API_URL, headers=AUTH_HEADERS, params={"total": "estimate"})
+    data = response.json()
+    assert data["total"] == 25
+    assert data["total_estimated"] is False
+
+    response = client.get(API_URL, headers=AUTH_HEADERS, params={"total": "bogus"})
+    assert response.status_code == 422
+
+
+def test_list_total_past_last_page(populate_db):
+    response = client.get(API_URL, headers=AUTH_HEADERS, params={"offset": 100})
+    data = response.json()
+    assert data["items"] == []
+    assert data["total"] == 25
+
+
+def test_list_page_and_total_use_one_statement(populate_db, db_session):
+    from sqlalchemy import event
+
+    from app.crud.unsubscribed_email import get_unsubscribed_emails_page
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        page = get_unsubscribed_emails_page(db_session, limit=5, offset=5)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert page.total == 25
+    assert [item.sender_name for item in page.items][0] == "Test Sender 19"
+    assert len(statements) == 1
+    assert "OVER" in statements[0].upper()
+
+
+def test_list_serialization_matches_response_schema(populate_db):
+    """The fast serializer emits exactly what the response model would."""
+    from app.schemas.unsubscribed_email import (
+        UnsubscribedEmailList,
+        UnsubscribedEmailResponse,
+    )
+
+    response = client.get(API_URL, headers=AUTH_HEADERS, params={"limit": 5})
+    assert response.status_code == 200
+    data = response.json()
+
+    UnsubscribedEmailList.model_validate(data)
+    expected = [
+        UnsubscribedEmailResponse.model_validate(email).model_dump(mode="json")
+        for email in reversed(populate_db[-5:])
+    ]
+    assert data["items"] == expected
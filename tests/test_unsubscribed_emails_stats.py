@@ -0,0 +1,182 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.unsubscribed_email import delete_duplicate_unsubscribed_emails
+from app.crud.unsubscribed_email_stats import rebuild_unsubscribed_email_stats
+from app.models import UnsubscribedEmail, UnsubscribedEmailStat
+
+API_URL = "/api/v1/unsubscribed_emails"
+AUTH_HEADERS = {"Authorization": f"Bearer {settings.API_TOKEN}"}
+
+
+def _stat_rows(db: Session) -> list:
+    return db.execute(
+        select(
+            UnsubscribedEmailStat.kind,
+            UnsubscribedEmailStat.bucket,
+            UnsubscribedEmailStat.unsub_method,
+            UnsubscribedEmailStat.count,
+        ).order_by(UnsubscribedEmailStat.kind, UnsubscribedEmailStat.bucket)
+    ).all()
+
+
+def _payload(email: str, method: str = "direct_link") -> dict:
+    return {"sender_name": "Sender", "sender_email": email, "unsub_method": method}
+
+
+def test_creates_update_the_rollup(test_client: TestClient, db_session: Session):
+    test_client.post(f"{API_URL}/", headers=AUTH_HEADERS, json=_payload("a@x.com"))
+    # An existing sender is not counted again
+    test_client.post(f"{API_URL}/", headers=AUTH_HEADERS, json=_payload("A@x.com"))
+    test_client.post(
+        f"{API_URL}/bulk",
+        headers=AUTH_HEADERS,
+        json=[
+            _payload("b@X.com", "isp_level"),
+            _payload("c@y.org"),
+            _payload("c@y.org"),
+        ],
+    )
+
+    response = test_client.get(f"{API_URL}/stats", headers=AUTH_HEADERS)
+    assert response.status_code == 200
+    data = response.json()
+    today = datetime.now(timezone.utc).date().isoformat()
+    assert data["total"] == 3
+    assert data["by_method"] == [
+        {"unsub_method": "direct_link", "count": 2},
+        {"unsub_method": "isp_level", "count": 1},
+    ]
+    assert data["by_day"] == [{"day": today, "count": 3}]
+    assert data["by_domain"] == [
+        {"domain": "x.com", "count": 2},
+        {"domain": "y.org", "count": 1},
+    ]
+
+    response = test_client.get(
+        f"{API_URL}/stats",
+        headers=AUTH_HEADERS,
+        params={"unsub_method": "isp_level", "domains_limit": 1},
+    )
+    data = response.json()
+    assert data["total"] == 1
+    assert data["by_domain"] == [{"domain": "x.com", "count": 1}]
+
+
+def test_async_session_creates_update_the_rollup(
+    async_test_client: TestClient, db_session: Session
+):
+    async_test_client.post(
+        f"{API_URL}/", headers=AUTH_HEADERS, json=_payload("a@x.com")
+    )
+    async_test_client.post(
+        f"{API_URL}/bulk", headers=AUTH_HEADERS, json=[_payload("b@y.org")]
+    )
+
+    data = async_test_client.get(f"{API_URL}/stats", headers=AUTH_HEADERS).json()
+    assert data["total"] == 2
+    assert [row["domain"] for row in data["by_domain"]] == ["x.com", "y.org"]
+
+
+def test_rebuild_matches_incremental_rollup(
+    test_client: TestClient, db_session: Session
+):
+    for email in ["a@x.com", "b@x.com", "c@y.org"]:
+        test_client.post(f"{API_URL}/", headers=AUTH_HEADERS, json=_payload(email))
+    # Rows written around the CRUD layer are only counted by a rebuild
+    db_session.add(
+        UnsubscribedEmail(
+            sender_name="Imported",
+            sender_email="d@z.net",
+            unsub_method="isp_level",
+            inserted_at=datetime(2025, 6, 1, 12, tzinfo=timezone.utc),
+        )
+    )
+    db_session.commit()
+    incremental = _stat_rows(db_session)
+
+    assert rebuild_unsubscribed_email_stats(db_session, chunk_size=2) == 5
+    rebuilt = _stat_rows(db_session)
+    assert set(rebuilt) - set(incremental) == {
+        ("day", "2025-06-01", "isp_level", 1),
+        ("domain", "z.net", "isp_level", 1),
+    }
+    assert set(incremental) <= set(rebuilt)
+
+
+def test_dedupe_decrements_the_rollup(db_session: Session):
+    # Rows written before the unique index existed
+    db_session.execute(
+        text("DROP INDEX IF EXISTS ux_unsubscribed_emails_sender_email_lower")
+    )
+    for email, method, day in [
+        ("a@x.com", "direct_link", 1),
+        ("A@x.com", "direct_link", 1),
+        ("A@x.com", "isp_level", 2),
+    ]:
+        db_session.add(
+            UnsubscribedEmail(
+                sender_name="Sender",
+                sender_email=email,
+                unsub_method=method,
+                inserted_at=datetime(2026, 3, day, tzinfo=timezone.utc),
+            )
+        )
+    db_session.commit()
+    rebuild_unsubscribed_email_stats(db_session)
+
+    assert delete_duplicate_unsubscribed_emails(db_session, chunk_size=1) == 2
+    assert _stat_rows(db_session) == [
+        ("day", "2026-03-01", "direct_link", 1),
+        ("domain", "x.com", "direct_link", 1),
+    ]
+
+
+def test_top_domains(test_client: TestClient, db_session: Session):
+    test_client.post(
+        f"{API_URL}/bulk",
+        headers=AUTH_HEADERS,
+        json=[
+            _payload("a@x.com"),
+            _payload("b@x.com", "isp_level"),
+            _payload("c@y.org"),
+            _payload("d@z.net"),
+        ],
+    )
+    db_session.add(
+        UnsubscribedEmail(
+            sender_name="Old",
+            sender_email="old@z.net",
+            unsub_method="direct_link",
+            inserted_at=datetime(2025, 6, 1, tzinfo=timezone.utc),
+        )
+    )
+    db_session.commit()
+    rebuild_unsubscribed_email_stats(db_session)
+
+    response = test_client.get(
+        f"{API_URL}/domains/top", headers=AUTH_HEADERS, params={"limit": 2}
+    )
+    assert response.status_code == 200
+    assert response.json()["items"] == [
+        {"domain": "x.com", "count": 2},
+        {"domain": "z.net", "count": 2},
+    ]
+
+    # A date range groups the records themselves on sender_domain
+    params = {"date_from": "2025-01-01T00:00:00", "date_to": "2025-12-31T00:00:00"}
+    response = test_client.get(
+        f"{API_URL}/domains/top", headers=AUTH_HEADERS, params=params
+    )
+    assert response.json()["items"] == [{"domain": "z.net", "count": 1}]
+
+
+@pytest.mark.parametrize("params", [{"unsub_method": "bogus"}, {"domains_limit": 0}])
+def test_stats_rejects_bad_params(test_client: TestClient, params):
+    response = test_client.get(f"{API_URL}/stats", headers=AUTH_HEADERS, params=params)
+    assert response.status_code == 422
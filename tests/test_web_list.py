@@ -4,6 +4,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.crud import unsubscribed_email as crud
 from app.models import UnsubscribedEmail
 
 # Helper from previous step
@@ -61,3 +62,55 @@ def test_list_view_second_page(test_client: TestClient, populated_db_for_web):
     # Newest-first: Page 1 (IDs 49-30), Page 2 (IDs 29-10)
     assert "Sender 29" in table_rows[0].text
     assert "Page 2 of 3" in soup.text
+
+
+def test_list_view_is_cached_until_a_write(
+    test_client: TestClient, populated_db_for_web, mocker
+):
+    """Repeat views are served from the cache; a create invalidates it."""
+    spy = mocker.spy(crud, "async_get_unsubscribed_emails_page")
+
+    first = test_client.get(LIST_URL, headers=AUTH_HEADERS)
+    second = test_client.get(LIST_URL, headers=AUTH_HEADERS)
+    assert spy.call_count == 1
+    assert second.text == first.text
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+    response = test_client.post(
+        "/api/v1/unsubscribed_emails/",
+        json={
+            "sender_name": "New",
+            "sender_email": "new@e.com",
+            "unsub_method": "isp_level",
+        },
+        headers={"Authorization": f"Bearer {settings.API_TOKEN}"},
+    )
+    assert response.status_code == 201
+    third = test_client.get(LIST_URL, headers=AUTH_HEADERS)
+    assert spy.call_count == 2
+    assert "new@e.com" in third.text
+    assert third.headers["ETag"] != first.headers["ETag"]
+
+
+def test_list_view_conditional_get(test_client: TestClient, populated_db_for_web):
+    """A matching ETag or a fresh If-Modified-Since gets a 304."""
+    first = test_client.get(LIST_URL, headers=AUTH_HEADERS)
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    response = test_client.get(
+        LIST_URL, headers={**AUTH_HEADERS, "If-None-Match": first.headers["ETag"]}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == first.headers["ETag"]
+
+    response = test_client.get(
+        LIST_URL,
+        headers={**AUTH_HEADERS, "If-Modified-Since": first.headers["Last-Modified"]},
+    )
+    assert response.status_code == 304
+
+    response = test_client.get(
+        LIST_URL, headers={**AUTH_HEADERS, "If-None-Match": '"stale"'}
+    )
+    assert response.status_code == 200